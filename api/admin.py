@@ -1,6 +1,6 @@
 from django.contrib import admin
 from .models import CustomUser
-from .models import Teacher, Student, Exam, Question, Answer, ExamSubmission
+from .models import Teacher, Student, Exam, Question, Answer, ExamSubmission, ExamStats, QuestionStats, Job, PendingSubmission
 
 admin.site.register(CustomUser)
 admin.site.register(Teacher)
@@ -9,4 +9,7 @@ admin.site.register(Exam)
 admin.site.register(Question)
 admin.site.register(ExamSubmission)
 admin.site.register(Answer)
-
+admin.site.register(Job)
+admin.site.register(PendingSubmission)
+admin.site.register(ExamStats)
+admin.site.register(QuestionStats)
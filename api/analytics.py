@@ -0,0 +1,150 @@
+import math
+
+from django.db.models import Avg, Count, F, Q
+
+from .models import ExamSubmission, Question
+
+DEFAULT_PASS_FRACTION = 0.4
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def exam_analytics(exam, submissions=None, top=5, pass_mark=None):
+    """
+    Score statistics for ``exam`` over ``submissions`` (default: all of
+    them).  Everything is aggregated in the database – the score
+    histogram, a per‑class GROUP BY, per‑question correct counts and the
+    top / bottom performers – so the number of queries is fixed no matter
+    how many students sat the exam.  Mean, median, percentiles and the
+    pass rate are derived from the histogram, which has at most
+    ``questions + 1`` buckets.
+    """
+    if submissions is None:
+        submissions = ExamSubmission.objects.filter(exam=exam)
+
+    histogram = list(
+        submissions.order_by().values_list("score").annotate(n=Count("id")).order_by("score")
+    )
+    questions = list(_question_stats(exam, submissions))
+    max_score = len(questions)
+    if pass_mark is None:
+        pass_mark = math.ceil(max_score * DEFAULT_PASS_FRACTION)
+
+    count = sum(n for _, n in histogram)
+    summary = {
+        "submissions": count,
+        "max_score": max_score,
+        "pass_mark": pass_mark,
+        "mean": None,
+        "median": None,
+        "min": None,
+        "max": None,
+        "pass_rate": None,
+        "percentiles": {},
+    }
+    if count:
+        summary.update(
+            mean=round(sum(score * n for score, n in histogram) / count, 2),
+            median=_median(histogram, count),
+            min=histogram[0][0],
+            max=histogram[-1][0],
+            pass_rate=round(sum(n for s, n in histogram if s >= pass_mark) / count, 4),
+            percentiles={f"p{p}": _percentile(histogram, count, p) for p in PERCENTILES},
+        )
+
+    by_class = (
+        submissions.order_by()
+        .values("student__student_class")
+        .annotate(submissions=Count("id"), mean=Avg("score"))
+        .order_by("student__student_class")
+    )
+
+    return {
+        "exam": exam.id,
+        "title": exam.title,
+        "summary": summary,
+        "histogram": [{"score": score, "count": n} for score, n in histogram],
+        "classes": [
+            {
+                "student_class": row["student__student_class"],
+                "submissions": row["submissions"],
+                "mean": round(row["mean"], 2),
+            }
+            for row in by_class
+        ],
+        "questions": [
+            {
+                "question": q["id"],
+                "text": q["text"],
+                "attempts": q["attempts"],
+                "correct": q["correct"],
+                "fraction_correct": round(q["correct"] / q["attempts"], 4) if q["attempts"] else None,
+            }
+            for q in questions
+        ],
+        "top": _performers(submissions, "-score", top),
+        "bottom": _performers(submissions, "score", top),
+    }
+
+
+def _question_stats(exam, submissions):
+    answered = Q(answer__submission__in=submissions.values("id"))
+    return (
+        Question.objects.filter(exam=exam)
+        .values("id", "text")
+        .annotate(
+            attempts=Count("answer", filter=answered),
+            correct=Count(
+                "answer",
+                filter=answered & Q(answer__selected_option=F("correct_option")),
+            ),
+        )
+        .order_by("id")
+    )
+
+
+def _performers(submissions, order, limit):
+    rows = (
+        submissions.order_by(order, "submitted_at", "id")
+        .values(
+            "student_id",
+            "student__roll_number",
+            "student__student_class",
+            "student__user__first_name",
+            "student__user__last_name",
+            "score",
+        )[:limit]
+    )
+    return [
+        {
+            "student": row["student_id"],
+            "name": f'{row["student__user__first_name"]} {row["student__user__last_name"]}'.strip(),
+            "roll_number": row["student__roll_number"],
+            "student_class": row["student__student_class"],
+            "score": row["score"],
+        }
+        for row in rows
+    ]
+
+
+# -----------------------------------------------------------------------------------
+#  Order statistics from a (score, count) histogram sorted by score
+# -----------------------------------------------------------------------------------
+def _nth(histogram, rank):
+    """Score of the ``rank``‑th (1‑based) submission in score order."""
+    seen = 0
+    for score, n in histogram:
+        seen += n
+        if seen >= rank:
+            return score
+    return histogram[-1][0]
+
+
+def _median(histogram, count):
+    lower = _nth(histogram, (count + 1) // 2)
+    upper = _nth(histogram, count // 2 + 1)
+    return (lower + upper) / 2
+
+
+def _percentile(histogram, count, p):
+    # nearest‑rank
+    return _nth(histogram, max(1, math.ceil(p / 100 * count)))
@@ -0,0 +1,255 @@
+"""
+Async‑native read endpoints, served under ``/api/async/``.
+
+Same data, permissions and JSON as their DRF counterparts (the exam
+listing's ``next`` / ``previous`` cursors are its own), but written
+against Django's async ORM so an ASGI worker (``uvicorn
+school_project.asgi:application``) keeps serving other requests while
+one waits on the database.  Rows are read with ``values()`` and
+``aiterator()`` straight into plain dicts – no serializers, no model
+instances.
+
+    GET /api/async/exams                        ExamViewSet.list
+    GET /api/async/exams/<pk>/questions         ExamViewSet.questions
+    GET /api/async/students/my_marks            StudentViewSet.my_marks
+    GET /api/async/teachers/student-results     TeacherViewSet.student_results
+"""
+import base64
+from functools import wraps
+
+from django.conf import settings
+from django.db.models import Q
+from django.http import Http404, HttpResponse
+from django.utils.dateparse import parse_datetime
+from django.views.decorators.http import require_GET
+from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed, PermissionDenied
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from .caching import acached, question_paper_key
+from .lean import SUBMISSION_FIELDS, FastJSONRenderer
+from .models import CustomUser, Exam, ExamSubmission, Question, Student, Teacher
+from .pagination import ExamKeysetPagination
+from .serializers import ExamMetaSerializer, QuestionPublicSerializer
+
+EXAM_FIELDS     = ExamMetaSerializer.Meta.fields
+QUESTION_FIELDS = QuestionPublicSerializer.Meta.fields
+
+_datetime = serializers.DateTimeField()
+
+
+def _json(data, status=200):
+    return HttpResponse(FastJSONRenderer().render(data), status=status, content_type="application/json")
+
+
+# -----------------------------------------------------------------------------------
+#  Authentication
+# -----------------------------------------------------------------------------------
+async def authenticate(request):
+    """
+    The user behind the request's ``Authorization: Bearer`` access token,
+    or ``None`` when there is none.  The signature check is pure CPU; the
+    user (with its teacher / student profile) is one async query, which
+    also settles the token‑version check of api/authentication.py.
+    """
+    jwt = JWTAuthentication()
+    header = jwt.get_header(request)
+    raw = jwt.get_raw_token(header) if header else None
+    if raw is None:
+        return None
+    token = jwt.get_validated_token(raw)
+    try:
+        user = await CustomUser.objects.select_related("teacher", "student").aget(
+            **{jwt_settings.USER_ID_FIELD: token[jwt_settings.USER_ID_CLAIM]}
+        )
+    except (KeyError, CustomUser.DoesNotExist):
+        raise AuthenticationFailed("User not found", code="user_not_found")
+    if not user.is_active:
+        raise AuthenticationFailed("User is inactive", code="user_inactive")
+    if token.get("token_version", user.token_version) != user.token_version:
+        raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+    return user
+
+
+def profile(user):
+    """The Teacher / Student ``authenticate`` loaded with ``user``, or ``None``."""
+    try:
+        return getattr(user, user.role) if user.role in ("teacher", "student") else None
+    except (Teacher.DoesNotExist, Student.DoesNotExist):
+        return None
+
+
+def async_endpoint(*roles):
+    """
+    Wrap an async view with JWT authentication, a role check and DRF‑style
+    JSON errors.  The view receives ``request.user`` already loaded.
+    """
+    def decorate(view):
+        @require_GET
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            try:
+                user = await authenticate(request)
+                if user is None:
+                    return _json({"detail": "Authentication credentials were not provided."}, 401)
+                if roles and user.role not in roles:
+                    raise PermissionDenied()
+                request.user = user
+                return await view(request, *args, **kwargs)
+            except AuthenticationFailed as exc:
+                detail = exc.detail if isinstance(exc.detail, dict) else {"detail": exc.detail}
+                return _json(detail, 401)
+            except PermissionDenied as exc:
+                return _json({"detail": exc.detail}, 403)
+            except Http404:
+                return _json({"detail": "Not found."}, 404)
+        return wrapper
+    return decorate
+
+
+# -----------------------------------------------------------------------------------
+#  Exams
+# -----------------------------------------------------------------------------------
+async def visible_exams(user):
+    """Async twin of ``ExamViewSet.get_queryset``."""
+    if user.role == "admin":
+        return Exam.objects.all()
+    if user.role == "teacher":
+        teacher = profile(user)
+        if teacher is None:
+            return Exam.objects.none()
+        standards = (await teacher.aclasses_taught())["standards"]
+        return Exam.objects.filter(
+            Q(scope="class", assigned_teacher=teacher)
+            | Q(scope="school", target_standard__in=standards)
+        )
+    if user.role == "student":
+        return Exam.objects.filter(eligibility__student__user=user)
+    return Exam.objects.none()
+
+
+def _encode_cursor(row, reverse=False):
+    value = f"{'p' if reverse else 'n'}|{row['start_time'].isoformat()}|{row['id']}"
+    return base64.urlsafe_b64encode(value.encode()).decode()
+
+
+def _decode_cursor(cursor):
+    """``(reverse, start_time, id)``, or ``None`` for a malformed cursor."""
+    try:
+        direction, start_time, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        start_time = parse_datetime(start_time)
+    except (ValueError, TypeError):
+        return None
+    if direction not in ("n", "p") or start_time is None or not pk.isdigit():
+        return None
+    return direction == "p", start_time, int(pk)
+
+
+@async_endpoint()
+async def exam_list(request):
+    """
+    Exams the user may see, keyset‑paginated on ``(start_time, id)`` like
+    the sync listing (``?page_size=``, ``?count=false``); ``next`` and
+    ``previous`` carry an opaque ``?cursor=``.
+    """
+    paginator = ExamKeysetPagination
+    exams = await visible_exams(request.user)
+
+    count = None
+    if request.GET.get(paginator.count_query_param, "true").lower() not in ("0", "false", "no"):
+        count = await exams.acount()
+
+    cursor = request.GET.get("cursor")
+    reverse = False
+    if cursor:
+        position = _decode_cursor(cursor)
+        if position is None:
+            return _json({"detail": "Invalid cursor"}, 404)
+        reverse, start_time, pk = position
+        if reverse:
+            exams = exams.filter(Q(start_time__lt=start_time) | Q(start_time=start_time, id__lt=pk))
+        else:
+            exams = exams.filter(Q(start_time__gt=start_time) | Q(start_time=start_time, id__gt=pk))
+
+    try:
+        size = int(request.GET.get(paginator.page_size_query_param, paginator.page_size))
+        size = min(max(size, 1), paginator.max_page_size)
+    except ValueError:
+        size = paginator.page_size
+
+    ordering = [f"-{f}" for f in paginator.ordering] if reverse else paginator.ordering
+    rows = [row async for row in exams.order_by(*ordering).values(*EXAM_FIELDS)[: size + 1]]
+    has_more = len(rows) > size
+    rows = rows[:size]
+    if reverse:
+        rows.reverse()
+
+    def link(row, backwards):
+        query = request.GET.copy()
+        query["cursor"] = _encode_cursor(row, backwards)
+        return request.build_absolute_uri(f"{request.path}?{query.urlencode()}")
+
+    # like CursorPagination: a page reached through a cursor has a neighbour
+    # on the side it came from
+    next_link = link(rows[-1], False) if rows and (reverse or has_more) else None
+    previous_link = link(rows[0], True) if rows and (has_more if reverse else cursor) else None
+    for row in rows:
+        row["start_time"] = _datetime.to_representation(row["start_time"])
+
+    body = {} if count is None else {"count": count}
+    body.update(next=next_link, previous=previous_link, results=rows)
+    return _json(body)
+
+
+@async_endpoint()
+async def exam_questions(request, pk):
+    """The cached question paper – shares its cache entry with the sync view."""
+    exams = await visible_exams(request.user)
+    try:
+        exam = await exams.aget(pk=pk)
+    except Exam.DoesNotExist:
+        raise Http404
+    if request.user.role == "student":
+        student = profile(request.user)
+        if student is None or not exam.is_eligible(student):
+            raise PermissionDenied("You are not allowed to view these questions.")
+
+    async def render_paper():
+        rows = Question.objects.filter(exam=exam).order_by("id").values(*QUESTION_FIELDS)
+        return JSONRenderer().render([row async for row in rows.aiterator()])
+
+    payload = await acached(
+        question_paper_key(exam), render_paper, timeout=settings.QUESTION_PAPER_CACHE_TIMEOUT
+    )
+    return HttpResponse(payload, content_type="application/json")
+
+
+# -----------------------------------------------------------------------------------
+#  Results
+# -----------------------------------------------------------------------------------
+async def _results(submissions):
+    rows = submissions.values(*SUBMISSION_FIELDS)
+    return [row async for row in rows.aiterator(chunk_size=2000)]
+
+
+@async_endpoint("student")
+async def my_marks(request):
+    student = profile(request.user)
+    if student is None:
+        return _json({"detail": "Student profile not found."}, 404)
+    return _json(await _results(
+        ExamSubmission.objects.filter(student=student).order_by("exam_id")
+    ))
+
+
+@async_endpoint("teacher")
+async def student_results(request):
+    teacher = profile(request.user)
+    if teacher is None:
+        return _json({"detail": "Teacher profile not found."}, 404)
+    return _json(await _results(
+        ExamSubmission.objects.filter(student__assigned_teacher=teacher)
+        .order_by("exam_id", "student_id")
+    ))
@@ -0,0 +1,127 @@
+"""
+JWT authentication without a per‑request user lookup.
+
+Tokens issued by ``POST /api/token`` carry the user's ``role``, the id of
+their Teacher / Student row (``profile_id``) and their ``token_version``.
+``ClaimsJWTAuthentication`` turns those claims into an unsaved
+``CustomUser`` – enough for ``api/permissions.py`` and the role‑scoped
+querysets – and only checks the version, which is cached.  Changing a
+user's password, role or active flag bumps the version and so revokes
+every token issued before; so does ``CustomUser.revoke_tokens()``.
+
+Tokens without the claims (issued before they existed) still work and
+fall back to loading the user – with their profile – from the database.
+"""
+from django.conf import settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .caching import cached, token_version_key
+from .models import CustomUser
+
+CLAIMS = ("role", "profile_id", "token_version")
+
+
+def token_claims(user):
+    return {
+        "role": user.role,
+        "profile_id": user.profile_id,
+        "token_version": user.token_version,
+    }
+
+
+def current_token_version(user_id):
+    """The user's token version, or ‑1 if they are gone or inactive."""
+    def build():
+        version = (
+            CustomUser.objects.filter(pk=user_id, is_active=True)
+            .values_list("token_version", flat=True).first()
+        )
+        return -1 if version is None else version
+    return cached(token_version_key(user_id), build, timeout=settings.TOKEN_VERSION_CACHE_TIMEOUT)
+
+
+def check_token_version(token):
+    """Reject ``token`` if it was issued before its user's last revocation."""
+    if "token_version" not in token:
+        return
+    if current_token_version(token[api_settings.USER_ID_CLAIM]) != token["token_version"]:
+        raise InvalidToken("Token has been revoked")
+
+
+# -----------------------------------------------------------------------------------
+#  Issuing
+# -----------------------------------------------------------------------------------
+class ClaimsRefreshToken(RefreshToken):
+    """Refresh token whose access tokens inherit the profile claims."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim, value in token_claims(user).items():
+            token[claim] = value
+        return token
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = ClaimsRefreshToken
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+
+    def validate(self, attrs):
+        check_token_version(self.token_class(attrs["refresh"]))
+        return super().validate(attrs)
+
+
+# -----------------------------------------------------------------------------------
+#  Authenticating
+# -----------------------------------------------------------------------------------
+class ClaimsJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        if any(claim not in validated_token for claim in CLAIMS):
+            return self.load_user(validated_token)
+        check_token_version(validated_token)
+        return claims_user(validated_token)
+
+    def load_user(self, validated_token):
+        """
+        Fallback for tokens without claims: the user and their teacher /
+        student profile in one query (api/profiles.py picks the profile up).
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+        user = (
+            CustomUser.objects.select_related("teacher", "student")
+            .filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        )
+        if user is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
+
+
+def claims_user(token):
+    """
+    Read‑only ``CustomUser`` built from ``token`` – id, role, active flag
+    and ``profile_id`` are set, every other field is blank.
+    """
+    user = CustomUser(
+        pk=token[api_settings.USER_ID_CLAIM],
+        role=token["role"],
+        token_version=token["token_version"],
+        is_active=True,
+    )
+    user._state.adding = False
+    user._state.db = "default"
+    user.from_token = True
+    user.__dict__["profile_id"] = token["profile_id"]
+    return user
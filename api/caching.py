@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.cache import caches
+
+
+def api_cache():
+    return caches[getattr(settings, "API_CACHE_ALIAS", "default")]
+
+
+def cached(key, build, timeout=None):
+    """
+    Return the value stored under ``key``, calling ``build()`` and storing
+    its result on a miss.  Callers keep values to plain bytes / dicts so
+    any backend (locmem, file, Redis) can hold them.
+    """
+    cache = api_cache()
+    payload = cache.get(key)
+    if payload is None:
+        payload = build()
+        cache.set(key, payload, timeout)
+    return payload
+
+
+async def acached(key, build, timeout=None):
+    """``cached()`` for async callers; ``build`` is a coroutine function."""
+    cache = api_cache()
+    payload = await cache.aget(key)
+    if payload is None:
+        payload = await build()
+        await cache.aset(key, payload, timeout)
+    return payload
+
+
+# -----------------------------------------------------------------------------------
+#  Keys – versioned, so a bump in the DB invalidates every process at once
+# -----------------------------------------------------------------------------------
+def question_paper_key(exam):
+    return f"exam:{exam.pk}:paper:v{exam.content_version}"
+
+
+def answer_key_key(exam):
+    return f"exam:{exam.pk}:answers:v{exam.content_version}"
+
+
+def item_analysis_key(exam, scope, submissions_stamp):
+    return f"exam:{exam.pk}:items:{scope}:v{exam.content_version}:{submissions_stamp}"
+
+
+def teacher_classes_key(teacher):
+    return f"teacher:{teacher.pk}:classes:v{teacher.classes_version}"
+
+
+def token_version_key(user_id):
+    # not versioned – it *is* the version; deleted when the version is bumped
+    return f"user:{user_id}:token_version"
@@ -0,0 +1,68 @@
+import csv
+from itertools import chain
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+STUDENT_HEADER = ["Username", "Email", "Phone", "Assigned Teacher", "Status"]
+TEACHER_HEADER = ["Username", "Email", "Phone", "Subject", "Employee ID", "Status"]
+
+
+def export_chunk_size():
+    return getattr(settings, "CSV_EXPORT_CHUNK_SIZE", 2000)
+
+
+class Echo:
+    """
+    Pseudo‑buffer for csv.writer – returns each written line instead of
+    storing it, so rows can be yielded one by one.
+    """
+
+    def write(self, value):
+        return value
+
+
+# -----------------------------------------------------------------------------------
+#  Row sources – flat tuples straight from the DB, joined up front
+# -----------------------------------------------------------------------------------
+def student_rows(queryset, chunk_size=None):
+    return (
+        queryset.order_by("id")
+        .values_list(
+            "user__username",
+            "user__email",
+            "phone",
+            "assigned_teacher__user__username",
+            "status",
+        )
+        .iterator(chunk_size=chunk_size or export_chunk_size())
+    )
+
+
+def teacher_rows(queryset, chunk_size=None):
+    return (
+        queryset.order_by("id")
+        .values_list(
+            "user__username",
+            "user__email",
+            "phone",
+            "subject_specialization",
+            "employee_id",
+            "status",
+        )
+        .iterator(chunk_size=chunk_size or export_chunk_size())
+    )
+
+
+# -----------------------------------------------------------------------------------
+#  Writers
+# -----------------------------------------------------------------------------------
+def csv_lines(header, rows):
+    writer = csv.writer(Echo())
+    return chain([writer.writerow(header)], (writer.writerow(row) for row in rows))
+
+
+def streaming_csv_response(filename, header, rows):
+    response = StreamingHttpResponse(csv_lines(header, rows), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,246 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, connection, transaction
+
+from .models import CustomUser, ExamEligibility, Student, Teacher, split_student_class
+from .provisioning import hash_passwords
+from .serializers import StudentSerializer, TeacherSerializer
+
+
+def import_batch_size():
+    return getattr(settings, "CSV_IMPORT_BATCH_SIZE", 1000)
+
+
+def flatten_nested(item, fk_fields=()):
+    """
+    Turn a nested ``{"user": {...}, ...}`` serializer payload into the flat
+    row shape used by the CSV files.
+    """
+    row = dict(item.get("user") or {})
+    for key, value in item.items():
+        if key == "user":
+            continue
+        row[f"{key}_id" if key in fk_fields else key] = value
+    return row
+
+
+class ProfileImporter:
+    """
+    Set‑based user + profile import.
+
+    Rows are processed in batches: each batch resolves existing usernames,
+    the profile's unique key and any foreign keys with one query apiece,
+    validates every row in memory, hashes passwords in parallel and then
+    writes users + profiles with two ``bulk_create`` calls inside one
+    transaction.
+    ``run`` returns ``(created, errors)`` exactly like the old per‑row import.
+    """
+
+    role = None
+    model = None
+    serializer_class = None
+    unique_field = None
+    unique_message = None
+    user_fields = ["username", "email", "first_name", "last_name", "password"]
+    profile_fields = []
+    defaults = {}
+
+    def __init__(self, batch_size=None, progress=None, workers=None):
+        self.batch_size = batch_size or import_batch_size()
+        self.progress = progress
+        self.workers = workers
+        self.seen_usernames = set()
+        self.seen_unique = set()
+
+    # --------------------------------------------------
+    # Public entry point
+    # --------------------------------------------------
+    def run(self, rows):
+        created, errors = [], []
+        batch = []
+        for row_no, row in enumerate(rows, start=1):
+            batch.append((row_no, row))
+            if len(batch) >= self.batch_size:
+                self._run_batch(batch, created, errors)
+                batch = []
+        if batch:
+            self._run_batch(batch, created, errors)
+        return created, errors
+
+    # --------------------------------------------------
+    # Batch pipeline
+    # --------------------------------------------------
+    def _run_batch(self, batch, created, errors):
+        self._write_batch(batch, created, errors)
+        if self.progress:
+            self.progress(batch[-1][0])
+
+    def _write_batch(self, batch, created, errors):
+        lookups = self.load_lookups([row for _, row in batch])
+        valid = []
+        for row_no, row in batch:
+            cleaned, row_errors = self._clean_row(row, lookups)
+            if row_errors:
+                errors.append(f"Row {row_no}: {row_errors}")
+            else:
+                valid.append((row_no, cleaned))
+        if not valid:
+            return
+
+        # hash before the transaction opens – no locks held through PBKDF2
+        hashes = hash_passwords([cleaned["user"]["password"] for _, cleaned in valid], workers=self.workers)
+        for (_, cleaned), pwd_hash in zip(valid, hashes):
+            cleaned["user"]["password"] = pwd_hash
+
+        try:
+            with transaction.atomic():
+                profiles = self._write(valid)
+        except DatabaseError as exc:
+            errors.extend(f"Row {row_no}: {exc}" for row_no, _ in valid)
+            return
+
+        created.extend(self.serializer_class(profiles, many=True).data)
+
+    def load_lookups(self, rows):
+        usernames = {_text(row.get("username")) for row in rows}
+        keys = {_text(row.get(self.unique_field)) for row in rows}
+        return {
+            "usernames": set(
+                CustomUser.objects.filter(username__in=usernames)
+                .values_list("username", flat=True)
+            ),
+            "unique": set(
+                self.model.objects.filter(**{f"{self.unique_field}__in": keys})
+                .values_list(self.unique_field, flat=True)
+            ),
+        }
+
+    def clean_extra(self, row, lookups, cleaned, row_errors):
+        pass
+
+    def after_write(self, profiles):
+        pass
+
+    def _clean_row(self, row, lookups):
+        row_errors = {}
+        cleaned = {"user": {}}
+
+        for model, names, target in (
+            (CustomUser, self.user_fields, cleaned["user"]),
+            (self.model, self.profile_fields, cleaned),
+        ):
+            for name in names:
+                raw = row.get(name)
+                if raw is None:
+                    raw = self.defaults.get(name)
+                if raw is None:
+                    row_errors[name] = ["This field is required."]
+                    continue
+                try:
+                    target[name] = model._meta.get_field(name).clean(_text(raw), None)
+                except ValidationError as exc:
+                    row_errors[name] = exc.messages
+
+        username = cleaned["user"].get("username")
+        if username in lookups["usernames"] or username in self.seen_usernames:
+            row_errors["username"] = ["A user with that username already exists."]
+
+        key = cleaned.get(self.unique_field)
+        if key in lookups["unique"] or key in self.seen_unique:
+            row_errors[self.unique_field] = [self.unique_message]
+
+        self.clean_extra(row, lookups, cleaned, row_errors)
+
+        if row_errors:
+            return None, row_errors
+
+        self.seen_usernames.add(username)
+        self.seen_unique.add(key)
+        return cleaned, None
+
+    def _write(self, valid):
+        users = CustomUser.objects.bulk_provision(
+            [cleaned["user"] for _, cleaned in valid],
+            role=self.role,
+            batch_size=self.batch_size,
+            hashed=True,
+        )
+
+        profiles = []
+        for user, (_, cleaned) in zip(users, valid):
+            fields = {k: v for k, v in cleaned.items() if k != "user"}
+            profiles.append(self.model(user=user, **fields))
+        self.model.objects.bulk_create(profiles, batch_size=self.batch_size)
+
+        if not connection.features.can_return_rows_from_bulk_insert:
+            keys = [getattr(p, self.unique_field) for p in profiles]
+            ids = dict(
+                self.model.objects.filter(**{f"{self.unique_field}__in": keys})
+                .values_list(self.unique_field, "id")
+            )
+            for profile in profiles:
+                profile.pk = ids[getattr(profile, self.unique_field)]
+
+        self.after_write(profiles)
+        return profiles
+
+
+class StudentImporter(ProfileImporter):
+    role = "student"
+    model = Student
+    serializer_class = StudentSerializer
+    unique_field = "roll_number"
+    unique_message = "student with this roll number already exists."
+    profile_fields = [
+        "phone", "roll_number", "student_class",
+        "date_of_birth", "admission_date", "status",
+    ]
+    defaults = {"status": "active"}
+
+    def load_lookups(self, rows):
+        lookups = super().load_lookups(rows)
+        teacher_ids = {
+            int(_text(row.get("assigned_teacher_id")))
+            for row in rows
+            if _text(row.get("assigned_teacher_id")).isdigit()
+        }
+        lookups["teachers"] = set(
+            Teacher.objects.filter(id__in=teacher_ids).values_list("id", flat=True)
+        )
+        return lookups
+
+    def clean_extra(self, row, lookups, cleaned, row_errors):
+        # bulk_create skips Student.save, so derive the indexed columns here
+        cleaned["standard"], cleaned["section"] = split_student_class(
+            cleaned.get("student_class")
+        )
+        teacher_id = _text(row.get("assigned_teacher_id"))
+        cleaned["assigned_teacher_id"] = None
+        if not teacher_id:
+            return
+        if not teacher_id.isdigit() or int(teacher_id) not in lookups["teachers"]:
+            row_errors["assigned_teacher"] = [
+                f'Invalid pk "{teacher_id}" - object does not exist.'
+            ]
+        else:
+            cleaned["assigned_teacher_id"] = int(teacher_id)
+
+    def after_write(self, students):
+        ExamEligibility.refresh_for_students(students)
+        Teacher.bump_classes_version(s.assigned_teacher_id for s in students)
+
+
+class TeacherImporter(ProfileImporter):
+    role = "teacher"
+    model = Teacher
+    serializer_class = TeacherSerializer
+    unique_field = "employee_id"
+    unique_message = "teacher with this employee id already exists."
+    profile_fields = [
+        "phone", "subject_specialization", "employee_id",
+        "date_of_joining", "status",
+    ]
+
+
+def _text(value):
+    return "" if value is None else str(value).strip()
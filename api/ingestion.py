@@ -0,0 +1,108 @@
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from .models import Answer, Exam, ExamStats, ExamSubmission, PendingSubmission
+from .scoring import answer_key, check_answers, score_answers
+
+
+def flush_batch_size():
+    return getattr(settings, "SUBMISSION_FLUSH_BATCH_SIZE", 500)
+
+
+def flush_pending(batch_size=None):
+    """
+    Score and persist up to ``batch_size`` queued submissions in a single
+    transaction.  Returns the number of pending rows processed.
+    """
+    with transaction.atomic():
+        queued = PendingSubmission.objects.filter(status="queued").order_by("id")
+        if connection.features.has_select_for_update_skip_locked:
+            queued = queued.select_for_update(skip_locked=True)
+        pending = list(queued[: batch_size or flush_batch_size()])
+        if not pending:
+            return 0
+
+        exams = Exam.objects.in_bulk({p.exam_id for p in pending})
+        keys = {exam_id: answer_key(exam) for exam_id, exam in exams.items()}
+        taken = set(
+            ExamSubmission.objects.filter(
+                exam_id__in=exams, student_id__in={p.student_id for p in pending}
+            ).values_list("exam_id", "student_id")
+        )
+
+        accepted = []
+        now = timezone.now()
+        for item in pending:
+            item.processed_at = now
+            key = keys[item.exam_id]
+            problems = check_answers(key, item.answers)
+            if (item.exam_id, item.student_id) in taken:
+                problems = ["You have already submitted this exam."]
+            if problems:
+                item.status, item.error = "rejected", " ".join(problems)
+                continue
+            taken.add((item.exam_id, item.student_id))
+            item.status = "accepted"
+            item.submission = ExamSubmission(
+                exam_id=item.exam_id,
+                student_id=item.student_id,
+                score=score_answers(key, item.answers),
+            )
+            accepted.append(item)
+
+        _insert_submissions(accepted)
+        PendingSubmission.objects.bulk_update(
+            pending, ["status", "error", "submission", "processed_at"]
+        )
+    return len(pending)
+
+
+def _insert_submissions(accepted):
+    if not accepted:
+        return
+    submissions = [item.submission for item in accepted]
+    try:
+        with transaction.atomic():
+            ExamSubmission.objects.bulk_create(submissions)
+    except IntegrityError:
+        # lost a race with the synchronous endpoint – fall back to one by one
+        for item in list(accepted):
+            try:
+                with transaction.atomic():
+                    item.submission.save()
+            except IntegrityError:
+                item.status, item.submission = "rejected", None
+                item.error = "You have already submitted this exam."
+                accepted.remove(item)
+        submissions = [item.submission for item in accepted]
+
+    if not connection.features.can_return_rows_from_bulk_insert:
+        ids = {
+            (exam_id, student_id): pk
+            for pk, exam_id, student_id in ExamSubmission.objects.filter(
+                exam_id__in={s.exam_id for s in submissions},
+                student_id__in={s.student_id for s in submissions},
+            ).values_list("id", "exam_id", "student_id")
+        }
+        for sub in submissions:
+            sub.pk = ids[(sub.exam_id, sub.student_id)]
+
+    # submitted_at is auto_now_add – stamp it with when the student actually sent it
+    for item in accepted:
+        item.submission.submitted_at = item.received_at
+    ExamSubmission.objects.bulk_update(submissions, ["submitted_at"])
+
+    Answer.objects.bulk_create(
+        Answer(
+            submission=item.submission,
+            question_id=answer["question"],
+            selected_option=answer["selected_option"],
+        )
+        for item in accepted
+        for answer in item.answers
+    )
+    ExamStats.record(
+        (item.submission, [(a["question"], a["selected_option"]) for a in item.answers])
+        for item in accepted
+    )
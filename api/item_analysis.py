@@ -0,0 +1,163 @@
+import hashlib
+
+import numpy as np
+from django.conf import settings
+from django.db import connection
+
+from .caching import cached, item_analysis_key
+from .models import Answer, ExamSubmission
+
+GROUP_FRACTION = 0.27      # upper / lower groups for the discrimination index
+OPTIONS = np.arange(5, dtype=np.int8)   # 0 = omitted, 1‑4 = the four options
+
+
+# -----------------------------------------------------------------------------------
+#  Loading
+# -----------------------------------------------------------------------------------
+def load_selections(exam, submissions=None, submission_ids=None):
+    """
+    Return ``(question_ids, key, selections)`` for ``exam``:
+    ``selections`` is a students × questions ``int8`` matrix of chosen
+    options (0 where a question was left out), ``key`` the correct option
+    per column.  Answers are read with one raw cursor pass straight into
+    an ``int64`` array – no model instances.  Pass the sorted
+    ``submission_ids`` when they are already known; answers of any other
+    submission are then ignored.
+    """
+    if submissions is None:
+        submissions = ExamSubmission.objects.filter(exam=exam)
+    questions = np.array(
+        list(exam.questions.order_by("id").values_list("id", "correct_option")),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    if submission_ids is None:
+        submission_ids = np.fromiter(
+            submissions.order_by("id").values_list("id", flat=True), dtype=np.int64
+        )
+    selections = np.zeros((len(submission_ids), len(questions)), dtype=np.int8)
+    if not len(submission_ids) or not len(questions):
+        return questions[:, 0], questions[:, 1].astype(np.int8), selections
+
+    answers = Answer.objects.filter(submission__in=submissions.values("id")).values_list(
+        "submission_id", "question_id", "selected_option"
+    )
+    sql, params = answers.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = np.array(cursor.fetchall(), dtype=np.int64).reshape(-1, 3)
+
+    rows = rows[np.isin(rows[:, 1], questions[:, 0]) & np.isin(rows[:, 0], submission_ids)]
+    r = np.searchsorted(submission_ids, rows[:, 0])
+    c = np.searchsorted(questions[:, 0], rows[:, 1])
+    option = rows[:, 2]
+    option[(option < 1) | (option > 4)] = 0
+    selections[r, c] = option
+    return questions[:, 0], questions[:, 1].astype(np.int8), selections
+
+
+# -----------------------------------------------------------------------------------
+#  Metrics
+# -----------------------------------------------------------------------------------
+def analyse(selections, key, question_ids=None):
+    """
+    Classical item analysis of a students × questions selection matrix.
+
+    Per question: difficulty (p), discrimination index (upper minus lower
+    27 %), point‑biserial against the total score and against the rest
+    score, and per option (0 = omitted) the share choosing it overall, in
+    the upper and lower groups and the mean total score of its choosers.
+    For the test: KR‑20 reliability.  All of it is array arithmetic.
+    """
+    students, items = selections.shape
+    if question_ids is None:
+        question_ids = np.arange(items)
+    correct = selections == key[None, :]
+    total = correct.sum(axis=1, dtype=np.int64)
+
+    p = correct.mean(axis=0) if students else np.full(items, np.nan)
+    item_var = p * (1 - p)
+    total_var = total.var() if students else np.nan
+
+    # point‑biserial: Pearson r between each 0/1 column and the total score
+    centred = total - total.mean() if students else total.astype(float)
+    cov = (correct.T.astype(np.float64) @ centred) / max(students, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_total = cov / np.sqrt(item_var * total_var)
+        # same against the rest score (total minus this item)
+        rest_var = total_var + item_var - 2 * cov
+        r_rest = (cov - item_var) / np.sqrt(item_var * rest_var)
+        kr20 = (items / (items - 1)) * (1 - item_var.sum() / total_var) if items > 1 else np.nan
+
+    group = max(1, int(round(students * GROUP_FRACTION))) if students else 0
+    order = np.argsort(total, kind="stable")
+    lower, upper = order[:group], order[students - group:]
+
+    onehot = selections[:, :, None] == OPTIONS[None, None, :]          # S × Q × 5
+    chosen = onehot.sum(axis=0)                                          # Q × 5
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = chosen / students
+        chooser_mean = np.tensordot(total, onehot, axes=(0, 0)) / chosen
+    if group:
+        upper_share = onehot[upper].mean(axis=0)
+        lower_share = onehot[lower].mean(axis=0)
+        discrimination = correct[upper].mean(axis=0) - correct[lower].mean(axis=0)
+    else:
+        upper_share = lower_share = np.full(chosen.shape, np.nan)
+        discrimination = np.full(items, np.nan)
+
+    return {
+        "students": students,
+        "questions": items,
+        "mean": _num(total.mean()) if students else None,
+        "variance": _num(total_var),
+        "kr20": _num(kr20),
+        "items": [
+            {
+                "question": int(question_ids[j]),
+                "correct_option": int(key[j]),
+                "difficulty": _num(p[j]),
+                "discrimination": _num(discrimination[j]),
+                "point_biserial": _num(r_total[j]),
+                "corrected_point_biserial": _num(r_rest[j]),
+                "options": [
+                    {
+                        "option": int(o),
+                        "count": int(chosen[j, o]),
+                        "share": _num(share[j, o]),
+                        "upper_share": _num(upper_share[j, o]),
+                        "lower_share": _num(lower_share[j, o]),
+                        "mean_total": _num(chooser_mean[j, o]),
+                    }
+                    for o in OPTIONS
+                ],
+            }
+            for j in range(items)
+        ],
+    }
+
+
+def _num(value):
+    value = float(value)
+    return None if np.isnan(value) or np.isinf(value) else round(value, 4)
+
+
+# -----------------------------------------------------------------------------------
+#  Cached entry point
+# -----------------------------------------------------------------------------------
+def exam_item_analysis(exam, submissions=None, scope="all"):
+    """
+    Item analysis for ``exam``, cached until a question changes
+    (``content_version``) or the set of submissions analysed does – a new
+    submission, a student reassigned to or away from the teacher in
+    ``scope``, a cascade delete.  The set is fingerprinted from its ids.
+    """
+    if submissions is None:
+        submissions = ExamSubmission.objects.filter(exam=exam)
+    ids = np.fromiter(submissions.order_by("id").values_list("id", flat=True), dtype=np.int64)
+    stamp = hashlib.md5(ids.tobytes(), usedforsecurity=False).hexdigest()
+
+    def build():
+        question_ids, answer_key, selections = load_selections(exam, submissions, submission_ids=ids)
+        return {"exam": exam.pk, **analyse(selections, answer_key, question_ids)}
+
+    return cached(item_analysis_key(exam, scope, stamp), build, timeout=settings.QUESTION_PAPER_CACHE_TIMEOUT)
@@ -0,0 +1,175 @@
+import csv
+import json
+import logging
+import tempfile
+import traceback
+from datetime import timedelta
+from io import TextIOWrapper
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .exporters import (
+    STUDENT_HEADER,
+    TEACHER_HEADER,
+    csv_lines,
+    student_rows,
+    teacher_rows,
+)
+from .importers import StudentImporter
+from .models import Job, Student, Teacher
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_EVERY = 1000   # rows between progress writes on exports
+
+HANDLERS = {}
+
+
+def handler(kind):
+    def register(func):
+        HANDLERS[kind] = func
+        return func
+    return register
+
+
+# -----------------------------------------------------------------------------------
+#  Queue API
+# -----------------------------------------------------------------------------------
+def enqueue(kind, user, input_file=None):
+    job = Job(kind=kind, created_by=user)
+    if input_file is not None:
+        job.input_file.save(input_file.name, input_file, save=False)
+    job.save()
+    return job
+
+
+def claim_next():
+    """
+    Atomically move the oldest queued job to ``running``.  The conditional
+    UPDATE makes it safe to run several workers against the same table.
+    """
+    for job_id in Job.objects.filter(status="queued").values_list("id", flat=True)[:10]:
+        now = timezone.now()
+        claimed = Job.objects.filter(id=job_id, status="queued").update(
+            status="running", started_at=now, heartbeat_at=now, attempts=F("attempts") + 1
+        )
+        if claimed:
+            return Job.objects.get(id=job_id)
+    return None
+
+
+def recover_stale(now=None):
+    """
+    Jobs left ``running`` by a worker that died: once their lease
+    (``heartbeat_at`` + ``JOB_LEASE_TIMEOUT``) has run out they go back to
+    the queue, or fail after ``JOB_MAX_ATTEMPTS`` tries.  Returns
+    ``(requeued, failed)``.
+    """
+    now = now or timezone.now()
+    stale = Job.objects.alias(lease=Coalesce("heartbeat_at", "started_at")).filter(
+        status="running", lease__lt=now - timedelta(seconds=settings.JOB_LEASE_TIMEOUT)
+    )
+    failed = stale.filter(attempts__gte=settings.JOB_MAX_ATTEMPTS)
+    failed_ids = list(failed.values_list("id", flat=True))
+    failed.update(status="failed", error="Worker lost (lease expired)", finished_at=now)
+    for job in Job.objects.filter(id__in=failed_ids):
+        discard_input(job)
+    requeued = stale.update(status="queued", started_at=None, heartbeat_at=None, processed=0)
+    return requeued, len(failed_ids)
+
+
+def _leased(job):
+    """``job``'s row, as long as this worker still holds its lease."""
+    return Job.objects.filter(id=job.id, status="running", attempts=job.attempts)
+
+
+def report_progress(job, processed, total=None):
+    job.processed = processed
+    fields = {"processed": processed, "heartbeat_at": timezone.now()}
+    if total is not None:
+        job.total = fields["total"] = total
+    _leased(job).update(**fields)
+
+
+def discard_input(job):
+    """The uploaded input is only needed while the job can still run."""
+    if job.input_file:
+        job.input_file.delete(save=False)
+        Job.objects.filter(id=job.id).update(input_file="")
+
+
+def run_job(job):
+    """
+    Run ``job`` and record the outcome – unless its lease ran out meanwhile
+    and it was requeued or claimed by another worker, in which case this
+    run's result is thrown away and the input kept for the new attempt.
+    """
+    try:
+        HANDLERS[job.kind](job)
+    except Exception:
+        logger.exception("Job %s failed", job.pk)
+        job.status = "failed"
+        job.error = traceback.format_exc()
+    else:
+        job.status = "done"
+        job.processed = job.total
+    job.finished_at = timezone.now()
+    recorded = _leased(job).update(
+        status=job.status, error=job.error, result=job.result, result_file=job.result_file.name or "",
+        processed=job.processed, total=job.total, finished_at=job.finished_at,
+    )
+    if not recorded:
+        logger.warning("Job %s lost its lease; discarding this run's result", job.pk)
+        if job.result_file:
+            job.result_file.delete(save=False)
+        job.refresh_from_db()
+        return job
+    discard_input(job)
+    return job
+
+
+# -----------------------------------------------------------------------------------
+#  Handlers
+# -----------------------------------------------------------------------------------
+def _export(job, filename, header, queryset, rows):
+    total = queryset.count()
+    report_progress(job, 0, total)
+    with tempfile.TemporaryFile("w+", newline="", encoding="utf-8") as fh:
+        for line_no, line in enumerate(csv_lines(header, rows(queryset))):
+            fh.write(line)
+            if line_no and line_no % PROGRESS_EVERY == 0:
+                report_progress(job, line_no)
+        fh.seek(0)
+        job.result_file.save(filename, File(fh), save=False)
+    job.result = {"rows": total}
+
+
+@handler("student_export")
+def export_students(job):
+    _export(job, "students.csv", STUDENT_HEADER, Student.objects.all(), student_rows)
+
+
+@handler("teacher_export")
+def export_teachers(job):
+    _export(job, "teachers.csv", TEACHER_HEADER, Teacher.objects.all(), teacher_rows)
+
+
+@handler("student_import")
+def import_students(job):
+    with job.input_file.open("rb") as raw:
+        total = max(sum(1 for _ in raw) - 1, 0)
+    report_progress(job, 0, total)
+
+    with job.input_file.open("rb") as raw:
+        reader = csv.DictReader(TextIOWrapper(raw, encoding="utf-8"))
+        importer = StudentImporter(progress=lambda done: report_progress(job, done))
+        created, errors = importer.run(reader)
+
+    payload = json.dumps({"created": created, "errors": errors}, default=str)
+    job.result_file.save("import-result.json", ContentFile(payload.encode()), save=False)
+    job.result = {"created": len(created), "errors": len(errors)}
@@ -0,0 +1,74 @@
+"""
+Lean read‑only path for the big list endpoints.
+
+Rows come straight from ``values()`` as plain dicts shaped exactly like
+the ModelSerializer output (same keys, same nesting), so no field
+objects, ``to_representation`` calls or model instances are involved;
+``FastJSONRenderer`` then encodes them with orjson when it is installed
+and falls back to DRF's encoder otherwise.  Write paths and single
+objects keep using the serializers.
+"""
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:          # optional – DRF's json encoder is the fallback
+    orjson = None
+
+# ExamSubmissionSerializer's readable fields
+SUBMISSION_FIELDS = ("id", "exam", "score")
+
+# StudentSerializer: its own fields plus the nested StudentUserSerializer ones
+STUDENT_FIELDS = (
+    "phone", "roll_number", "student_class", "standard", "section",
+    "date_of_birth", "admission_date", "status", "assigned_teacher",
+)
+STUDENT_USER_FIELDS = ("username", "email", "first_name", "last_name")
+_STUDENT_USER_COLUMNS = tuple(f"user__{f}" for f in STUDENT_USER_FIELDS)
+
+
+# -----------------------------------------------------------------------------------
+#  Rows
+# -----------------------------------------------------------------------------------
+def submission_rows(queryset):
+    return list(queryset.values(*SUBMISSION_FIELDS))
+
+
+def student_values(queryset):
+    """Flat ``values()`` queryset – paginate it, then ``nest_student`` the page."""
+    return queryset.values("id", *_STUDENT_USER_COLUMNS, *STUDENT_FIELDS)
+
+
+def nest_student(row):
+    """Serializer‑shaped copy of a ``student_values`` row (the paginator still reads ``row``)."""
+    user = {field: row[column] for field, column in zip(STUDENT_USER_FIELDS, _STUDENT_USER_COLUMNS)}
+    return {"id": row["id"], "user": user, **{field: row[field] for field in STUDENT_FIELDS}}
+
+
+def student_rows(queryset):
+    return [nest_student(row) for row in student_values(queryset)]
+
+
+# -----------------------------------------------------------------------------------
+#  Rendering
+# -----------------------------------------------------------------------------------
+class FastJSONRenderer(JSONRenderer):
+    """
+    Same bytes as DRF's compact, UTF‑8 ``JSONRenderer`` – datetimes in UTC
+    end in ``Z``, U+2028 / U+2029 are escaped – but encoded by orjson.  Types orjson does not know
+    (Decimal, lazy strings, …) go through DRF's encoder.
+    """
+    _default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        ret = orjson.dumps(data, default=self._default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+        # DRF escapes the two JavaScript line terminators; orjson leaves them raw
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+LEAN_RENDERERS = [FastJSONRenderer, BrowsableAPIRenderer]
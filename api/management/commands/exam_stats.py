@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.stats import drift, rebuild
+
+
+class Command(BaseCommand):
+    help = "Rebuild or check the incrementally maintained exam / question statistics."
+
+    def add_arguments(self, parser):
+        mode = parser.add_mutually_exclusive_group(required=True)
+        mode.add_argument(
+            "--rebuild", action="store_true",
+            help="Recompute the statistics from submissions and answers.",
+        )
+        mode.add_argument(
+            "--check", action="store_true",
+            help="Report rows that differ from a fresh computation; exits non‑zero on drift.",
+        )
+        parser.add_argument(
+            "--exam", type=int, action="append", dest="exams",
+            help="Limit to this exam id (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        exam_ids = options["exams"]
+        if options["rebuild"]:
+            exams, questions = rebuild(exam_ids)
+            self.stdout.write(self.style.SUCCESS(
+                f"Rebuilt statistics for {exams} exams and {questions} questions"
+            ))
+            return
+
+        problems = drift(exam_ids)
+        for problem in problems:
+            self.stdout.write(problem)
+        if problems:
+            raise CommandError(
+                f"{len(problems)} statistics differ; run exam_stats --rebuild"
+            )
+        self.stdout.write(self.style.SUCCESS("Statistics are up to date"))
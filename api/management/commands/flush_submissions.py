@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.ingestion import flush_pending
+
+
+class Command(BaseCommand):
+    help = "Score and store submissions queued through /api/submissions/queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Drain the queue and exit instead of polling forever.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=None,
+            help="Pending submissions per transaction (default SUBMISSION_FLUSH_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=0.5,
+            help="Seconds to sleep when the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                processed = flush_pending(options["batch_size"])
+                if processed:
+                    self.stdout.write(f"Flushed {processed} submissions")
+                    continue
+                if options["once"]:
+                    return
+                time.sleep(options["poll_interval"])
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping flusher.")
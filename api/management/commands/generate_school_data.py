@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.provisioning import password_hash_workers
+from api.seeding import generate_school
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a realistic synthetic school (teachers, students, exams, "
+        "questions, submissions and answers) for load testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teachers", type=int, default=100,
+                            help="Teachers to create; each gets one class.")
+        parser.add_argument("--students", type=int, default=4000,
+                            help="Students spread over the teachers' classes.")
+        parser.add_argument("--school-exams", type=int, default=1,
+                            help="School‑wide exams per standard.")
+        parser.add_argument("--class-exams", type=int, default=2,
+                            help="Class exams per teacher.")
+        parser.add_argument("--questions", type=int, default=25,
+                            help="Questions per exam.")
+        parser.add_argument("--submission-rate", type=float, default=0.9,
+                            help="Fraction of eligible students who submit each exam.")
+        parser.add_argument("--password", default="pass",
+                            help="Password shared by every generated user.")
+        parser.add_argument("--seed", type=int, default=0,
+                            help="Random seed; same seed and sizes give the same data.")
+        parser.add_argument("--workers", type=int, default=None,
+                            help="Row generation processes (default PASSWORD_HASH_WORKERS / CPU count).")
+        parser.add_argument("--batch-size", type=int, default=5000,
+                            help="Rows per bulk insert.")
+        parser.add_argument("--prefix", default="gen",
+                            help="Username / roll number prefix.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+
+        def log(message):
+            self.stdout.write(f"[{time.perf_counter() - started:7.1f}s] {message}")
+
+        counts = generate_school(
+            teachers=options["teachers"],
+            students=options["students"],
+            school_exams_per_standard=options["school_exams"],
+            class_exams_per_teacher=options["class_exams"],
+            questions_per_exam=options["questions"],
+            submission_rate=options["submission_rate"],
+            password=options["password"],
+            seed=options["seed"],
+            workers=options["workers"] or password_hash_workers(),
+            batch_size=options["batch_size"],
+            prefix=options["prefix"],
+            log=log,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            "Generated " + ", ".join(f"{n} {kind}" for kind, n in counts.items())
+        ))
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.jobs import claim_next, recover_stale, run_job
+
+
+class Command(BaseCommand):
+    help = "Process queued CSV import / export jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Drain the queue and exit instead of polling forever.",
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=2.0,
+            help="Seconds to sleep when the queue is empty.",
+        )
+        parser.add_argument(
+            "--recover-interval", type=float, default=60.0,
+            help="Seconds between sweeps for jobs whose worker died.",
+        )
+
+    def recover(self):
+        requeued, failed = recover_stale()
+        if requeued or failed:
+            self.stdout.write(f"Recovered stale jobs: {requeued} requeued, {failed} failed")
+
+    def handle(self, *args, **options):
+        next_sweep = 0.0
+        try:
+            while True:
+                if time.monotonic() >= next_sweep:
+                    self.recover()
+                    next_sweep = time.monotonic() + options["recover_interval"]
+                job = claim_next()
+                if job is None:
+                    if options["once"]:
+                        return
+                    time.sleep(options["poll_interval"])
+                    continue
+                self.stdout.write(f"Running {job}")
+                job = run_job(job)
+                self.stdout.write(f"Finished {job}")
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping worker.")
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-18 01:13
+
+import api.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_job'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='customuser',
+            managers=[
+                ('objects', api.models.CustomUserManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.4 on 2026-10-18 01:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill(apps, schema_editor):
+    Student = apps.get_model("api", "Student")
+    Exam = apps.get_model("api", "Exam")
+    ExamEligibility = apps.get_model("api", "ExamEligibility")
+
+    students = list(Student.objects.all())
+    for student in students:
+        value = (student.student_class or "").replace("\u2011", "-")
+        standard, _, section = value.partition("-")
+        student.standard, student.section = standard.strip(), section.strip()
+    Student.objects.bulk_update(students, ["standard", "section"], batch_size=1000)
+
+    for exam in Exam.objects.all():
+        if exam.scope == "school":
+            matching = Student.objects.filter(standard=exam.target_standard)
+        elif exam.scope == "class":
+            matching = Student.objects.filter(
+                assigned_teacher_id=exam.assigned_teacher_id,
+                student_class=exam.target_class,
+            )
+        else:
+            continue
+        ExamEligibility.objects.bulk_create(
+            [ExamEligibility(exam_id=exam.id, student_id=sid)
+             for sid in matching.values_list("id", flat=True)],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_custom_user_manager'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='section',
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='standard',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=10),
+        ),
+        migrations.CreateModel(
+            name='ExamEligibility',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('exam', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='eligibility', to='api.exam')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exam_eligibility', to='api.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['student', 'exam'], name='eligibility_student_idx')],
+                'constraints': [models.UniqueConstraint(fields=('exam', 'student'), name='unique_exam_eligibility')],
+            },
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
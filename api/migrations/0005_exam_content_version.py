@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 01:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_exam_eligibility'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exam',
+            name='content_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
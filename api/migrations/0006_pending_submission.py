@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-18 01:29
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_exam_content_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingSubmission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('receipt', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('answers', models.JSONField()),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('accepted', 'Accepted'), ('rejected', 'Rejected')], default='queued', max_length=10)),
+                ('error', models.TextField(blank=True)),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('exam', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='api.exam')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='api.student')),
+                ('submission', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='api.examsubmission')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'id'], name='pending_status_idx')],
+                'constraints': [models.UniqueConstraint(fields=('exam', 'student'), name='one_pending_submission_per_exam')],
+            },
+        ),
+    ]
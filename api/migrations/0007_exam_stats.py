@@ -0,0 +1,45 @@
+# Generated by Django 5.2.4 on 2026-10-18 01:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill(apps, schema_editor):
+    from api.stats import rebuild
+
+    rebuild(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_pending_submission'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExamStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('submissions', models.PositiveIntegerField(default=0)),
+                ('score_sum', models.BigIntegerField(default=0)),
+                ('score_sq_sum', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('exam', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='api.exam')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='QuestionStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('option1', models.PositiveIntegerField(default=0)),
+                ('option2', models.PositiveIntegerField(default=0)),
+                ('option3', models.PositiveIntegerField(default=0)),
+                ('option4', models.PositiveIntegerField(default=0)),
+                ('exam', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='question_stats', to='api.exam')),
+                ('question', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='api.question')),
+            ],
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
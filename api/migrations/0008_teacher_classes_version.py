@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 02:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_exam_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teacher',
+            name='classes_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
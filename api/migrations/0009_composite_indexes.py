@@ -0,0 +1,41 @@
+# Generated by Django 5.2.4 on 2026-10-18 02:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_teacher_classes_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['submission', 'question', 'selected_option'], name='answer_submission_cover_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['question', 'selected_option'], name='answer_question_option_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(fields=['scope', 'target_standard'], name='exam_scope_standard_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(fields=['scope', 'assigned_teacher', 'target_class'], name='exam_scope_teacher_class_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(fields=['start_time', 'id'], name='exam_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='examsubmission',
+            index=models.Index(fields=['student', 'exam', 'score'], name='submission_student_exam_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['assigned_teacher', 'student_class'], name='student_teacher_class_idx'),
+        ),
+    ]
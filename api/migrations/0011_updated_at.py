@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-18 02:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_customuser_token_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exam',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='examsubmission',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
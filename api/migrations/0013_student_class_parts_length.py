@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-18 02:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_job_lease'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='student',
+            name='section',
+            field=models.CharField(blank=True, editable=False, max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='standard',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=50),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-18 03:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_student_class_parts_length'),
+    ]
+
+    # the composite indexes of 0009 lead with these FKs – drop their single‑column indexes
+    operations = [
+        migrations.AlterField(
+            model_name='answer',
+            name='question',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='api.question'),
+        ),
+        migrations.AlterField(
+            model_name='answer',
+            name='submission',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='answers', to='api.examsubmission'),
+        ),
+        migrations.AlterField(
+            model_name='examsubmission',
+            name='student',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='api.student'),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='assigned_teacher',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='api.teacher'),
+        ),
+    ]
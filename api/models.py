@@ -1,5 +1,55 @@
-from django.contrib.auth.models import AbstractUser
-from django.db import migrations, models
+import uuid
+
+from django.contrib.auth.models import AbstractUser, UserManager
+from django.db import connection, migrations, models, transaction
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from .caching import acached, api_cache, cached, teacher_classes_key, token_version_key
+
+
+def split_student_class(value):
+    """
+    "10-A" → ("10", "A").  Also accepts the non‑breaking hyphen ("10‑A")
+    that shows up in hand‑typed data.
+    """
+    value = (value or "").replace("\u2011", "-")
+    standard, _, section = value.partition("-")
+    return standard.strip(), section.strip()
+
+
+class CustomUserManager(UserManager):
+
+    def bulk_provision(self, rows, role, workers=None, batch_size=None, hashed=False):
+        """
+        Create many users at once.  ``rows`` are dicts of CustomUser fields
+        with a raw ``password``; hashes are computed in parallel and the
+        users are written with a single ``bulk_create``.  Pass
+        ``hashed=True`` for rows whose passwords were hashed beforehand
+        (e.g. outside the caller's transaction).
+        """
+        from .provisioning import hash_passwords
+
+        rows = list(rows)
+        passwords = [row["password"] for row in rows]
+        hashes = passwords if hashed else hash_passwords(passwords, workers=workers)
+        users = [
+            self.model(**{**row, "password": pwd_hash, "role": role})
+            for row, pwd_hash in zip(rows, hashes)
+        ]
+        self.bulk_create(users, batch_size=batch_size)
+
+        if not connection.features.can_return_rows_from_bulk_insert:
+            ids = dict(
+                self.filter(username__in=[u.username for u in users])
+                .values_list("username", "id")
+            )
+            for user in users:
+                user.pk = ids[user.username]
+        return users
 
 
 class CustomUser(AbstractUser):
@@ -9,10 +59,63 @@ class CustomUser(AbstractUser):
         ('student', 'Student'),
     )
     role = models.CharField(max_length=10, choices=ROLE_CHOICES)
+    # Carried in every access token; bumping it revokes the user's tokens
+    # (see api/authentication.py).
+    token_version = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = CustomUserManager()
+
+    # Set on the unsaved users ClaimsJWTAuthentication builds from token claims.
+    from_token = False
 
     def __str__(self):
         return f"{self.username} ({self.role})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_credentials = instance._credentials()
+        return instance
+
+    def _credentials(self):
+        return tuple(self.__dict__.get(f) for f in ("password", "role", "is_active"))
+
+    @cached_property
+    def profile_id(self):
+        """
+        Id of the user's Teacher / Student row (``None`` for admins).  Read
+        from the token claims for token users, otherwise one query.
+        """
+        model = {"teacher": Teacher, "student": Student}.get(self.role)
+        if model is None:
+            return None
+        return model.objects.filter(user_id=self.pk).values_list("pk", flat=True).first()
+
+    def save(self, *args, **kwargs):
+        if self.from_token:
+            raise TypeError("Users built from token claims are read-only; load the user to save it.")
+        loaded = getattr(self, "_loaded_credentials", None)
+        super().save(*args, **kwargs)
+        if loaded is not None and loaded != self._credentials():
+            # new password, role or deactivation – existing tokens stop working
+            self.revoke_tokens()
+        self._loaded_credentials = self._credentials()
+
+    def delete(self, *args, **kwargs):
+        pk = self.pk
+        result = super().delete(*args, **kwargs)
+        api_cache().delete(token_version_key(pk))
+        return result
+
+    def revoke_tokens(self):
+        """
+        Invalidate every token issued to this user so far.  Queryset
+        ``update()`` calls bypass this – call it yourself after them.
+        """
+        CustomUser.objects.filter(pk=self.pk).update(token_version=models.F("token_version") + 1)
+        self.refresh_from_db(fields=["token_version"])
+        api_cache().delete(token_version_key(self.pk))
+
 class Teacher(models.Model):
     user = models.OneToOneField(CustomUser, on_delete=models.CASCADE)
     phone = models.CharField(max_length=15)
@@ -20,26 +123,120 @@ class Teacher(models.Model):
     employee_id = models.CharField(max_length=20, unique=True)
     date_of_joining = models.DateField()
     status = models.CharField(max_length=10, choices=[('active', 'Active'), ('inactive', 'Inactive')])
+    # Bumped whenever one of the teacher's students is added, moved or removed;
+    # versions the cached classes_taught() entry.
+    classes_version = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return f"{self.user.first_name} {self.user.last_name} - {self.subject_specialization}"
 
+    @staticmethod
+    def bump_classes_version(teacher_ids):
+        teacher_ids = set(teacher_ids) - {None}
+        if teacher_ids:
+            Teacher.objects.filter(pk__in=teacher_ids).update(
+                classes_version=models.F("classes_version") + 1
+            )
+
+    def classes_taught(self):
+        """
+        ``{"classes": [...], "standards": [...]}`` for this teacher's
+        students – one DISTINCT query on a cache miss, none on a hit.
+        """
+        def build():
+            return self._classes_payload(self._class_names())
+        return cached(teacher_classes_key(self), build, timeout=None)
+
+    async def aclasses_taught(self):
+        """``classes_taught()`` for async views (same cache entry)."""
+        async def build():
+            return self._classes_payload([c async for c in self._class_names()])
+        return await acached(teacher_classes_key(self), build, timeout=None)
+
+    def _class_names(self):
+        return (
+            Student.objects.filter(assigned_teacher=self)
+            .order_by().values_list("student_class", flat=True).distinct()
+        )
+
+    @staticmethod
+    def _classes_payload(classes):
+        classes = sorted(classes)
+        standards = sorted({split_student_class(c)[0] for c in classes} - {""})
+        return {"classes": classes, "standards": standards}
+
     def delete(self, *args, **kwargs):
         user = self.user           # keep ref
         super().delete(*args, **kwargs)
         user.delete() 
         
+class StudentQuerySet(models.QuerySet):
+    PLACEMENT_FIELDS = {"assigned_teacher", "assigned_teacher_id", "student_class"}
+
+    def update(self, **kwargs):
+        """
+        Bulk moves keep up what ``Student.save`` maintains for one student:
+        ``standard`` / ``section``, exam eligibility and the old and new
+        teachers' ``classes_version``.
+        """
+        if not self.PLACEMENT_FIELDS & kwargs.keys():
+            return super().update(**kwargs)
+        if isinstance(kwargs.get("student_class"), str):
+            kwargs["standard"], kwargs["section"] = split_student_class(kwargs["student_class"])
+        placements = dict(self.values_list("pk", "assigned_teacher_id"))
+        with transaction.atomic(using=self.db):
+            updated = super().update(**kwargs)
+            moved = list(Student.objects.filter(pk__in=placements))
+            ExamEligibility.refresh_for_students(moved)
+        Teacher.bump_classes_version({*placements.values(), *(s.assigned_teacher_id for s in moved)})
+        return updated
+
+
 class Student(models.Model):
+    objects = StudentQuerySet.as_manager()
+
     class Meta:
         ordering = ["id"] 
+        indexes = [
+            # teacher → class lookups (classes_taught, my_students, class exams)
+            models.Index(fields=["assigned_teacher", "student_class"], name="student_teacher_class_idx"),
+        ]
     user = models.OneToOneField(CustomUser, on_delete=models.CASCADE)
     phone = models.CharField(max_length=15)
     roll_number = models.CharField(max_length=20, unique=True)
     student_class = models.CharField(max_length=50)
+    # Derived from student_class on save – indexed so eligibility is an equality lookup.
+    standard = models.CharField(max_length=50, blank=True, db_index=True, editable=False)
+    section = models.CharField(max_length=50, blank=True, editable=False)
     date_of_birth = models.DateField()
     admission_date = models.DateField()
     status = models.CharField(max_length=10, choices=[('active', 'Active'), ('inactive', 'Inactive')])
-    assigned_teacher = models.ForeignKey(Teacher, on_delete=models.SET_NULL, null=True, blank=True)
+    # indexed by student_teacher_class_idx, which leads with it
+    assigned_teacher = models.ForeignKey(Teacher, on_delete=models.SET_NULL, null=True, blank=True, db_index=False)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_placement = instance._placement()
+        return instance
+
+    def _placement(self):
+        # read from __dict__ so deferred fields are never fetched here
+        return (self.__dict__.get("assigned_teacher_id"), self.__dict__.get("student_class"))
+
+    def save(self, *args, **kwargs):
+        self.standard, self.section = split_student_class(self.student_class)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "student_class" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "standard", "section"}
+
+        loaded = getattr(self, "_loaded_placement", None)
+        moved = loaded != self._placement()
+        super().save(*args, **kwargs)
+        if moved:
+            ExamEligibility.refresh_for_students([self])
+            Teacher.bump_classes_version({self.assigned_teacher_id, loaded and loaded[0]})
+            self._loaded_placement = self._placement()
 
     def delete(self, *args, **kwargs):
         user = self.user
@@ -50,6 +247,12 @@ class Student(models.Model):
         return f"{self.user.first_name} {self.user.last_name} - {self.roll_number}"
     
 
+@receiver(post_delete, sender=Student)
+def _student_deleted(sender, instance, **kwargs):
+    # also runs for students removed by a cascade (e.g. their user deleted)
+    Teacher.bump_classes_version({instance.assigned_teacher_id})
+
+
 class Exam(models.Model):
     SCOPE_CHOICES = (
         ("school", "School‑level"),   
@@ -64,6 +267,40 @@ class Exam(models.Model):
     target_class      = models.CharField(max_length=10, blank=True)  # e.g. "10‑A"
     start_time        = models.DateTimeField()
     duration_minutes  = models.IntegerField(default=5)
+    # Bumped whenever a question changes; part of every question cache key.
+    content_version   = models.PositiveIntegerField(default=0, editable=False)
+    # Also touched when a question changes – HTTP validators (api/conditional.py).
+    updated_at        = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["scope", "target_standard"], name="exam_scope_standard_idx"),
+            models.Index(
+                fields=["scope", "assigned_teacher", "target_class"],
+                name="exam_scope_teacher_class_idx",
+            ),
+            # keyset pagination order (ExamKeysetPagination)
+            models.Index(fields=["start_time", "id"], name="exam_start_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_audience = instance._audience()
+        return instance
+
+    def _audience(self):
+        return tuple(
+            self.__dict__.get(f)
+            for f in ("scope", "target_standard", "target_class", "assigned_teacher_id")
+        )
+
+    def save(self, *args, **kwargs):
+        changed = getattr(self, "_loaded_audience", None) != self._audience()
+        super().save(*args, **kwargs)
+        if changed:
+            ExamEligibility.refresh_for_exam(self)
+            self._loaded_audience = self._audience()
 
     def clean(self):
         from django.core.exceptions import ValidationError
@@ -81,17 +318,93 @@ class Exam(models.Model):
         else:
             raise ValidationError("Invalid scope")
 
-    def eligible_students(self):
+    def matching_students(self):
+        """Evaluate the scope rules against the student table."""
         if self.scope == "school":
-            return Student.objects.filter(student_class__startswith=self.target_standard)
-        return Student.objects.filter(
-            assigned_teacher=self.assigned_teacher,
-            student_class=self.target_class,
-        )
+            return Student.objects.filter(standard=self.target_standard)
+        if self.scope == "class":
+            return Student.objects.filter(
+                assigned_teacher_id=self.assigned_teacher_id,
+                student_class=self.target_class,
+            )
+        return Student.objects.none()
+
+    @staticmethod
+    def audience_admits(audience, student):
+        scope, target_standard, target_class, teacher_id = audience
+        if scope == "school":
+            return bool(target_standard) and student.standard == target_standard
+        if scope == "class":
+            return (
+                teacher_id is not None
+                and student.assigned_teacher_id == teacher_id
+                and student.student_class == target_class
+            )
+        return False
+
+    def is_eligible(self, student):
+        """
+        Can ``student`` take this exam?  Evaluated on the already loaded
+        exam and student fields, so it never touches the database.
+        """
+        return self.audience_admits(self._audience(), student)
+
+    def eligible_students(self):
+        return Student.objects.filter(exam_eligibility__exam=self)
 
     def __str__(self):
         return self.title
 
+class ExamEligibility(models.Model):
+    """
+    Materialised exam → eligible student mapping, kept in sync by
+    ``Exam.save`` / ``Student.save`` (and the bulk importers).
+    """
+    exam    = models.ForeignKey(Exam, on_delete=models.CASCADE, related_name="eligibility")
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="exam_eligibility")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["exam", "student"], name="unique_exam_eligibility")
+        ]
+        indexes = [models.Index(fields=["student", "exam"], name="eligibility_student_idx")]
+
+    @classmethod
+    def refresh_for_exam(cls, exam):
+        cls.objects.filter(exam=exam).delete()
+        cls.objects.bulk_create(
+            [
+                cls(exam=exam, student_id=student_id)
+                for student_id in exam.matching_students().values_list("id", flat=True).iterator()
+            ],
+            batch_size=1000,
+        )
+
+    @classmethod
+    def refresh_for_students(cls, students):
+        students = list(students)
+        if not students:
+            return
+        standards = {s.standard for s in students}
+        classes = {s.student_class for s in students}
+        teachers = {s.assigned_teacher_id for s in students if s.assigned_teacher_id}
+        audiences = Exam.objects.filter(
+            models.Q(scope="school", target_standard__in=standards)
+            | models.Q(scope="class", target_class__in=classes, assigned_teacher_id__in=teachers)
+        ).values_list("id", "scope", "target_standard", "target_class", "assigned_teacher_id")
+
+        rows = [
+            cls(exam_id=exam_id, student_id=student.id)
+            for exam_id, *audience in audiences
+            for student in students
+            if Exam.audience_admits(audience, student)
+        ]
+        cls.objects.filter(student__in=students).delete()
+        cls.objects.bulk_create(rows, batch_size=1000)
+
+    def __str__(self):
+        return f"{self.student_id} → {self.exam_id}"
+
 class Question(models.Model):
     exam = models.ForeignKey(Exam, on_delete=models.CASCADE, related_name='questions')
     text = models.TextField()
@@ -100,15 +413,40 @@ class Question(models.Model):
     option3 = models.CharField(max_length=255)
     option4 = models.CharField(max_length=255)
     correct_option = models.IntegerField(choices=[(1, 'A'), (2, 'B'), (3, 'C'), (4, 'D')])
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_exam_id = instance.__dict__.get("exam_id")
+        return instance
+
+    def _bump_exam_versions(self):
+        exam_ids = {self.exam_id, getattr(self, "_loaded_exam_id", None)} - {None}
+        Exam.objects.filter(pk__in=exam_ids).update(
+            content_version=models.F("content_version") + 1,
+            updated_at=timezone.now(),
+        )
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._bump_exam_versions()
+        self._loaded_exam_id = self.exam_id
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._bump_exam_versions()
+        return result
 
     def __str__(self):
         return self.text
 
 class ExamSubmission(models.Model):
-    student = models.ForeignKey(Student, on_delete=models.CASCADE)
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, db_index=False)   # submission_student_exam_idx
     exam = models.ForeignKey(Exam, on_delete=models.CASCADE)
     submitted_at = models.DateTimeField(auto_now_add=True)
     score = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         constraints = [
@@ -117,11 +455,245 @@ class ExamSubmission(models.Model):
                 name="one_submission_per_exam"
             )
         ]
+        indexes = [
+            # a student's marks ordered by exam, score read from the index
+            models.Index(fields=["student", "exam", "score"], name="submission_student_exam_idx"),
+        ]
+
+    def delete(self, *args, **kwargs):
+        answers = list(self.answers.values_list("question_id", "selected_option"))
+        result = super().delete(*args, **kwargs)
+        ExamStats.record([(self, answers)], sign=-1)
+        return result
 
     def __str__(self):
         return f"{self.student} - {self.exam}"
 
 class Answer(models.Model):
-    submission = models.ForeignKey(ExamSubmission, on_delete=models.CASCADE, related_name='answers', )
-    question = models.ForeignKey(Question, on_delete=models.CASCADE)
+    # both lead a composite index below – no single‑column FK indexes to maintain
+    submission = models.ForeignKey(ExamSubmission, on_delete=models.CASCADE, related_name='answers', db_index=False)
+    question = models.ForeignKey(Question, on_delete=models.CASCADE, db_index=False)
     selected_option = models.IntegerField()
+
+    class Meta:
+        indexes = [
+            # covering: a submission's answers without touching the table
+            models.Index(
+                fields=["submission", "question", "selected_option"],
+                name="answer_submission_cover_idx",
+            ),
+            # per‑question option counts (analytics, stats rebuild)
+            models.Index(fields=["question", "selected_option"], name="answer_question_option_idx"),
+        ]
+
+
+class ExamStats(models.Model):
+    """
+    Running totals over an exam's submissions, bumped in the submission
+    write path (see ``api.stats``) so dashboards read one row instead of
+    aggregating every submission.
+    """
+    exam         = models.OneToOneField(Exam, on_delete=models.CASCADE, related_name="stats")
+    submissions  = models.PositiveIntegerField(default=0)
+    score_sum    = models.BigIntegerField(default=0)
+    score_sq_sum = models.BigIntegerField(default=0)
+    updated_at   = models.DateTimeField(auto_now=True)
+
+    @property
+    def mean(self):
+        return self.score_sum / self.submissions if self.submissions else None
+
+    @property
+    def stddev(self):
+        if not self.submissions:
+            return None
+        variance = self.score_sq_sum / self.submissions - self.mean ** 2
+        return max(variance, 0) ** 0.5
+
+    @classmethod
+    def record(cls, entries, sign=1):
+        """
+        Fold ``(submission, [(question_id, selected_option), ...])`` pairs
+        into the running totals (``sign=-1`` takes them back out).  Two
+        ``UPDATE … SET x = x + CASE …`` queries whatever the batch size,
+        each preceded by an ``INSERT`` of any rows that do not exist yet.
+        Rows that drift (e.g. submissions removed by a cascade) are fixed by
+        ``manage.py exam_stats --rebuild``.
+        """
+        exams, questions, question_exam = {}, {}, {}
+        for submission, answers in entries:
+            totals = exams.setdefault(
+                submission.exam_id, {"submissions": 0, "score_sum": 0, "score_sq_sum": 0}
+            )
+            totals["submissions"] += sign
+            totals["score_sum"] += sign * submission.score
+            totals["score_sq_sum"] += sign * submission.score ** 2
+            for question_id, option in answers:
+                question_exam[question_id] = submission.exam_id
+                counts = questions.setdefault(
+                    question_id, dict.fromkeys(("attempts",) + QuestionStats.OPTION_FIELDS, 0)
+                )
+                counts["attempts"] += sign
+                if f"option{option}" in counts:
+                    counts[f"option{option}"] += sign
+        if not exams:
+            return
+
+        _increment_or_create(
+            cls, "exam_id", exams, lambda e: cls(exam_id=e), sign,
+            updated_at=timezone.now(),   # update() skips auto_now
+        )
+        _increment_or_create(
+            QuestionStats, "question_id", questions,
+            lambda q: QuestionStats(question_id=q, exam_id=question_exam[q]), sign,
+        )
+
+    def __str__(self):
+        return f"Stats for exam {self.exam_id}"
+
+
+class QuestionStats(models.Model):
+    """Answer counts per option for one question; ``attempts`` is their total."""
+    question = models.OneToOneField(Question, on_delete=models.CASCADE, related_name="stats")
+    exam     = models.ForeignKey(Exam, on_delete=models.CASCADE, related_name="question_stats")
+    attempts = models.PositiveIntegerField(default=0)
+    option1  = models.PositiveIntegerField(default=0)
+    option2  = models.PositiveIntegerField(default=0)
+    option3  = models.PositiveIntegerField(default=0)
+    option4  = models.PositiveIntegerField(default=0)
+
+    OPTION_FIELDS = ("option1", "option2", "option3", "option4")
+
+    def correct_count(self, correct_option):
+        # counts are per option, so an edited answer key needs no rebuild
+        return getattr(self, f"option{correct_option}", 0)
+
+    def __str__(self):
+        return f"Stats for question {self.question_id}"
+
+
+def _increment_or_create(model, key, rows, build, sign, **extra):
+    """
+    Make sure every row exists (an ``INSERT`` that skips existing keys),
+    then apply the deltas.  In that order a row committed by a concurrent
+    writer is simply skipped by the insert – the update still counts ours.
+    Taking totals back out never creates rows.
+    """
+    if not rows:
+        return
+    if sign > 0:
+        model.objects.bulk_create([build(k) for k in rows], ignore_conflicts=True)
+    _increment(model, key, rows, floor=sign < 0, **extra)
+
+
+def _increment(model, key, rows, floor=False, **extra):
+    """
+    ``rows`` maps a key value to ``{field: delta}``; apply every delta in a
+    single UPDATE, grouping keys that share a delta into one WHEN branch.
+    With ``floor`` the counters stop at zero instead of breaking the
+    unsigned columns once totals have drifted.
+    """
+    fields = {}
+    for key_value, deltas in rows.items():
+        for field, delta in deltas.items():
+            if delta:
+                fields.setdefault(field, {}).setdefault(delta, []).append(key_value)
+    updates = dict(extra)
+    for field, by_delta in fields.items():
+        if len(by_delta) == 1 and len(next(iter(by_delta.values()))) == len(rows):
+            change = models.Value(next(iter(by_delta)))
+        else:
+            change = models.Case(
+                *[models.When(**{f"{key}__in": keys}, then=models.Value(delta))
+                  for delta, keys in by_delta.items()],
+                default=models.Value(0),
+            )
+        updates[field] = models.F(field) + change
+        if floor:
+            updates[field] = Greatest(updates[field], models.Value(0))
+    if len(updates) == len(extra):
+        return len(rows)
+    return model.objects.filter(**{f"{key}__in": list(rows)}).update(**updates)
+
+
+class PendingSubmission(models.Model):
+    """
+    Submission accepted by ``POST /api/submissions/queue`` but not scored
+    yet.  ``manage.py flush_submissions`` turns queued rows into
+    ExamSubmission + Answer rows in large transactions.
+    """
+    STATUS_CHOICES = (
+        ("queued",   "Queued"),
+        ("accepted", "Accepted"),
+        ("rejected", "Rejected"),
+    )
+
+    receipt      = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    student      = models.ForeignKey(Student, on_delete=models.CASCADE)
+    exam         = models.ForeignKey(Exam, on_delete=models.CASCADE)
+    answers      = models.JSONField()
+    status       = models.CharField(max_length=10, choices=STATUS_CHOICES, default="queued")
+    error        = models.TextField(blank=True)
+    submission   = models.OneToOneField(ExamSubmission, on_delete=models.SET_NULL, null=True, blank=True)
+    received_at  = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["exam", "student"],
+                name="one_pending_submission_per_exam"
+            )
+        ]
+        indexes = [models.Index(fields=["status", "id"], name="pending_status_idx")]
+
+    def __str__(self):
+        return f"{self.receipt} ({self.status})"
+
+
+class Job(models.Model):
+    """
+    Long‑running CSV import / export queued by the API and executed by
+    ``manage.py run_jobs`` outside the web workers.
+    """
+    KIND_CHOICES = (
+        ("student_import", "Student import"),
+        ("student_export", "Student export"),
+        ("teacher_export", "Teacher export"),
+    )
+    STATUS_CHOICES = (
+        ("queued",  "Queued"),
+        ("running", "Running"),
+        ("done",    "Done"),
+        ("failed",  "Failed"),
+    )
+
+    kind         = models.CharField(max_length=20, choices=KIND_CHOICES)
+    status       = models.CharField(max_length=10, choices=STATUS_CHOICES, default="queued")
+    created_by   = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="jobs")
+    input_file   = models.FileField(upload_to="jobs/input/", blank=True)
+    result_file  = models.FileField(upload_to="jobs/results/", blank=True)
+    result       = models.JSONField(null=True, blank=True)
+    error        = models.TextField(blank=True)
+    total        = models.IntegerField(default=0)
+    processed    = models.IntegerField(default=0)
+    created_at   = models.DateTimeField(auto_now_add=True)
+    started_at   = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)   # lease – see api/jobs.py
+    attempts     = models.PositiveSmallIntegerField(default=0)
+    finished_at  = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [models.Index(fields=["status", "id"], name="job_status_idx")]
+
+    @property
+    def progress(self):
+        if self.status == "done":
+            return 100
+        if not self.total:
+            return 0
+        return min(99, int(self.processed * 100 / self.total))
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
@@ -0,0 +1,47 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset pagination with opaque cursors – every page is an indexed
+    ``WHERE id > …`` range scan, however deep the client goes.
+
+    ``?page_size=`` picks the page size (capped at ``max_page_size``) and
+    ``?count=false`` skips the ``COUNT(*)`` for clients that don't need it.
+    """
+    ordering = ("id",)
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = queryset.count() if self.wants_count(request) else None
+        return super().paginate_queryset(queryset, request, view)
+
+    def wants_count(self, request):
+        value = request.query_params.get(self.count_query_param, "true")
+        return value.lower() not in ("0", "false", "no")
+
+    def get_paginated_response(self, data):
+        body = {}
+        if self.count is not None:
+            body["count"] = self.count
+        body.update(
+            next=self.get_next_link(),
+            previous=self.get_previous_link(),
+            results=data,
+        )
+        return Response(body)
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema["properties"] = {
+            "count": {"type": "integer", "example": 123},
+            **schema["properties"],
+        }
+        return schema
+
+
+class ExamKeysetPagination(KeysetPagination):
+    ordering = ("start_time", "id")
@@ -0,0 +1,57 @@
+"""
+Request‑scoped resolution of the caller's Teacher / Student row.
+
+Views and serializers ask ``get_profile(request)`` instead of reaching
+for ``user.teacher`` / ``Teacher.objects.get(user=...)``.  A profile the
+authentication already loaded with the user is reused; otherwise it is
+loaded on first use – with its user, in one ``select_related`` query.
+Either way it is memoised on the underlying ``HttpRequest``, so a request
+resolves it at most once however many permission checks, querysets and
+serializers need it.  ``get_profile_id`` is free for users built from
+token claims (api/authentication.py) and otherwise shares the same load.
+"""
+from .models import Student, Teacher
+
+PROFILE_MODELS = {"teacher": Teacher, "student": Student}
+
+
+def _http_request(request):
+    # DRF wraps the HttpRequest; memoise on the one both share
+    return getattr(request, "_request", request)
+
+
+def get_profile(request):
+    """``request.user``'s Teacher or Student, or ``None`` (admins, no profile)."""
+    http = _http_request(request)
+    try:
+        return http._profile
+    except AttributeError:
+        pass
+    user = request.user
+    role = getattr(user, "role", None)
+    if role in PROFILE_MODELS and role in user._state.fields_cache:
+        profile = user._state.fields_cache[role]      # loaded along with the user
+    else:
+        profile = load_profile(user)
+    http._profile = profile
+    return profile
+
+
+def get_profile_id(request):
+    user = request.user
+    if "profile_id" in user.__dict__:
+        return user.__dict__["profile_id"]
+    profile = get_profile(request)
+    return profile.pk if profile is not None else None
+
+
+def load_profile(user):
+    model = PROFILE_MODELS.get(getattr(user, "role", None))
+    if model is None or not user.is_authenticated:
+        return None
+    profile = model.objects.select_related("user").filter(user_id=user.pk).first()
+    # keep user.teacher / user.student and user.profile_id consistent with it
+    user.__dict__["profile_id"] = profile.pk if profile is not None else None
+    if profile is not None:
+        user._state.fields_cache[user.role] = profile
+    return profile
@@ -0,0 +1,234 @@
+import logging
+import random
+import time
+from collections import deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from rest_framework import serializers
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "ENABLED": False,
+    "SAMPLE_RATE": 1.0,     # fraction of requests profiled
+    "SLOW_QUERIES": 5,      # slowest statements kept per request
+    "SQL_MAX_LENGTH": 500,  # characters of each kept statement
+    "LOG_SIZE": 200,        # profiles kept in memory for /api/profiling
+}
+
+_current = ContextVar("request_profile", default=None)
+
+# Recent profiles of *this* process, newest last – see recent_profiles().
+RECENT = deque(maxlen=DEFAULTS["LOG_SIZE"])
+
+
+def profiling_settings():
+    return {**DEFAULTS, **getattr(settings, "PROFILING", {})}
+
+
+# -----------------------------------------------------------------------------------
+#  Per‑request recorder
+# -----------------------------------------------------------------------------------
+class RequestProfile:
+    def __init__(self, request, options):
+        self.options = options
+        self.method = request.method
+        self.path = request.path
+        self.started = time.perf_counter()
+        self.queries = []          # (seconds, sql)
+        self.view_started = None
+        self.view_ended = None
+        self.serializer_time = 0.0
+        self.render_time = 0.0
+        self.depth = 0             # nested serializer.data calls count once
+
+    # connection.execute_wrapper hook
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((time.perf_counter() - started, sql))
+
+    def summary(self, status_code):
+        ended = time.perf_counter()
+        total = ended - self.started
+        view_time = 0.0
+        if self.view_started is not None:
+            view_time = (self.view_ended or ended) - self.view_started
+        slowest = sorted(self.queries, key=lambda q: q[0], reverse=True)
+        limit = self.options["SQL_MAX_LENGTH"]
+        return {
+            "method": self.method,
+            "path": self.path,
+            "status": status_code,
+            "total_ms": _ms(total),
+            "db_ms": _ms(sum(d for d, _ in self.queries)),
+            "db_queries": len(self.queries),
+            "view_ms": _ms(view_time),
+            "serializer_ms": _ms(self.serializer_time),
+            "render_ms": _ms(self.render_time),
+            "slow_queries": [
+                {"ms": _ms(d), "sql": sql[:limit]}
+                for d, sql in slowest[: self.options["SLOW_QUERIES"]]
+            ],
+        }
+
+
+def server_timing(summary):
+    """Format a summary as a ``Server-Timing`` header value."""
+    return ", ".join([
+        f'total;dur={summary["total_ms"]}',
+        f'db;dur={summary["db_ms"]};desc="{summary["db_queries"]} queries"',
+        f'view;dur={summary["view_ms"]}',
+        f'serialize;dur={summary["serializer_ms"]}',
+        f'render;dur={summary["render_ms"]}',
+    ])
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
+
+
+# -----------------------------------------------------------------------------------
+#  Serializer timing – BaseSerializer.data is where every DRF serializer
+#  (and ListSerializer) runs to_representation.  The hook is only put in
+#  place by the first profiled request, so a process with profiling off
+#  runs DRF untouched.
+# -----------------------------------------------------------------------------------
+_original_data = serializers.BaseSerializer.data
+
+
+def install_serializer_timer():
+    if serializers.BaseSerializer.data is _original_data:
+        serializers.BaseSerializer.data = property(_timed_data)
+
+
+def uninstall_serializer_timer():
+    serializers.BaseSerializer.data = _original_data
+
+
+def _timed_data(self):
+    profile = _current.get()
+    if profile is None or profile.depth:
+        return _original_data.fget(self)
+    profile.depth += 1
+    started = time.perf_counter()
+    try:
+        return _original_data.fget(self)
+    finally:
+        profile.serializer_time += time.perf_counter() - started
+        profile.depth -= 1
+
+
+# -----------------------------------------------------------------------------------
+#  Middleware
+# -----------------------------------------------------------------------------------
+class ProfilingMiddleware:
+    """
+    Opt‑in request profiler (``PROFILING = {"ENABLED": True, ...}``).
+
+    A sampled request gets a ``Server-Timing`` header with total, DB,
+    view, serializer and render time; its summary – including the slowest
+    SQL statements – is logged to ``api.profiling`` and kept in a rolling
+    in‑memory log served to admins at ``/api/profiling``.  Unsampled
+    requests pay for one settings lookup and one ``random()`` call.
+    """
+
+    sync_capable = True
+    async_capable = True    # keeps ASGI requests on the event loop
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        profile = self._start(request)
+        if profile is None:
+            return self.get_response(request)
+        token = _current.set(profile)
+        try:
+            with self._wrap_connections(profile):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(profile, response)
+
+    async def __acall__(self, request):
+        profile = self._start(request)
+        if profile is None:
+            return await self.get_response(request)
+        token = _current.set(profile)
+        try:
+            with self._wrap_connections(profile):
+                response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(profile, response)
+
+    @staticmethod
+    def _start(request):
+        options = profiling_settings()
+        if not options["ENABLED"] or random.random() >= options["SAMPLE_RATE"]:
+            return None
+        install_serializer_timer()
+        return RequestProfile(request, options)
+
+    @staticmethod
+    def _wrap_connections(profile):
+        stack = ExitStack()
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(profile))
+        return stack
+
+    @staticmethod
+    def _finish(profile, response):
+        summary = profile.summary(response.status_code)
+        response["Server-Timing"] = server_timing(summary)
+        _record(summary, profile.options["LOG_SIZE"])
+        logger.info(
+            "%s %s %s total=%sms db=%sms/%s view=%sms serialize=%sms render=%sms",
+            summary["method"], summary["path"], summary["status"],
+            summary["total_ms"], summary["db_ms"], summary["db_queries"],
+            summary["view_ms"], summary["serializer_ms"], summary["render_ms"],
+        )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = _current.get()
+        if profile is not None:
+            profile.view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        profile = _current.get()
+        if profile is None or not isinstance(response, Response):
+            return response
+        # the view (and DRF's serializers) are done; rendering comes next
+        started = profile.view_ended = time.perf_counter()
+
+        def rendered(response):
+            profile.render_time += time.perf_counter() - started
+        response.add_post_render_callback(rendered)
+        return response
+
+
+def _record(summary, size):
+    global RECENT
+    if RECENT.maxlen != size:
+        RECENT = deque(RECENT, maxlen=size)
+    RECENT.append(summary)
+
+
+def recent_profiles(limit=None):
+    """Newest first."""
+    profiles = list(reversed(RECENT))
+    return profiles[:limit] if limit else profiles
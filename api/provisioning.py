@@ -0,0 +1,44 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password
+
+# Below this many passwords the pool start‑up costs more than it saves.
+MIN_PARALLEL_PASSWORDS = 16
+
+
+def password_hash_workers():
+    return getattr(settings, "PASSWORD_HASH_WORKERS", None) or os.cpu_count() or 1
+
+
+def _init_worker():
+    # Workers start from a fresh interpreter, not a fork of the request
+    # thread – so they never share its open database connections.
+    import django
+    django.setup()
+
+
+def _pool_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    Hash ``passwords`` with the configured PASSWORD_HASHERS, fanning the
+    work out over a process pool.  Order of the result matches the input.
+    Call it outside any transaction – hashing is slow by design.
+    """
+    passwords = list(passwords)
+    workers = min(workers or password_hash_workers(), len(passwords))
+    if workers <= 1 or len(passwords) < MIN_PARALLEL_PASSWORDS:
+        return [make_password(pwd) for pwd in passwords]
+
+    # the hasher travels with each task, so workers need not share our settings
+    hash_one = partial(make_password, hasher=get_hasher())
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(), initializer=_init_worker) as pool:
+        return list(pool.map(hash_one, passwords, chunksize=chunksize))
@@ -0,0 +1,57 @@
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import Answer, Exam, ExamEligibility, ExamSubmission, Question
+
+
+def _count(queryset):
+    """Correlated ``COUNT(*)`` subquery over ``queryset`` (0 when empty)."""
+    return Coalesce(
+        Subquery(
+            queryset.order_by().values(dummy=Value(1))
+            .annotate(n=Count("*")).values("n")[:1],
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def report_card_exams(student):
+    """
+    Every exam ``student`` may sit or has already taken (a class change
+    does not drop graded exams), annotated in SQL with their score, the
+    maximum score, their rank in class and how many classmates submitted,
+    with the student's own submission and its answers (plus questions)
+    prefetched – four queries however many exams and answers there are.
+    """
+    own = ExamSubmission.objects.filter(exam=OuterRef("pk"), student=student)
+    classmates = ExamSubmission.objects.filter(
+        exam=OuterRef("pk"), student__student_class=student.student_class
+    )
+    return (
+        Exam.objects.filter(
+            Q(pk__in=ExamEligibility.objects.filter(student=student).values("exam"))
+            | Q(pk__in=ExamSubmission.objects.filter(student=student).values("exam"))
+        )
+        .annotate(
+            score=Subquery(own.values("score")[:1]),
+            max_score=_count(Question.objects.filter(exam=OuterRef("pk"))),
+            class_submissions=_count(classmates),
+        )
+        .annotate(
+            class_rank=_count(classmates.filter(score__gt=OuterRef("score"))) + 1,
+        )
+        .prefetch_related(
+            Prefetch(
+                "examsubmission_set",
+                queryset=ExamSubmission.objects.filter(student=student).prefetch_related(
+                    Prefetch(
+                        "answers",
+                        queryset=Answer.objects.select_related("question").order_by("question_id"),
+                    )
+                ),
+                to_attr="own_submissions",
+            )
+        )
+        .order_by("start_time", "id")
+    )
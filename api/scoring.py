@@ -0,0 +1,36 @@
+from django.conf import settings
+
+from .caching import answer_key_key, cached
+from .models import Question
+
+
+def answer_key(exam):
+    """
+    ``{question_id: correct_option}`` for ``exam`` – one query on a cache
+    miss, none on a hit.  Keyed by ``content_version`` so edited questions
+    are never scored against a stale key.
+    """
+    return cached(
+        answer_key_key(exam),
+        lambda: dict(
+            Question.objects.filter(exam_id=exam.pk).values_list("id", "correct_option")
+        ),
+        timeout=settings.QUESTION_PAPER_CACHE_TIMEOUT,
+    )
+
+
+def check_answers(key, answers):
+    """Return a list of problems with ``answers`` against ``key`` (empty if valid)."""
+    problems, seen = [], set()
+    for item in answers:
+        question_id = item["question"]
+        if question_id not in key:
+            problems.append(f"Question {question_id} does not belong to this exam.")
+        elif question_id in seen:
+            problems.append(f"Question {question_id} was answered more than once.")
+        seen.add(question_id)
+    return problems
+
+
+def score_answers(key, answers):
+    return sum(1 for item in answers if key.get(item["question"]) == item["selected_option"])
@@ -0,0 +1,392 @@
+import random
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from .stats import rebuild as rebuild_stats
+from .models import (
+    Answer,
+    CustomUser,
+    Exam,
+    ExamEligibility,
+    ExamSubmission,
+    Question,
+    Student,
+    Teacher,
+)
+
+SECTIONS = ["A", "B", "C", "D"]
+
+
+def seed_dataset(
+    teachers=2,
+    students_per_teacher=10,
+    class_exams_per_teacher=1,
+    school_exams=1,
+    questions_per_exam=5,
+    submission_rate=1.0,
+    password="pass",
+    seed=0,
+    prefix="seed",
+):
+    """
+    Build a small but complete school – teachers, their classes, school‑
+    and class‑level exams, questions and scored submissions – with bulk
+    inserts.  Deterministic for a given ``seed``.  Returns the created
+    objects keyed by type.
+    """
+    rng = random.Random(seed)
+    pwd_hash = make_password(password)
+    admin = CustomUser.objects.create(
+        username=f"{prefix}-admin", role="admin", password=pwd_hash,
+        is_staff=True, is_superuser=True,
+    )
+
+    # ---- teachers, one class each
+    teacher_users = CustomUser.objects.bulk_create(
+        CustomUser(username=f"{prefix}-t{i}", role="teacher", password=pwd_hash,
+                   first_name="Teacher", last_name=str(i))
+        for i in range(teachers)
+    )
+    teacher_objs = Teacher.objects.bulk_create(
+        Teacher(user=user, phone="000", subject_specialization="General",
+                employee_id=f"{prefix}-E{i}", date_of_joining=date(2020, 1, 1),
+                status="active")
+        for i, user in enumerate(teacher_users)
+    )
+    classes = {
+        t.id: (str(9 + i // len(SECTIONS)), SECTIONS[i % len(SECTIONS)])
+        for i, t in enumerate(teacher_objs)
+    }
+
+    # ---- students
+    student_users, specs = [], []
+    for t in teacher_objs:
+        for n in range(students_per_teacher):
+            username = f"{prefix}-s{t.id}-{n}"
+            student_users.append(
+                CustomUser(username=username, role="student", password=pwd_hash,
+                           first_name="Student", last_name=str(n))
+            )
+            specs.append((t, username))
+    CustomUser.objects.bulk_create(student_users)
+    student_objs = Student.objects.bulk_create(
+        Student(
+            user=user, phone="111", roll_number=username,
+            student_class="-".join(classes[t.id]),
+            standard=classes[t.id][0], section=classes[t.id][1],
+            date_of_birth=date(2010, 1, 1) + timedelta(days=rng.randrange(365)),
+            admission_date=date(2024, 6, 1), status="active", assigned_teacher=t,
+        )
+        for user, (t, username) in zip(student_users, specs)
+    )
+
+    # ---- exams + questions
+    start = timezone.now() - timedelta(minutes=1)
+    exams = [
+        Exam(title=f"School exam {i}", created_by=admin, scope="school",
+             target_standard=classes[teacher_objs[0].id][0] if teacher_objs else "9",
+             start_time=start, duration_minutes=60)
+        for i in range(school_exams)
+    ]
+    exams += [
+        Exam(title=f"Class exam {t.id}-{i}", created_by=t.user, assigned_teacher=t,
+             scope="class", target_class="-".join(classes[t.id]),
+             start_time=start, duration_minutes=60)
+        for t in teacher_objs
+        for i in range(class_exams_per_teacher)
+    ]
+    exams = Exam.objects.bulk_create(exams)
+    for exam in exams:
+        ExamEligibility.refresh_for_exam(exam)
+
+    questions = Question.objects.bulk_create(
+        Question(exam=exam, text=f"Question {n}", option1="A", option2="B",
+                 option3="C", option4="D", correct_option=rng.randint(1, 4))
+        for exam in exams
+        for n in range(questions_per_exam)
+    )
+    by_exam = {}
+    for q in questions:
+        by_exam.setdefault(q.exam_id, []).append(q)
+
+    # ---- submissions
+    submissions, picks = [], []
+    for exam in exams:
+        for student in student_objs:
+            if not exam.is_eligible(student) or rng.random() >= submission_rate:
+                continue
+            chosen = [(q, rng.randint(1, 4)) for q in by_exam.get(exam.id, [])]
+            submissions.append(ExamSubmission(
+                exam=exam, student=student,
+                score=sum(1 for q, opt in chosen if opt == q.correct_option),
+            ))
+            picks.append(chosen)
+    ExamSubmission.objects.bulk_create(submissions)
+    Answer.objects.bulk_create(
+        Answer(submission=sub, question=q, selected_option=opt)
+        for sub, chosen in zip(submissions, picks)
+        for q, opt in chosen
+    )
+    rebuild_stats([exam.id for exam in exams])
+
+    return {
+        "admin": admin,
+        "teachers": teacher_objs,
+        "students": student_objs,
+        "exams": exams,
+        "questions": questions,
+        "submissions": submissions,
+    }
+
+
+# -----------------------------------------------------------------------------------
+#  Large‑scale generator (manage.py generate_school_data)
+# -----------------------------------------------------------------------------------
+FIRST_NAMES = [
+    "Aarav", "Ada", "Aisha", "Alan", "Amara", "Ben", "Chen", "Diya", "Elena", "Farah",
+    "Grace", "Hiro", "Ivan", "Jia", "Kofi", "Lena", "Maya", "Nikhil", "Omar", "Priya",
+    "Quinn", "Rahul", "Sara", "Tariq", "Uma", "Vikram", "Wei", "Yusuf", "Zara", "Zoe",
+]
+LAST_NAMES = [
+    "Ahmed", "Brown", "Chopra", "Das", "Evans", "Fernandez", "Garcia", "Haddad", "Iyer",
+    "Johnson", "Khan", "Lee", "Menon", "Nair", "Okafor", "Patel", "Qureshi", "Rao",
+    "Singh", "Thomas", "Usman", "Varghese", "Wang", "Xavier", "Yadav", "Zhang",
+]
+
+
+def build_classes(count, rng):
+    """
+    ``count`` classes spread over standards 1–12, sections A, B, … with a
+    relative size weight each (class sizes vary ±15 % around the mean).
+    """
+    classes = []
+    for i in range(count):
+        standard = str(1 + i % 12)
+        n = i // 12
+        section = chr(ord("A") + n % 26) + (str(n // 26) if n >= 26 else "")
+        classes.append((standard, section, max(0.5, rng.gauss(1.0, 0.15))))
+    return classes
+
+
+def _student_chunk(task):
+    seed, chunk_no, start, class_ids = task
+    rng = random.Random(f"{seed}:students:{chunk_no}")
+    rows = []
+    for offset, class_idx in enumerate(class_ids):
+        n = start + offset
+        rows.append((
+            n,
+            class_idx,
+            rng.choice(FIRST_NAMES),
+            rng.choice(LAST_NAMES),
+            date(2006, 1, 1) + timedelta(days=rng.randrange(12 * 365)),
+        ))
+    return rows
+
+
+def _submission_chunk(task):
+    """
+    Pick answers for one slice of an exam's students.  Stronger students
+    (a per‑student ability drawn from the seed) answer correctly more often.
+    """
+    seed, tag, key, student_ids, rate = task
+    rng = random.Random(f"{seed}:subs:{tag}")
+    out = []
+    for student_id in student_ids:
+        if rng.random() >= rate:
+            continue
+        ability = min(0.95, max(0.1, rng.gauss(0.6, 0.15)))
+        picks = []
+        score = 0
+        for question_id, correct in key:
+            if rng.random() < ability:
+                option = correct
+            else:
+                option = rng.randint(1, 4)
+            score += option == correct
+            picks.append((question_id, option))
+        out.append((student_id, score, picks))
+    return out
+
+
+def _parallel_map(func, tasks, workers):
+    if workers <= 1:
+        return map(func, tasks)
+    from concurrent.futures import ProcessPoolExecutor
+    from .provisioning import _init_worker
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+    def results():
+        with pool:
+            yield from pool.map(func, tasks, chunksize=1)
+    return results()
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def generate_school(
+    teachers=100,
+    students=4000,
+    school_exams_per_standard=1,
+    class_exams_per_teacher=2,
+    questions_per_exam=25,
+    submission_rate=0.9,
+    password="pass",
+    seed=0,
+    workers=1,
+    batch_size=5000,
+    prefix="gen",
+    log=lambda msg: None,
+):
+    """
+    Generate a realistic school at scale.  Row contents are drawn per chunk
+    from ``seed`` (never from worker scheduling), so the same arguments give
+    the same data whatever ``workers`` is.  Everyone shares one precomputed
+    password hash.
+    """
+    from django.db import connection, transaction
+
+    rng = random.Random(seed)
+    pwd_hash = make_password(password)
+    counts = {}
+
+    with transaction.atomic():
+        admin = CustomUser.objects.create(
+            username=f"{prefix}-admin", role="admin", password=pwd_hash,
+            is_staff=True, is_superuser=True,
+        )
+
+        # ---- teachers, one class each
+        classes = build_classes(teachers, rng)
+        t_users = CustomUser.objects.bulk_create(
+            (CustomUser(username=f"{prefix}-t{i}", role="teacher", password=pwd_hash,
+                        first_name=rng.choice(FIRST_NAMES), last_name=rng.choice(LAST_NAMES))
+             for i in range(teachers)),
+            batch_size=batch_size,
+        )
+        teacher_objs = Teacher.objects.bulk_create(
+            (Teacher(user=u, phone=f"9{i:09d}", subject_specialization=rng.choice(
+                        ["Maths", "Science", "English", "History", "Geography"]),
+                     employee_id=f"{prefix}-E{i}", date_of_joining=date(2015, 6, 1)
+                     + timedelta(days=rng.randrange(3000)), status="active")
+             for i, u in enumerate(t_users)),
+            batch_size=batch_size,
+        )
+        counts["teachers"] = len(teacher_objs)
+        log(f"teachers: {len(teacher_objs)}")
+
+        # ---- students, spread over classes by weight
+        weights = [w for _, _, w in classes]
+        class_of = rng.choices(range(len(classes)), weights=weights, k=students)
+        tasks = [
+            (seed, n, start, class_of[start:start + batch_size])
+            for n, start in enumerate(range(0, students, batch_size))
+        ]
+        members = [[] for _ in classes]
+        for rows in _parallel_map(_student_chunk, tasks, workers):
+            users = CustomUser.objects.bulk_create(
+                CustomUser(username=f"{prefix}-s{n}", role="student", password=pwd_hash,
+                           first_name=first, last_name=last)
+                for n, _, first, last, _ in rows
+            )
+            created = Student.objects.bulk_create(
+                Student(
+                    user=user, phone=f"8{n:09d}", roll_number=f"{prefix}-R{n}",
+                    student_class=f"{classes[c][0]}-{classes[c][1]}",
+                    standard=classes[c][0], section=classes[c][1],
+                    date_of_birth=dob, admission_date=date(2024, 6, 1),
+                    status="active", assigned_teacher=teacher_objs[c],
+                )
+                for user, (n, c, _, _, dob) in zip(users, rows)
+            )
+            for student, (_, c, _, _, _) in zip(created, rows):
+                members[c].append(student.id)
+        counts["students"] = students
+        log(f"students: {students}")
+
+        # ---- exams
+        start = timezone.now() - timedelta(days=30)
+        standards = sorted({s for s, _, _ in classes}, key=int)
+        exams = [
+            Exam(title=f"Std {std} term {i + 1}", created_by=admin, scope="school",
+                 target_standard=std, start_time=start + timedelta(days=i),
+                 duration_minutes=60)
+            for std in standards
+            for i in range(school_exams_per_standard)
+        ]
+        exams += [
+            Exam(title=f"{t.subject_specialization} quiz {i + 1}", created_by=t.user,
+                 assigned_teacher=t, scope="class",
+                 target_class=f"{classes[c][0]}-{classes[c][1]}",
+                 start_time=start + timedelta(days=i, hours=c % 8), duration_minutes=30)
+            for c, t in enumerate(teacher_objs)
+            for i in range(class_exams_per_teacher)
+        ]
+        exams = Exam.objects.bulk_create(exams, batch_size=batch_size)
+        for exam in exams:
+            ExamEligibility.refresh_for_exam(exam)
+        counts["exams"] = len(exams)
+        log(f"exams: {len(exams)}")
+
+        # ---- questions
+        questions = Question.objects.bulk_create(
+            (Question(exam=exam, text=f"{exam.title} – question {n + 1}",
+                      option1="A", option2="B", option3="C", option4="D",
+                      correct_option=rng.randint(1, 4))
+             for exam in exams
+             for n in range(questions_per_exam)),
+            batch_size=batch_size,
+        )
+        keys = {}
+        for q in questions:
+            keys.setdefault(q.exam_id, []).append((q.id, q.correct_option))
+        counts["questions"] = len(questions)
+        log(f"questions: {len(questions)}")
+
+        # ---- submissions + answers
+        by_standard = {}
+        for c, (std, _, _) in enumerate(classes):
+            by_standard.setdefault(std, []).extend(members[c])
+        class_index = {f"{s}-{sec}": c for c, (s, sec, _) in enumerate(classes)}
+        tasks, owners = [], []
+        for exam_no, exam in enumerate(exams):
+            if exam.scope == "school":
+                audience = by_standard.get(exam.target_standard, [])
+            else:
+                audience = members[class_index[exam.target_class]]
+            per_chunk = max(1, batch_size // max(questions_per_exam, 1))
+            for chunk_no, chunk in enumerate(_chunks(audience, per_chunk)):
+                tasks.append((seed, f"{exam_no}:{chunk_no}", keys.get(exam.id, []),
+                              chunk, submission_rate))
+                owners.append(exam.id)
+
+        answer_sql = "INSERT INTO {} ({}, {}, {}) VALUES (%s, %s, %s)".format(
+            connection.ops.quote_name(Answer._meta.db_table),
+            *(connection.ops.quote_name(Answer._meta.get_field(f).column)
+              for f in ("submission", "question", "selected_option")),
+        )
+        counts["submissions"] = counts["answers"] = 0
+        for exam_id, results in zip(owners, _parallel_map(_submission_chunk, tasks, workers)):
+            subs = ExamSubmission.objects.bulk_create(
+                ExamSubmission(exam_id=exam_id, student_id=student_id, score=score)
+                for student_id, score, _ in results
+            )
+            answer_rows = [
+                (sub.id, question_id, option)
+                for sub, (_, _, picks) in zip(subs, results)
+                for question_id, option in picks
+            ]
+            with connection.cursor() as cursor:
+                cursor.executemany(answer_sql, answer_rows)
+            counts["submissions"] += len(subs)
+            counts["answers"] += len(answer_rows)
+        log(f"submissions: {counts['submissions']}, answers: {counts['answers']}")
+        rebuild_stats([exam.id for exam in exams])
+
+    return counts
@@ -1,9 +1,12 @@
 from rest_framework import serializers
+from django.db import transaction
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.utils.http import urlsafe_base64_decode
 from django.utils.encoding import force_str
 
-from .models import CustomUser, Teacher, Student,Exam, ExamSubmission, Question, Answer
+from .models import CustomUser, Teacher, Student,Exam, ExamSubmission, ExamStats, Question, Answer, Job, PendingSubmission
+from .profiles import get_profile
+from .scoring import answer_key, check_answers, score_answers
 
 class TeacherUserSerializer(serializers.ModelSerializer):
 
@@ -57,8 +60,8 @@ class TeacherSerializer(serializers.ModelSerializer):
     user = TeacherUserSerializer()
 
     class Meta:
-        model  = Teacher
-        fields = "__all__"
+        model   = Teacher
+        exclude = ["classes_version"]
 
     def create(self, validated):
         user_data = validated.pop("user")
@@ -171,17 +174,14 @@ class TeacherExamCreateSerializer(serializers.ModelSerializer):
                 {"target_class": "Class‑level exam requires target_class."}
             )
 
-        valid_classes = Student.objects.filter(
-            assigned_teacher=user.teacher
-        ).values_list("student_class", flat=True).distinct()
-
-        if target_cls not in valid_classes:
+        teacher = get_profile(self.context["request"])
+        if teacher is None or target_cls not in teacher.classes_taught()["classes"]:
             raise serializers.ValidationError(
                 {"target_class": "You can create exams only for classes you teach."}
             )
 
         attrs["scope"]            = "class"
-        attrs["assigned_teacher"] = user.teacher
+        attrs["assigned_teacher"] = teacher
         return attrs
 
     def create(self, attrs):
@@ -189,6 +189,9 @@ class TeacherExamCreateSerializer(serializers.ModelSerializer):
 
 
 class AnswerSerializer(serializers.ModelSerializer):
+    # plain id – membership is checked against the exam's answer key in one go
+    question = serializers.IntegerField()
+
     class Meta:
         model  = Answer
         fields = ["question", "selected_option"]
@@ -211,6 +214,58 @@ class AnswerResultSerializer(serializers.ModelSerializer):
         ]
 
 
+class ReportCardExamSerializer(serializers.ModelSerializer):
+    """
+    One exam on a report card; expects the annotations and prefetch from
+    ``api.reports.report_card_exams``.
+    """
+    exam              = serializers.IntegerField(source="id")
+    score             = serializers.IntegerField(allow_null=True)
+    max_score         = serializers.IntegerField()
+    class_rank        = serializers.SerializerMethodField()
+    class_submissions = serializers.IntegerField()
+    submitted_at      = serializers.SerializerMethodField()
+    answers           = serializers.SerializerMethodField()
+
+    class Meta:
+        model  = Exam
+        fields = [
+            "exam", "title", "scope", "start_time",
+            "score", "max_score", "class_rank", "class_submissions",
+            "submitted_at", "answers",
+        ]
+
+    def _submission(self, obj):
+        return obj.own_submissions[0] if obj.own_submissions else None
+
+    def get_class_rank(self, obj):
+        return obj.class_rank if obj.score is not None else None
+
+    def get_submitted_at(self, obj):
+        sub = self._submission(obj)
+        return serializers.DateTimeField().to_representation(sub.submitted_at) if sub else None
+
+    def get_answers(self, obj):
+        sub = self._submission(obj)
+        return AnswerResultSerializer(sub.answers.all(), many=True).data if sub else []
+
+
+class ReportCardSerializer(serializers.ModelSerializer):
+    student  = serializers.IntegerField(source="id")
+    name     = serializers.SerializerMethodField()
+    exams    = serializers.SerializerMethodField()
+
+    class Meta:
+        model  = Student
+        fields = ["student", "name", "roll_number", "student_class", "exams"]
+
+    def get_name(self, obj):
+        return obj.user.get_full_name() or obj.user.username
+
+    def get_exams(self, obj):
+        return ReportCardExamSerializer(self.context["exams"], many=True).data
+
+
 class ExamSubmissionSerializer(serializers.ModelSerializer):
     answers = AnswerSerializer(many=True, write_only=True)
 
@@ -219,28 +274,70 @@ class ExamSubmissionSerializer(serializers.ModelSerializer):
         fields = ["id", "exam", "answers", "score"]
         read_only_fields = ["id", "score"]
 
-    def create(self, validated_data):
+    def validate(self, attrs):
+        self._answer_key = answer_key(attrs["exam"])
+        problems = check_answers(self._answer_key, attrs["answers"])
+        if problems:
+            raise serializers.ValidationError({"answers": problems})
+        return attrs
 
+    @transaction.atomic
+    def create(self, validated_data):
         answers_data = validated_data.pop("answers")
-        student      = validated_data["student"]          
-        submission = ExamSubmission.objects.create(**validated_data)
-        answers = [
+        submission = ExamSubmission.objects.create(
+            score=score_answers(self._answer_key, answers_data),
+            **validated_data,
+        )
+        Answer.objects.bulk_create(
             Answer(
                 submission=submission,
-                question=item["question"],
+                question_id=item["question"],
                 selected_option=item["selected_option"],
             )
             for item in answers_data
-        ]
-        Answer.objects.bulk_create(answers)
-
-        submission.score = sum(
-            1 for ans in answers if ans.selected_option == ans.question.correct_option
         )
-        submission.save()
+        ExamStats.record([
+            (submission, [(item["question"], item["selected_option"]) for item in answers_data])
+        ])
         return submission
 
 
+class QueuedSubmissionSerializer(serializers.ModelSerializer):
+    """
+    Write‑behind submission: only the payload shape is checked here, the
+    answer key is applied later by the flusher.
+    """
+    answers = AnswerSerializer(many=True)
+    score   = serializers.IntegerField(source="submission.score", read_only=True, default=None)
+
+    class Meta:
+        model  = PendingSubmission
+        fields = ["receipt", "exam", "answers", "status", "score", "error", "received_at"]
+        read_only_fields = ["receipt", "status", "score", "error", "received_at"]
+
+
+class JobSerializer(serializers.ModelSerializer):
+    progress     = serializers.IntegerField(read_only=True)
+    download_url = serializers.SerializerMethodField()
+
+    def get_download_url(self, obj):
+        if obj.status != "done" or not obj.result_file:
+            return None
+        request = self.context.get("request")
+        path = f"/api/jobs/{obj.pk}/download"
+        return request.build_absolute_uri(path) if request else path
+
+    class Meta:
+        model  = Job
+        fields = [
+            "id", "kind", "status", "progress",
+            "processed", "total", "result", "error",
+            "created_at", "started_at", "finished_at",
+            "download_url",
+        ]
+        read_only_fields = fields
+
+
 class PasswordResetRequestSerializer(serializers.Serializer):
     email = serializers.EmailField()
 
@@ -0,0 +1,113 @@
+from django.apps import apps as global_apps
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+
+OPTION_FIELDS = ("option1", "option2", "option3", "option4")
+
+
+def fresh_stats(exam_ids=None, apps=global_apps):
+    """
+    Recompute what ``ExamStats`` / ``QuestionStats`` should hold from the
+    raw submissions and answers.  Returns ``(exams, questions)``:
+    ``{exam_id: {field: value}}`` and ``{question_id: {field: value}}``,
+    with zero rows for exams and questions nobody has answered yet.
+    ``apps`` lets the data migration pass its historical registry.
+    """
+    Exam = apps.get_model("api", "Exam")
+    ExamSubmission = apps.get_model("api", "ExamSubmission")
+    Question = apps.get_model("api", "Question")
+
+    exam_qs = Exam.objects.all()
+    question_qs = Question.objects.all()
+    if exam_ids is not None:
+        exam_qs = exam_qs.filter(id__in=exam_ids)
+        question_qs = question_qs.filter(exam_id__in=exam_ids)
+
+    exams = {
+        exam_id: {"submissions": 0, "score_sum": 0, "score_sq_sum": 0}
+        for exam_id in exam_qs.values_list("id", flat=True)
+    }
+    submissions = ExamSubmission.objects.all()
+    if exam_ids is not None:
+        submissions = submissions.filter(exam_id__in=exam_ids)
+    totals = (
+        submissions.values("exam_id")
+        .annotate(
+            n=Count("id"),
+            total=Sum("score"),
+            total_sq=Sum(F("score") * F("score")),
+        )
+        .order_by()
+    )
+    for row in totals:
+        exams[row["exam_id"]] = {
+            "submissions": row["n"],
+            "score_sum": row["total"] or 0,
+            "score_sq_sum": row["total_sq"] or 0,
+        }
+
+    questions = {
+        row.pop("id"): row
+        for row in question_qs.values("id", "exam_id").annotate(
+            attempts=Count("answer"),
+            **{
+                field: Count("answer", filter=Q(answer__selected_option=n))
+                for n, field in enumerate(OPTION_FIELDS, start=1)
+            },
+        ).order_by()
+    }
+    return exams, questions
+
+
+def rebuild(exam_ids=None, apps=global_apps):
+    """Replace the stored statistics with freshly computed ones."""
+    ExamStats = apps.get_model("api", "ExamStats")
+    QuestionStats = apps.get_model("api", "QuestionStats")
+
+    with transaction.atomic():
+        exams, questions = fresh_stats(exam_ids, apps)
+        for model in (ExamStats, QuestionStats):
+            stale = model.objects.all()
+            if exam_ids is not None:
+                stale = stale.filter(exam_id__in=exam_ids)
+            stale.delete()
+        ExamStats.objects.bulk_create(
+            [ExamStats(exam_id=exam_id, **row) for exam_id, row in exams.items()],
+            batch_size=1000,
+        )
+        QuestionStats.objects.bulk_create(
+            [QuestionStats(question_id=qid, **row) for qid, row in questions.items()],
+            batch_size=1000,
+        )
+    return len(exams), len(questions)
+
+
+def drift(exam_ids=None):
+    """
+    Compare stored statistics with fresh ones; returns a list of
+    human‑readable differences (empty when everything matches).  A
+    missing row counts as all zeros.
+    """
+    ExamStats = global_apps.get_model("api", "ExamStats")
+    QuestionStats = global_apps.get_model("api", "QuestionStats")
+
+    exams, questions = fresh_stats(exam_ids)
+    problems = []
+    for model, key, expected in (
+        (ExamStats, "exam_id", exams),
+        (QuestionStats, "question_id", questions),
+    ):
+        fields = [f for f in next(iter(expected.values()), {}) if f != "exam_id"]
+        rows = model.objects.all()
+        if exam_ids is not None:
+            rows = rows.filter(exam_id__in=exam_ids)
+        stored = {row.pop(key): row for row in rows.values(key, *fields)}
+        label = key.replace("_id", "")
+        for pk, want in expected.items():
+            have = stored.get(pk, dict.fromkeys(fields, 0))
+            for field in fields:
+                if have[field] != want[field]:
+                    problems.append(
+                        f"{label} {pk}: {field} is {have[field]}, expected {want[field]}"
+                    )
+    return problems
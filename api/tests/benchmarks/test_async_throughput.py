@@ -0,0 +1,103 @@
+"""
+Requests/sec of one worker on the WSGI (DRF) path vs the ASGI path
+(api/async_views.py) for the hot read endpoints:
+
+    BENCH_REQUESTS=2000 BENCH_CONCURRENCY=100 pytest -m benchmark -s \
+        api/tests/benchmarks/test_async_throughput.py
+
+A sync worker serves one request at a time, so its requests run back to
+back; the ASGI application gets BENCH_CONCURRENCY in flight on one event
+loop.  Every SQL statement is delayed by BENCH_DB_LATENCY_MS (default 2)
+to stand in for the network round trip to PostgreSQL – set it to 0 to
+measure the local SQLite file alone.
+"""
+import asyncio
+import os
+import time
+import pytest
+from django.db.backends import utils
+from django.test import Client
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+from school_project.asgi import application
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db(transaction=True)]
+
+REQUESTS = int(os.environ.get("BENCH_REQUESTS", "600"))
+CONCURRENCY = int(os.environ.get("BENCH_CONCURRENCY", "50"))
+DB_LATENCY = float(os.environ.get("BENCH_DB_LATENCY_MS", "2")) / 1000
+
+def wsgi_rps(path, token):
+    client = Client()
+    headers = {"Authorization": token}
+    assert client.get(path, headers=headers).status_code == 200
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        client.get(path, headers=headers)
+    return REQUESTS / (time.perf_counter() - started)
+
+async def asgi_get(path, token):
+    url, _, query = path.partition("?")
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": url, "raw_path": url.encode(),
+        "query_string": query.encode(), "root_path": "",
+        "headers": [(b"host", b"testserver"), (b"authorization", token.encode())],
+        "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+    }
+    messages, received = [], False
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Future()          # the client never disconnects
+
+    async def send(message):
+        messages.append(message)
+
+    await application(scope, receive, send)
+    return messages[0]["status"]
+
+def asgi_rps(path, token):
+    async def client(count):
+        for _ in range(count):
+            await asgi_get(path, token)
+
+    async def run():
+        assert await asgi_get(path, token) == 200
+        started = time.perf_counter()
+        await asyncio.gather(*(client(REQUESTS // CONCURRENCY) for _ in range(CONCURRENCY)))
+        return (REQUESTS // CONCURRENCY * CONCURRENCY) / (time.perf_counter() - started)
+    return asyncio.run(run())
+
+def test_async_vs_sync_throughput(seeded, monkeypatch):
+    data = seeded(teachers=4, students_per_teacher=25, questions_per_exam=20)
+    exam = data["exams"][0]
+    student = next(s for s in data["students"] if exam.is_eligible(s))
+    student_token = f"Bearer {AccessToken.for_user(student.user)}"
+    teacher_token = f"Bearer {AccessToken.for_user(data['teachers'][0].user)}"
+
+    execute = utils.CursorWrapper._execute
+
+    def slow_execute(self, *args, **kwargs):
+        time.sleep(DB_LATENCY)
+        return execute(self, *args, **kwargs)
+    if DB_LATENCY:
+        monkeypatch.setattr(utils.CursorWrapper, "_execute", slow_execute)
+
+    cases = [
+        ("exams", reverse("exam-list"), reverse("async-exam-list"), student_token),
+        ("questions", reverse("exam-questions", args=[exam.id]),
+         reverse("async-exam-questions", args=[exam.id]), student_token),
+        ("my_marks", reverse("student-my-marks"), reverse("async-my-marks"), student_token),
+        ("student_results", reverse("teacher-student-results"),
+         reverse("async-student-results"), teacher_token),
+    ]
+    print(f"\n{REQUESTS} requests, {CONCURRENCY} in flight on ASGI, "
+          f"{DB_LATENCY * 1000:.1f} ms per query")
+    for name, sync_path, async_path, token in cases:
+        sync = wsgi_rps(sync_path, token)
+        concurrent = asgi_rps(async_path, token)
+        print(f"  {name:16} WSGI {sync:8.0f} req/s   ASGI {concurrent:8.0f} req/s   x{concurrent / sync:.1f}")
@@ -0,0 +1,50 @@
+import os
+import statistics
+import time
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+ROUNDS = int(os.environ.get("BENCH_ROUNDS", "20"))
+SIZES = {
+    "S": dict(teachers=2, students_per_teacher=10, questions_per_exam=10),
+    "M": dict(teachers=8, students_per_teacher=40, questions_per_exam=25),
+    "L": dict(teachers=16, students_per_teacher=120, questions_per_exam=50),
+}
+
+def endpoints(d):
+    student = d["students"][-1]
+    teacher = d["teachers"][-1]
+    exam = next(e for e in d["exams"] if e.is_eligible(student))
+    return {
+        "students list": (d["admin"], reverse("student-list") + "?page_size=100"),
+        "my_marks": (student.user, reverse("student-my-marks")),
+        "student_results": (teacher.user, reverse("teacher-student-results")),
+        "exam questions": (student.user, reverse("exam-questions", args=[exam.id])),
+        "students export": (d["admin"], reverse("student-export-csv")),
+    }
+
+def timed_get(client, url):
+    started = time.perf_counter()
+    resp = client.get(url)
+    if getattr(resp, "streaming", False):
+        b"".join(resp.streaming_content)
+    assert resp.status_code == 200
+    return time.perf_counter() - started
+
+@pytest.mark.parametrize("size", list(SIZES))
+def test_endpoint_latency(size, seeded):
+    data = seeded(prefix=f"bench{size}", **SIZES[size])
+    print(f"\n[{size}] {len(data['students'])} students, {len(data['submissions'])} submissions")
+    for name, (user, url) in endpoints(data).items():
+        client = APIClient()
+        client.force_authenticate(user)
+        samples = []
+        for _ in range(ROUNDS):
+            cache.clear()
+            samples.append(timed_get(client, url))
+        print(f"  {name:<16} median={statistics.median(samples) * 1000:7.2f}ms "
+              f"max={max(samples) * 1000:7.2f}ms")
@@ -0,0 +1,102 @@
+"""
+Plan and latency of the hot lookups with and without their composite
+index.  Runs on whatever DATABASES points at (SQLite or PostgreSQL):
+
+    BENCH_STUDENTS=20000 BENCH_TEACHERS=400 pytest -m benchmark -s \
+        api/tests/benchmarks/test_index_plans.py
+
+The defaults generate ~1.3M answers.
+"""
+import os
+import time
+import pytest
+from django.db import connection
+from api.models import Answer, Exam, ExamSubmission, Student
+from api.seeding import generate_school
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+STUDENTS = int(os.environ.get("BENCH_STUDENTS", "20000"))
+TEACHERS = int(os.environ.get("BENCH_TEACHERS", "400"))
+QUESTIONS = int(os.environ.get("BENCH_QUESTIONS", "25"))
+REPEAT = int(os.environ.get("BENCH_REPEAT", "200"))
+
+def best_ms(sql, params):
+    timings = []
+    with connection.cursor() as cursor:
+        for _ in range(REPEAT):
+            started = time.perf_counter()
+            cursor.execute(sql, params)
+            cursor.fetchall()
+            timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+def measure(query, phase):
+    """
+    Best latency and plan of ``query``.  The SQL is tagged with ``phase``
+    so sqlite3's statement cache can't hand back a plan compiled before
+    the index was dropped.
+    """
+    sql, params = query().query.sql_with_params()
+    sql = f"{sql} /* {phase} */"
+    with connection.cursor() as cursor:
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+        plan = " ".join(" ".join(map(str, row)) for row in cursor.fetchall())
+    return best_ms(sql, params), plan
+
+def without_index(model, name):
+    index = next(i for i in model._meta.indexes if i.name == name)
+    # plain DDL on the test connection – the schema editor context refuses
+    # to run on SQLite inside the test transaction
+    editor = connection.schema_editor()
+
+    class Dropped:
+        def __enter__(self):
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+
+        def __exit__(self, *exc):
+            with connection.cursor() as cursor:
+                cursor.execute(str(index.create_sql(model, editor)))
+    return Dropped()
+
+def test_index_plans_and_latency(settings):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    counts = generate_school(teachers=TEACHERS, students=STUDENTS,
+                             questions_per_exam=QUESTIONS, workers=os.cpu_count() or 1)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")   # both SQLite and PostgreSQL plan from statistics
+
+    student = Student.objects.order_by("-id").first()
+    teacher_id = student.assigned_teacher_id
+    submission = ExamSubmission.objects.filter(student=student).first()
+    question_id = submission.answers.values_list("question_id", flat=True).first()
+
+    cases = [
+        (Student, "student_teacher_class_idx",
+         lambda: Student.objects.filter(assigned_teacher_id=teacher_id,
+                                        student_class=student.student_class).values("id")),
+        (Exam, "exam_scope_standard_idx",
+         lambda: Exam.objects.filter(scope="school", target_standard=student.standard).values("id")),
+        (Exam, "exam_scope_teacher_class_idx",
+         lambda: Exam.objects.filter(scope="class", assigned_teacher_id=teacher_id,
+                                     target_class=student.student_class).values("id")),
+        (ExamSubmission, "submission_student_exam_idx",
+         lambda: ExamSubmission.objects.filter(student=student).order_by("exam_id")
+         .values("exam_id", "score")),
+        (Answer, "answer_submission_cover_idx",
+         lambda: Answer.objects.filter(submission=submission)
+         .values("question_id", "selected_option")),
+        (Answer, "answer_question_option_idx",
+         lambda: Answer.objects.filter(question_id=question_id, selected_option=1).values("id")),
+    ]
+
+    print(f"\n{connection.vendor}: {counts}")
+    for model, name, query in cases:
+        with_index, plan = measure(query, "with")
+        with without_index(model, name):
+            without, plan_without = measure(query, "without")
+        print(f"\n{name}: {with_index:.3f} ms with, {without:.3f} ms without"
+              f"\n  with:    {plan}\n  without: {plan_without}")
+        assert name in plan
+        assert name not in plan_without
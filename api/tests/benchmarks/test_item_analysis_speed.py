@@ -0,0 +1,27 @@
+import os
+import time
+import numpy as np
+import pytest
+
+from api.item_analysis import analyse
+
+pytestmark = pytest.mark.benchmark
+
+STUDENTS = int(os.environ.get("BENCH_STUDENTS", "50000"))
+QUESTIONS = int(os.environ.get("BENCH_QUESTIONS", "100"))
+
+def test_item_analysis_speed():
+    rng = np.random.default_rng(0)
+    key = rng.integers(1, 5, size=QUESTIONS, dtype=np.int8)
+    ability = rng.random((STUDENTS, 1))
+    guesses = rng.integers(1, 5, size=(STUDENTS, QUESTIONS), dtype=np.int8)
+    selections = np.where(rng.random((STUDENTS, QUESTIONS)) < ability, key, guesses)
+
+    analyse(selections[:100], key)              # warm up
+    started = time.perf_counter()
+    result = analyse(selections, key)
+    elapsed = time.perf_counter() - started
+
+    print(f"\nitem analysis {STUDENTS}×{QUESTIONS}: {elapsed * 1000:.0f} ms, KR-20 {result['kr20']}")
+    assert result["students"] == STUDENTS
+    assert elapsed < 1.0
@@ -0,0 +1,43 @@
+import os
+import time
+import pytest
+from rest_framework.renderers import JSONRenderer
+from api.lean import FastJSONRenderer, student_rows, submission_rows
+from api.models import ExamSubmission, Student
+from api.serializers import ExamSubmissionSerializer, StudentSerializer
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+ROWS = int(os.environ.get("BENCH_ROWS", "10000"))
+ROUNDS = int(os.environ.get("BENCH_ROUNDS", "5"))
+
+def best_ms(build):
+    best = None
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        body = build()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, body
+
+def test_lean_rows_vs_serializers(seeded):
+    seeded(prefix="lean", teachers=1, students_per_teacher=ROWS, school_exams=1,
+           class_exams_per_teacher=0, questions_per_exam=1)
+    subs = ExamSubmission.objects.order_by("exam_id", "student_id")
+    students = Student.objects.order_by("id")
+    cases = {
+        "submissions": (
+            lambda: JSONRenderer().render(ExamSubmissionSerializer(subs.select_related("exam", "student"), many=True).data),
+            lambda: FastJSONRenderer().render(submission_rows(subs)),
+        ),
+        "students": (
+            lambda: JSONRenderer().render(StudentSerializer(students.select_related("user"), many=True).data),
+            lambda: FastJSONRenderer().render(student_rows(students)),
+        ),
+    }
+    for name, (serializer_path, lean_path) in cases.items():
+        slow, expected = best_ms(serializer_path)
+        fast, body = best_ms(lean_path)
+        assert body == expected
+        print(f"\n{name} x{ROWS}: serializer+json={slow:.1f}ms lean+orjson={fast:.1f}ms ({slow / fast:.1f}x)")
+        assert fast < slow
@@ -0,0 +1,31 @@
+import os
+import time
+import pytest
+from api.models import CustomUser
+from api.provisioning import hash_passwords
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+USERS = int(os.environ.get("BENCH_USERS", "400"))
+
+def worker_counts():
+    cores = os.cpu_count() or 1
+    counts = {1, 2, 4, cores}
+    return sorted(c for c in counts if c <= max(cores, 2))
+
+@pytest.mark.parametrize("workers", worker_counts())
+def test_hash_throughput(workers):
+    passwords = [f"pw-{i}" for i in range(USERS)]
+    started = time.perf_counter()
+    hashes = hash_passwords(passwords, workers=workers)
+    elapsed = time.perf_counter() - started
+    assert len(hashes) == USERS
+    print(f"\nhash_passwords workers={workers}: {USERS / elapsed:,.0f} users/sec")
+
+@pytest.mark.parametrize("workers", worker_counts())
+def test_bulk_provision_throughput(workers):
+    rows = [{"username": f"bench{workers}-{i}", "password": "pw"} for i in range(USERS)]
+    started = time.perf_counter()
+    CustomUser.objects.bulk_provision(rows, role="student", workers=workers)
+    elapsed = time.perf_counter() - started
+    print(f"\nbulk_provision workers={workers}: {USERS / elapsed:,.0f} users/sec")
@@ -0,0 +1,52 @@
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+from api.models import Question
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db(transaction=True)]
+
+REQUESTS = int(os.environ.get("BENCH_REQUESTS", "600"))
+CONCURRENCY = int(os.environ.get("BENCH_CONCURRENCY", "16"))
+QUESTIONS = int(os.environ.get("BENCH_QUESTIONS", "100"))
+
+def fetch_latencies(user, url):
+    def worker(_):
+        client = APIClient()
+        client.force_authenticate(user)
+        timings = []
+        try:
+            for _ in range(REQUESTS // CONCURRENCY):
+                started = time.perf_counter()
+                assert client.get(url).status_code == 200
+                timings.append(time.perf_counter() - started)
+        finally:
+            connection.close()
+        return timings
+
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        return sorted(t for chunk in pool.map(worker, range(CONCURRENCY)) for t in chunk)
+
+def percentile(samples, pct):
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))] * 1000
+
+@pytest.mark.parametrize("backend", ["dummy", "locmem"])
+def test_question_paper_latency(backend, settings, student_user, student, exam):
+    if backend == "dummy":
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    Question.objects.bulk_create(
+        Question(exam=exam, text=f"Q{i}", option1="a", option2="b",
+                 option3="c", option4="d", correct_option=1)
+        for i in range(QUESTIONS)
+    )
+    url = reverse("exam-questions", args=[exam.id])
+    samples = fetch_latencies(student_user, url)
+    print(
+        f"\nquestions paper [{backend}] {len(samples)} req x{CONCURRENCY}: "
+        f"p50={percentile(samples, 50):.1f}ms p99={percentile(samples, 99):.1f}ms "
+        f"mean={statistics.mean(samples) * 1000:.1f}ms"
+    )
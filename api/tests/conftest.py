@@ -2,12 +2,19 @@
 import csv
 from datetime import timedelta
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.test import APIClient
 from api.models import CustomUser, Teacher, Student, Exam, Question
 
 pytestmark = pytest.mark.django_db
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
 @pytest.fixture
 def user_factory():
     def _create(username, role="admin", password="pass", **extra):
@@ -93,6 +100,8 @@ def exam(teacher_user, teacher):
         title="Algebra Quiz",
         created_by=teacher_user,
         assigned_teacher=teacher,
+        scope="class",
+        target_class="10-A",
         start_time=timezone.now() - timedelta(minutes=1),
         duration_minutes=5,
     )
@@ -151,3 +160,10 @@ def sample_csv(tmp_path):
         writer.writerow(header)
         writer.writerows(rows)
     return path
+
+@pytest.fixture
+def seeded(settings):
+    """Factory around api.seeding.seed_dataset with a cheap password hasher."""
+    from api.seeding import seed_dataset
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    return seed_dataset
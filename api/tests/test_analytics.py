@@ -0,0 +1,71 @@
+import statistics
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from api.models import Answer, ExamSubmission
+
+pytestmark = pytest.mark.django_db
+
+def school_exam(data):
+    return next(e for e in data["exams"] if e.scope == "school")
+
+def test_analytics_matches_python_statistics(seeded, auth_client):
+    data = seeded(teachers=2, students_per_teacher=7, questions_per_exam=4, seed=3)
+    exam = school_exam(data)
+    resp = auth_client(data["admin"]).get(reverse("exam-analytics", args=[exam.id]), {"top": 3})
+    assert resp.status_code == 200
+
+    scores = sorted(ExamSubmission.objects.filter(exam=exam).values_list("score", flat=True))
+    summary = resp.data["summary"]
+    assert summary["submissions"] == len(scores) == 14
+    assert summary["max_score"] == 4
+    assert summary["mean"] == round(statistics.mean(scores), 2)
+    assert summary["median"] == statistics.median(scores)
+    assert (summary["min"], summary["max"]) == (scores[0], scores[-1])
+    assert summary["pass_rate"] == round(sum(s >= 2 for s in scores) / len(scores), 4)
+    assert sum(b["count"] for b in resp.data["histogram"]) == len(scores)
+
+    for q in resp.data["questions"]:
+        answers = Answer.objects.filter(question_id=q["question"])
+        correct = sum(a.selected_option == a.question.correct_option for a in answers)
+        assert (q["attempts"], q["correct"]) == (answers.count(), correct)
+
+    assert [p["score"] for p in resp.data["top"]] == scores[::-1][:3]
+    assert [p["score"] for p in resp.data["bottom"]] == scores[:3]
+    assert sum(c["submissions"] for c in resp.data["classes"]) == len(scores)
+
+def test_class_filter_and_teacher_scope(seeded, auth_client):
+    data = seeded(teachers=2, students_per_teacher=4, questions_per_exam=3)
+    exam = school_exam(data)
+    mine, other = data["teachers"]
+    own_class = mine.student_set.first().student_class
+
+    resp = auth_client(mine.user).get(reverse("exam-analytics", args=[exam.id]))
+    assert resp.status_code == 200
+    assert resp.data["summary"]["submissions"] == 4
+    assert [c["student_class"] for c in resp.data["classes"]] == [own_class]
+
+    resp = auth_client(data["admin"]).get(
+        reverse("exam-analytics", args=[exam.id]), {"class": own_class}
+    )
+    assert resp.data["summary"]["submissions"] == 4
+
+def test_students_cannot_see_analytics(seeded, auth_client):
+    data = seeded(teachers=1, students_per_teacher=2)
+    exam = school_exam(data)
+    resp = auth_client(data["students"][0].user).get(reverse("exam-analytics", args=[exam.id]))
+    assert resp.status_code == 403
+
+def test_query_count_independent_of_submissions(seeded, auth_client):
+    def measure(**sizes):
+        data = seeded(**sizes)
+        client = auth_client(data["admin"])
+        with CaptureQueriesContext(connection) as ctx:
+            assert client.get(reverse("exam-analytics", args=[school_exam(data).id])).status_code == 200
+        return len(ctx.captured_queries)
+
+    small = measure(prefix="small", teachers=1, students_per_teacher=2, questions_per_exam=2)
+    large = measure(prefix="large", teachers=4, students_per_teacher=15, questions_per_exam=10)
+    assert small == large
@@ -0,0 +1,92 @@
+import json
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+from django.urls import reverse
+from django.utils import timezone
+from api.models import Exam
+
+pytestmark = pytest.mark.django_db
+
+def get(url, token, client=None):
+    client = client or Client()
+    resp = client.get(url, headers={"Authorization": token} if token else {})
+    return resp.status_code, json.loads(resp.content)
+
+def aget(url, token):
+    resp = async_to_sync(AsyncClient().get)(url, headers={"Authorization": token})
+    return resp.status_code, json.loads(resp.content)
+
+def test_exam_list_matches_sync_listing(seeded, token_for):
+    data = seeded(teachers=2, students_per_teacher=4, questions_per_exam=2)
+    for user in (data["admin"], data["teachers"][0].user, data["students"][0].user):
+        token = token_for(user)
+        _, sync = get(reverse("exam-list") + "?page_size=100", token)
+        status, body = aget(reverse("async-exam-list") + "?page_size=100", token)
+        assert status == 200
+        assert body == sync
+
+def test_exam_list_follows_cursors(seeded, token_for):
+    data = seeded(teachers=2, students_per_teacher=2, questions_per_exam=1)
+    token = token_for(data["admin"])
+    url, seen = reverse("async-exam-list") + "?page_size=2&count=false", []
+    while url:
+        status, body = get(url, token)
+        assert status == 200 and "count" not in body
+        seen += [row["id"] for row in body["results"]]
+        url, back = body["next"], body["previous"]
+    _, sync = get(reverse("exam-list") + "?page_size=100", token)
+    assert seen == [row["id"] for row in sync["results"]]
+
+    last_page = body["results"]
+    walked_back = []
+    while back:
+        body = get(back, token)[1]
+        walked_back = [row["id"] for row in body["results"]] + walked_back
+        back = body["previous"]
+    assert walked_back + [row["id"] for row in last_page] == seen
+
+def test_questions_share_the_cached_paper(student_user, student, exam, questions, token_for):
+    token = token_for(student_user)
+    sync = get(reverse("exam-questions", args=[exam.id]), token)
+    assert sync[0] == 200
+    assert aget(reverse("async-exam-questions", args=[exam.id]), token) == sync
+
+def test_questions_respect_visibility(another_teacher, exam, questions, token_for):
+    status, _ = get(reverse("async-exam-questions", args=[exam.id]), token_for(another_teacher.user))
+    assert status == 404
+
+def test_results_match_sync_endpoints(seeded, token_for):
+    data = seeded(teachers=2, students_per_teacher=4, questions_per_exam=2)
+    student, teacher = data["students"][0].user, data["teachers"][0].user
+    assert (aget(reverse("async-my-marks"), token_for(student))
+            == get(reverse("student-my-marks"), token_for(student)))
+    assert (aget(reverse("async-student-results"), token_for(teacher))
+            == get(reverse("teacher-student-results"), token_for(teacher)))
+
+def test_users_without_a_profile(student_user, teacher_user, admin_user, token_for):
+    exam = Exam.objects.create(title="T", created_by=admin_user, scope="school",
+                               target_standard="10", start_time=timezone.now())
+    for user in (student_user, teacher_user):
+        token = token_for(user)
+        assert get(reverse("async-exam-list"), token) == get(reverse("exam-list"), token)
+        assert get(reverse("async-exam-questions", args=[exam.id]), token)[0] == 404
+    assert get(reverse("async-my-marks"), token_for(student_user))[0] == 404
+    assert get(reverse("async-student-results"), token_for(teacher_user)) == (
+        404, {"detail": "Teacher profile not found."}
+    )
+
+def test_auth_and_roles(student_user, teacher_user, token_for):
+    assert get(reverse("async-my-marks"), None)[0] == 401
+    assert get(reverse("async-my-marks"), "Bearer nonsense")[0] == 401
+    assert get(reverse("async-my-marks"), token_for(teacher_user))[0] == 403
+    assert get(reverse("async-student-results"), token_for(student_user))[0] == 403
+    assert Client().post(reverse("async-my-marks"), headers={"Authorization": token_for(student_user)}).status_code == 405
+
+def test_profiling_middleware_stays_async(student_user, student, settings, token_for):
+    settings.PROFILING = {"ENABLED": True, "SAMPLE_RATE": 1.0}
+    resp = async_to_sync(AsyncClient().get)(
+        reverse("async-my-marks"), headers={"Authorization": token_for(student_user)}
+    )
+    assert resp.status_code == 200
+    assert "db;dur=" in resp["Server-Timing"]
@@ -0,0 +1,89 @@
+import pytest
+from django.contrib.auth.hashers import check_password
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from api import importers
+from api.importers import StudentImporter
+from api.models import CustomUser, Student, Teacher
+from api.provisioning import hash_passwords
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def fast_hasher(settings):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+def test_hash_passwords_parallel_keeps_order():
+    passwords = [f"secret-{i}" for i in range(20)]
+    hashes = hash_passwords(passwords, workers=2)
+    assert len(set(hashes)) == 20
+    for pwd, pwd_hash in zip(passwords, hashes):
+        assert check_password(pwd, pwd_hash)
+
+def test_bulk_provision_creates_users_in_one_insert(django_assert_num_queries):
+    rows = [{"username": f"bp{i}", "password": "pw"} for i in range(3)]
+    with django_assert_num_queries(1):
+        users = CustomUser.objects.bulk_provision(rows, role="teacher", workers=1)
+    assert all(u.pk for u in users)
+    assert CustomUser.objects.get(username="bp2").check_password("pw")
+    assert set(CustomUser.objects.values_list("role", flat=True)) == {"teacher"}
+
+def test_bulk_create_students_endpoint(admin_user, auth_client, teacher):
+    client = auth_client(admin_user)
+    payload = [
+        {
+            "user": {"username": f"js{i}", "email": f"js{i}@x.com",
+                     "first_name": "J", "last_name": "S", "password": "pw"},
+            "phone": "1", "roll_number": f"JS{i}", "student_class": "9-A",
+            "date_of_birth": "2011-01-01", "admission_date": "2024-06-01",
+            "status": "active", "assigned_teacher": teacher.id if i else None,
+        }
+        for i in range(3)
+    ]
+    payload.append({**payload[0], "roll_number": "JS9"})
+    resp = client.post(reverse("student-bulk"), payload, format="json")
+
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert len(resp.data["created"]) == 3
+    assert resp.data["errors"][0].startswith("Row 4:")
+    assert Student.objects.filter(assigned_teacher=teacher).count() == 2
+    assert CustomUser.objects.get(username="js1").role == "student"
+
+def test_bulk_create_teachers_endpoint(admin_user, auth_client):
+    client = auth_client(admin_user)
+    payload = [
+        {
+            "user": {"username": f"jt{i}", "email": "", "first_name": "J",
+                     "last_name": "T", "password": "pw"},
+            "phone": "1", "subject_specialization": "Physics",
+            "employee_id": f"EMP-J{i}", "date_of_joining": "2020-01-01",
+            "status": "active",
+        }
+        for i in range(2)
+    ]
+    resp = client.post(reverse("teacher-bulk"), payload, format="json")
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert [t["employee_id"] for t in resp.data["created"]] == ["EMP-J0", "EMP-J1"]
+    assert Teacher.objects.get(employee_id="EMP-J1").user.check_password("pw")
+
+def test_bulk_create_rejects_non_list(admin_user, auth_client):
+    client = auth_client(admin_user)
+    resp = client.post(reverse("student-bulk"), {"user": {}}, format="json")
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_import_hashes_passwords_outside_the_transaction(teacher, monkeypatch):
+    outer = len(connection.savepoint_ids)     # the test's own transaction
+    depths = []
+    def spy(passwords, workers=None):
+        depths.append(len(connection.savepoint_ids))
+        return hash_passwords(passwords, workers=1)
+    monkeypatch.setattr(importers, "hash_passwords", spy)
+
+    row = {"username": "hp", "email": "hp@x.com", "first_name": "H", "last_name": "P",
+           "password": "pw", "phone": "1", "roll_number": "HP1", "student_class": "9-A",
+           "date_of_birth": "2011-01-01", "admission_date": "2024-06-01"}
+    created, errors = StudentImporter().run([row])
+    assert errors == [] and len(created) == 1
+    assert depths == [outer]
+    assert CustomUser.objects.get(username="hp").check_password("pw")
@@ -0,0 +1,113 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from api.authentication import ClaimsRefreshToken, claims_user
+from api.models import CustomUser, Exam, ExamSubmission
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def md5(settings):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+PASSWORDS = {"student": "studpass", "teacher": "teachpass"}
+
+def login(username, password=None):
+    password = password or PASSWORDS[username]
+    resp = APIClient().post(reverse("token_obtain_pair"),
+                            {"username": username, "password": password}, format="json")
+    assert resp.status_code == 200, resp.data
+    return resp.data
+
+def bearer(access):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+    return client
+
+def tables(queries):
+    return [q["sql"].split(" FROM ")[1].split()[0].strip('"') for q in queries if " FROM " in q["sql"]]
+
+def test_login_embeds_profile_claims(student_user, student, teacher_user, teacher):
+    access = AccessToken(login(student_user.username)["access"])
+    assert (access["role"], access["profile_id"], access["token_version"]) == ("student", student.id, 0)
+    assert AccessToken(login(teacher_user.username)["access"])["profile_id"] == teacher.id
+
+def test_claims_skip_the_user_and_profile_lookups(student_user, student, exam, questions):
+    client = bearer(login(student_user.username)["access"])
+    client.get(reverse("student-my-marks"))          # warms the token version cache
+    with CaptureQueriesContext(connection) as ctx:
+        assert client.get(reverse("student-my-marks")).status_code == 200
+    # the ETag's id / timestamp read and the marks themselves – no user or profile lookup
+    assert tables(ctx.captured_queries) == ["api_examsubmission", "api_examsubmission"]
+
+def test_tokens_without_claims_still_work(student_user, student):
+    client = bearer(AccessToken.for_user(student_user))
+    with CaptureQueriesContext(connection) as ctx:
+        assert client.get(reverse("student-my-marks")).status_code == 200
+    assert "api_customuser" in tables(ctx.captured_queries)
+
+def test_permissions_come_from_the_role_claim(teacher_user, teacher):
+    client = bearer(login(teacher_user.username)["access"])
+    assert client.get(reverse("student-my-marks")).status_code == 403
+    assert client.get(reverse("teacher-student-results")).status_code == 200
+
+def test_teacher_without_profile_sees_no_results(user_factory, student, admin_user):
+    exam = Exam.objects.create(title="Finals", created_by=admin_user, scope="school",
+                               target_standard="10", start_time=timezone.now())
+    student.assigned_teacher = None
+    student.save()
+    ExamSubmission.objects.create(student=student, exam=exam, score=4)
+    user_factory("lonely", role="teacher", password="teachpass")
+
+    client = bearer(login("lonely", "teachpass")["access"])     # profile_id claim is None
+    assert client.get(reverse("teacher-student-results")).status_code == 404
+    for name in ("exam-analytics", "exam-item-analysis"):
+        assert client.get(reverse(name, args=[exam.id])).status_code == 404
+
+def test_password_change_revokes_tokens(student_user, student):
+    tokens = login(student_user.username)
+    client = bearer(tokens["access"])
+    assert client.get(reverse("student-my-marks")).status_code == 200
+
+    user = CustomUser.objects.get(pk=student_user.pk)
+    user.set_password("new-pass")
+    user.save()
+
+    assert client.get(reverse("student-my-marks")).status_code == 401
+    resp = APIClient().post(reverse("token_refresh"), {"refresh": tokens["refresh"]}, format="json")
+    assert resp.status_code == 401
+    assert bearer(login(student_user.username, "new-pass")["access"]).get(
+        reverse("student-my-marks")).status_code == 200
+
+def test_deactivation_and_explicit_revocation(teacher_user, teacher):
+    client = bearer(login(teacher_user.username)["access"])
+    teacher_user.revoke_tokens()
+    assert client.get(reverse("teacher-student-results")).status_code == 401
+
+    client = bearer(login(teacher_user.username)["access"])
+    user = CustomUser.objects.get(pk=teacher_user.pk)
+    user.is_active = False
+    user.save()
+    assert client.get(reverse("teacher-student-results")).status_code == 401
+
+def test_refresh_carries_claims(student_user, student):
+    refresh = login(student_user.username)["refresh"]
+    resp = APIClient().post(reverse("token_refresh"), {"refresh": refresh}, format="json")
+    assert AccessToken(resp.data["access"])["profile_id"] == student.id
+
+def test_claims_user_is_read_only(student_user, student):
+    user = claims_user(ClaimsRefreshToken.for_user(student_user).access_token)
+    assert (user.pk, user.role, user.profile_id) == (student_user.pk, "student", student.id)
+    with pytest.raises(TypeError):
+        user.save()
+
+def test_async_views_reject_revoked_tokens(student_user, student):
+    access = login(student_user.username)["access"]
+    url, headers = reverse("async-my-marks"), {"Authorization": f"Bearer {access}"}
+    assert APIClient().get(url, headers=headers).status_code == 200
+    student_user.revoke_tokens()
+    assert APIClient().get(url, headers=headers).status_code == 401
@@ -0,0 +1,91 @@
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from api.models import Exam, ExamSubmission, Question
+
+pytestmark = pytest.mark.django_db
+
+def revalidate(client, url, resp):
+    return client.get(url, HTTP_IF_NONE_MATCH=resp["ETag"])
+
+def test_exam_list_returns_304_from_one_query(admin_user, auth_client, exam, django_assert_num_queries):
+    client = auth_client(admin_user)
+    url = reverse("exam-list")
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first["ETag"].startswith('W/"') and first["Last-Modified"]
+    assert "no-cache" in first["Cache-Control"]
+
+    with django_assert_num_queries(1):
+        again = revalidate(client, url, first)
+    assert again.status_code == 304 and again.content == b""
+
+    assert client.get(url + "?page_size=1")["ETag"] != first["ETag"]
+    assert client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code == 304
+
+def test_exam_list_etag_follows_changes(admin_user, auth_client, exam):
+    client = auth_client(admin_user)
+    url = reverse("exam-list")
+    first = client.get(url)
+
+    exam.title = "Renamed"
+    exam.save()
+    edited = revalidate(client, url, first)
+    assert edited.status_code == 200
+
+    Exam.objects.create(title="New", created_by=admin_user, scope="school",
+                        target_standard="9", start_time=timezone.now())
+    assert revalidate(client, url, edited).status_code == 200
+
+def test_student_exam_list_etag_follows_eligibility(student_user, auth_client, student, exam):
+    client = auth_client(student_user)
+    url = reverse("exam-list")
+    first = client.get(url)
+    assert [e["id"] for e in first.data["results"]] == [exam.id]
+
+    student.student_class = "9-B"
+    student.save()
+    moved = revalidate(client, url, first)
+    assert moved.status_code == 200 and moved.data["results"] == []
+
+def test_exam_list_etag_is_not_fooled_by_equal_totals(student_user, auth_client, student, admin_user):
+    # {1, 4} -> {2, 3}: same count, same id sum, same newest updated_at
+    exams = [
+        Exam.objects.create(title=f"E{i}", created_by=admin_user, scope="school",
+                            target_standard=standard, start_time=timezone.now())
+        for i, standard in enumerate(["10", "9", "9", "10"])
+    ]
+    Exam.objects.filter(pk__in=[e.pk for e in exams]).update(updated_at=timezone.now())
+    client = auth_client(student_user)
+    url = reverse("exam-list")
+    first = client.get(url)
+    assert [e["id"] for e in first.data["results"]] == [exams[0].id, exams[3].id]
+
+    student.student_class = "9-A"
+    student.save()
+    moved = revalidate(client, url, first)
+    assert moved.status_code == 200
+    assert [e["id"] for e in moved.data["results"]] == [exams[1].id, exams[2].id]
+
+def test_question_paper_revalidates_on_content_version(student_user, auth_client, student, exam, questions):
+    client = auth_client(student_user)
+    url = reverse("exam-questions", args=[exam.id])
+    first = client.get(url)
+    assert revalidate(client, url, first).status_code == 304
+
+    question = Question.objects.get(pk=questions[0].pk)
+    question.text = "3 + 3 ?"
+    question.save()
+    changed = revalidate(client, url, first)
+    assert changed.status_code == 200 and changed.json()[0]["text"] == "3 + 3 ?"
+
+def test_my_marks_revalidates_on_new_submission(student_user, auth_client, student, exam, questions):
+    client = auth_client(student_user)
+    url = reverse("student-my-marks")
+    first = client.get(url)
+    assert first.json() == []
+    assert revalidate(client, url, first).status_code == 304
+
+    ExamSubmission.objects.create(student=student, exam=exam, score=3)
+    fresh = revalidate(client, url, first)
+    assert fresh.status_code == 200 and fresh.json()[0]["score"] == 3
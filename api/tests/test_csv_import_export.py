@@ -1,6 +1,10 @@
+import csv
 import pytest
 from rest_framework import status
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from api.models import CustomUser, Student
 
 pytestmark = pytest.mark.django_db
 
@@ -19,4 +23,89 @@ def test_teacher_csv_export(admin_user, auth_client, teacher):
     resp = client.get(url)
     assert resp.status_code == status.HTTP_200_OK
     assert resp["Content-Type"].startswith("text/csv")
-    assert "Username,Email,Phone" in resp.content.decode().splitlines()[0]
+    content = b"".join(resp.streaming_content).decode()
+    assert "Username,Email,Phone" in content.splitlines()[0]
+
+def test_student_csv_export_streams_with_constant_queries(
+    admin_user, auth_client, student, teacher
+):
+    for i in range(10):
+        user = CustomUser.objects.create_user(username=f"exp{i}", password="x", role="student")
+        Student.objects.create(
+            user=user, phone="1", roll_number=f"EXP{i}", student_class="9-A",
+            date_of_birth="2011-01-01", admission_date="2024-06-01",
+            status="active", assigned_teacher=teacher if i % 2 else None,
+        )
+    client = auth_client(admin_user)
+    resp = client.get(reverse("student-export-csv"))
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.streaming
+
+    with CaptureQueriesContext(connection) as ctx:
+        lines = b"".join(resp.streaming_content).decode().splitlines()
+    assert len(ctx.captured_queries) == 1
+    assert lines[0] == "Username,Email,Phone,Assigned Teacher,Status"
+    assert len(lines) == 12
+    assert "student,student@example.com,1234567890,teacher,active" in lines
+
+def _write_csv(path, rows):
+    header = [
+        "username", "email", "first_name", "last_name", "password", "phone",
+        "roll_number", "student_class", "date_of_birth", "admission_date",
+        "status", "assigned_teacher_id",
+    ]
+    with path.open("w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return path
+
+def test_student_csv_import_reports_row_errors(
+    admin_user, auth_client, student, teacher, tmp_path
+):
+    path = _write_csv(tmp_path / "mixed.csv", [
+        ["ok1", "o1@x.com", "O", "One", "pass", "1", "M001", "9-A",
+         "2011-01-01", "2024-06-01", "active", str(teacher.id)],
+        ["student", "dup@x.com", "D", "Up", "pass", "1", "M002", "9-A",
+         "2011-01-01", "2024-06-01", "active", ""],
+        ["ok1", "o2@x.com", "O", "Two", "pass", "1", "M003", "9-A",
+         "2011-01-01", "2024-06-01", "active", ""],
+        ["bad", "b@x.com", "B", "Ad", "pass", "1", "R001", "9-A",
+         "not-a-date", "2024-06-01", "active", "9999"],
+    ])
+    client = auth_client(admin_user)
+    with path.open("rb") as fh:
+        resp = client.post(reverse("student-list") + "/import", {"file": fh}, format="multipart")
+
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert [c["user"]["username"] for c in resp.data["created"]] == ["ok1"]
+    assert resp.data["created"][0]["assigned_teacher"] == teacher.id
+    errors = resp.data["errors"]
+    assert len(errors) == 3
+    assert errors[0].startswith("Row 2:") and "username" in errors[0]
+    assert errors[1].startswith("Row 3:") and "username" in errors[1]
+    assert errors[2].startswith("Row 4:")
+    for field in ("date_of_birth", "roll_number", "assigned_teacher"):
+        assert field in errors[2]
+    assert CustomUser.objects.get(username="ok1").check_password("pass")
+
+def test_student_csv_import_query_count_is_per_batch(
+    admin_user, auth_client, tmp_path, settings
+):
+    settings.CSV_IMPORT_BATCH_SIZE = 50
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+    def run(prefix, count):
+        rows = [
+            [f"{prefix}{i}", "", "F", "L", "pass", "1", f"{prefix.upper()}{i}", "9-A",
+             "2011-01-01", "2024-06-01", "active", ""]
+            for i in range(count)
+        ]
+        path = _write_csv(tmp_path / f"{prefix}.csv", rows)
+        client = auth_client(admin_user)
+        with path.open("rb") as fh, CaptureQueriesContext(connection) as ctx:
+            resp = client.post(reverse("student-list") + "/import", {"file": fh}, format="multipart")
+        assert len(resp.data["created"]) == count
+        return len(ctx.captured_queries)
+
+    assert run("small", 5) == run("large", 45)
@@ -0,0 +1,83 @@
+import threading
+from pathlib import Path
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+from api.models import ExamStats, ExamSubmission
+from api.stats import drift, rebuild
+from school_project.db import database_settings
+
+BASE = Path("/srv/school")
+
+def test_sqlite_is_the_default():
+    assert database_settings(BASE, {}) == {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE / "db.sqlite3",
+    }
+
+def test_postgresql_profile_keeps_connections_and_checks_them():
+    config = database_settings(BASE, {
+        "DB_ENGINE": "postgresql", "DB_NAME": "school", "DB_USER": "app",
+        "DB_PASSWORD": "secret", "DB_HOST": "db", "DB_PORT": "6432",
+        "DB_CONN_MAX_AGE": "300", "DB_SSLMODE": "require",
+    })
+    assert config["ENGINE"] == "django.db.backends.postgresql"
+    assert (config["HOST"], config["PORT"], config["USER"]) == ("db", "6432", "app")
+    assert config["CONN_MAX_AGE"] == 300
+    assert config["CONN_HEALTH_CHECKS"] is True
+    assert config["OPTIONS"] == {"sslmode": "require"}
+
+def test_pool_replaces_persistent_connections():
+    config = database_settings(BASE, {
+        "DB_ENGINE": "postgres", "DB_POOL": "on", "DB_POOL_MAX_SIZE": "20",
+        "DB_CONN_MAX_AGE": "300",
+    })
+    assert config["CONN_MAX_AGE"] == 0
+    assert config["OPTIONS"]["pool"] == {"min_size": 2, "max_size": 20, "timeout": 10.0}
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ImproperlyConfigured):
+        database_settings(BASE, {"DB_ENGINE": "mysql"})
+
+# ---------------------------------------------------------------------------
+#  Against a real PostgreSQL server (DB_ENGINE=postgresql pytest …)
+# ---------------------------------------------------------------------------
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="needs DB_ENGINE=postgresql")
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_submissions_on_postgresql(seeded):
+    data = seeded(teachers=2, students_per_teacher=8, questions_per_exam=4)
+    exam = data["exams"][0]
+    payloads = [
+        (sub.student.user, {
+            "exam": exam.id,
+            "answers": [{"question": q, "selected_option": o}
+                        for q, o in sub.answers.values_list("question_id", "selected_option")],
+        })
+        for sub in ExamSubmission.objects.filter(exam=exam).select_related("student__user")
+    ]
+    ExamSubmission.objects.filter(exam=exam).delete()
+    rebuild([exam.id])
+
+    start = threading.Barrier(len(payloads))
+    statuses = []
+
+    def submit(user, payload):
+        try:
+            client = APIClient()
+            client.force_authenticate(user)
+            start.wait()
+            statuses.append(client.post(reverse("submission-list"), payload, format="json").status_code)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=submit, args=item) for item in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses == [201] * len(payloads)
+    assert ExamStats.objects.get(exam=exam).submissions == len(payloads)
+    assert drift([exam.id]) == []
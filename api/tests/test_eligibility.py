@@ -0,0 +1,62 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from api.models import CustomUser, Exam, ExamSubmission, Student
+
+pytestmark = pytest.mark.django_db
+
+def add_classmates(teacher, count, prefix):
+    for i in range(count):
+        user = CustomUser.objects.create(username=f"{prefix}{i}", role="student")
+        Student.objects.create(
+            user=user, phone="1", roll_number=f"{prefix.upper()}{i}",
+            student_class="10-A", date_of_birth="2010-01-01",
+            admission_date="2024-06-01", status="active", assigned_teacher=teacher,
+        )
+
+def test_is_eligible_runs_no_queries(student, exam, admin_user, django_assert_num_queries):
+    school = Exam.objects.create(
+        title="Std 10", created_by=admin_user, scope="school",
+        target_standard="10", start_time=timezone.now(),
+    )
+    other = Exam.objects.create(
+        title="Std 1", created_by=admin_user, scope="school",
+        target_standard="1", start_time=timezone.now(),
+    )
+    with django_assert_num_queries(0):
+        assert exam.is_eligible(student)
+        assert school.is_eligible(student)
+        assert not other.is_eligible(student)
+
+def test_is_eligible_class_scope_checks_teacher(student, exam, another_teacher):
+    student.assigned_teacher = another_teacher
+    assert not exam.is_eligible(student)
+
+def test_question_and_submit_queries_constant_in_class_size(
+    student_user, auth_client, student, teacher, exam, questions
+):
+    client = auth_client(student_user)
+    questions_url = reverse("exam-questions", args=[exam.id])
+    answers = [{"question": q.id, "selected_option": 4} for q in questions]
+
+    def measure():
+        cache.clear()
+        with CaptureQueriesContext(connection) as q_ctx:
+            assert client.get(questions_url).status_code == 200
+        with CaptureQueriesContext(connection) as s_ctx:
+            resp = client.post(
+                reverse("submission-list"),
+                {"exam": exam.id, "answers": answers},
+                format="json",
+            )
+        assert resp.status_code == 201, resp.data
+        ExamSubmission.objects.all().delete()
+        return len(q_ctx.captured_queries), len(s_ctx.captured_queries)
+
+    measure()               # first submission creates the stats rows
+    small = measure()
+    add_classmates(teacher, 40, "mate")
+    assert measure() == small
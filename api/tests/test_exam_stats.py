@@ -0,0 +1,97 @@
+import statistics
+import pytest
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework import status
+from api.ingestion import flush_pending
+from api.models import ExamStats, ExamSubmission, QuestionStats
+from api.stats import drift
+
+pytestmark = pytest.mark.django_db
+
+def answers(questions, options):
+    return [{"question": q.id, "selected_option": o} for q, o in zip(questions, options)]
+
+def test_submission_updates_running_totals(student_user, auth_client, student, exam, questions):
+    client = auth_client(student_user)
+    resp = client.post(
+        reverse("submission-list"),
+        {"exam": exam.id, "answers": answers(questions, [4, 4, 1, 2, 4])},
+        format="json",
+    )
+    assert resp.status_code == status.HTTP_201_CREATED
+
+    totals = ExamStats.objects.get(exam=exam)
+    assert (totals.submissions, totals.score_sum, totals.score_sq_sum) == (1, 3, 9)
+    third = QuestionStats.objects.get(question=questions[2])
+    assert (third.attempts, third.option1, third.option4) == (1, 1, 0)
+    assert drift([exam.id]) == []
+
+    client.delete(reverse("submission-detail", args=[resp.data["id"]]))
+    totals.refresh_from_db()
+    assert (totals.submissions, totals.score_sum) == (0, 0)
+    assert drift([exam.id]) == []
+
+def test_flusher_updates_running_totals(student_user, auth_client, student, exam, questions):
+    auth_client(student_user).post(
+        reverse("submission-queue"),
+        {"exam": exam.id, "answers": answers(questions, [4, 3, 4, 3, 4])},
+        format="json",
+    )
+    flush_pending()
+    assert ExamStats.objects.get(exam=exam).score_sum == 3
+    assert drift() == []
+
+def test_batched_record_matches_fresh_computation(seeded):
+    seeded(teachers=3, students_per_teacher=6, questions_per_exam=4, seed=7)
+    ExamStats.objects.all().delete()
+    QuestionStats.objects.all().delete()
+    ExamStats.record(
+        (sub, list(sub.answers.values_list("question_id", "selected_option")))
+        for sub in ExamSubmission.objects.all()
+    )
+    assert drift() == []
+
+def test_check_and_rebuild_command(seeded):
+    data = seeded(teachers=2, students_per_teacher=3, questions_per_exam=3)
+    call_command("exam_stats", "--check")
+
+    ExamStats.objects.filter(exam=data["exams"][0]).update(submissions=999)
+    call_command("exam_stats", "--check", "--exam", str(data["exams"][1].id))
+    with pytest.raises(CommandError):
+        call_command("exam_stats", "--check", "--exam", str(data["exams"][0].id))
+
+    call_command("exam_stats", "--rebuild")
+    call_command("exam_stats", "--check")
+
+def test_stats_endpoint(seeded, auth_client):
+    data = seeded(teachers=2, students_per_teacher=5, questions_per_exam=4, seed=1)
+    exam = data["exams"][0]
+    scores = list(ExamSubmission.objects.filter(exam=exam).values_list("score", flat=True))
+
+    resp = auth_client(data["admin"]).get(reverse("exam-stats", args=[exam.id]))
+    assert resp.status_code == 200
+    assert resp.data["submissions"] == len(scores)
+    assert resp.data["mean"] == round(statistics.mean(scores), 2)
+    assert resp.data["stddev"] == round(statistics.pstdev(scores), 2)
+    assert len(resp.data["questions"]) == 4
+    assert all(sum(q["options"].values()) == q["attempts"] for q in resp.data["questions"])
+
+def test_taking_out_of_drifted_totals_stops_at_zero(student, exam, questions):
+    sub = ExamSubmission.objects.create(student=student, exam=exam, score=3)
+    ExamStats.record([(sub, [(questions[0].id, 1)])])
+    ExamStats.objects.filter(exam=exam).update(submissions=0, score_sum=1)
+    QuestionStats.objects.filter(question=questions[0]).update(attempts=0, option1=0)
+
+    sub.delete()    # would break the unsigned counters' CHECK without the floor
+
+    totals = ExamStats.objects.get(exam=exam)
+    assert (totals.submissions, totals.score_sum) == (0, 0)
+    assert QuestionStats.objects.get(question=questions[0]).attempts == 0
+
+def test_record_counts_rows_created_by_another_writer(student, exam, questions):
+    ExamStats.objects.create(exam=exam)       # committed concurrently, before our insert
+    sub = ExamSubmission.objects.create(student=student, exam=exam, score=2)
+    ExamStats.record([(sub, [(questions[0].id, 4)])])
+    assert ExamStats.objects.get(exam=exam).submissions == 1
+    assert QuestionStats.objects.get(question=questions[0]).option4 == 1
@@ -0,0 +1,53 @@
+import pytest
+from django.core.management import call_command
+from django.db.models import Count, Q, F
+
+from api.models import Answer, CustomUser, Exam, ExamEligibility, ExamSubmission, Student
+from api.seeding import generate_school
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def fast_hasher(settings):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+def _snapshot(prefix):
+    return sorted(
+        (sub.exam.title, sub.student.roll_number.removeprefix(prefix), sub.score)
+        for sub in ExamSubmission.objects.filter(
+            student__roll_number__startswith=prefix
+        ).select_related("exam", "student")
+    )
+
+def test_command_generates_consistent_school():
+    call_command(
+        "generate_school_data", "--teachers", "14", "--students", "300",
+        "--questions", "4", "--batch-size", "50", "--workers", "1",
+    )
+    assert CustomUser.objects.filter(role="teacher").count() == 14
+    assert Student.objects.count() == 300
+    # 14 classes cover all twelve standards, two of them with a B section
+    assert set(Student.objects.values_list("standard", flat=True)) == {str(n) for n in range(1, 13)}
+    assert Student.objects.filter(section="B").exists()
+    assert Exam.objects.count() == 12 + 14 * 2
+
+    for exam in Exam.objects.all():
+        assert ExamEligibility.objects.filter(exam=exam).count() == exam.matching_students().count()
+        assert not ExamSubmission.objects.filter(exam=exam).exclude(
+            student__in=exam.eligible_students()
+        ).exists()
+
+    scored = ExamSubmission.objects.annotate(
+        n=Count("answers"),
+        right=Count("answers", filter=Q(answers__selected_option=F("answers__question__correct_option"))),
+    )
+    assert scored.exists()
+    assert all(s.n == 4 and s.score == s.right for s in scored)
+    assert Answer.objects.count() == 4 * ExamSubmission.objects.count()
+
+def test_output_independent_of_worker_count():
+    generate_school(teachers=3, students=40, questions_per_exam=3, batch_size=7,
+                    workers=1, prefix="one", seed=5)
+    generate_school(teachers=3, students=40, questions_per_exam=3, batch_size=7,
+                    workers=2, prefix="two", seed=5)
+    assert _snapshot("one") == _snapshot("two")
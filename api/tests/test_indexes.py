@@ -0,0 +1,62 @@
+import pytest
+from django.db import connection
+from api.models import Answer, Exam, ExamSubmission, Student
+
+pytestmark = pytest.mark.django_db
+
+EXPECTED = {
+    Student: {"student_teacher_class_idx": ["assigned_teacher_id", "student_class"]},
+    Exam: {
+        "exam_scope_standard_idx": ["scope", "target_standard"],
+        "exam_scope_teacher_class_idx": ["scope", "assigned_teacher_id", "target_class"],
+        "exam_start_idx": ["start_time", "id"],
+    },
+    ExamSubmission: {"submission_student_exam_idx": ["student_id", "exam_id", "score"]},
+    Answer: {
+        "answer_submission_cover_idx": ["submission_id", "question_id", "selected_option"],
+        "answer_question_option_idx": ["question_id", "selected_option"],
+    },
+}
+
+# (query, index the planner must pick) – checked on SQLite, whose planner
+# chooses indexes by shape even on empty tables
+PLANS = [
+    (lambda: Student.objects.filter(assigned_teacher_id=1, student_class="10-A"),
+     "INDEX student_teacher_class_idx"),
+    (lambda: Exam.objects.filter(scope="school", target_standard="10"),
+     "INDEX exam_scope_standard_idx"),
+    (lambda: Exam.objects.filter(scope="class", assigned_teacher_id=1, target_class="10-A"),
+     "INDEX exam_scope_teacher_class_idx"),
+    (lambda: ExamSubmission.objects.filter(student_id=1).order_by("exam_id").values("exam_id", "score"),
+     "COVERING INDEX submission_student_exam_idx"),
+    (lambda: Answer.objects.filter(submission_id=1).values("question_id", "selected_option"),
+     "COVERING INDEX answer_submission_cover_idx"),
+    (lambda: Answer.objects.filter(question_id=1, selected_option=2),
+     "INDEX answer_question_option_idx"),
+]
+
+@pytest.mark.parametrize("model", list(EXPECTED), ids=lambda m: m.__name__)
+def test_composite_indexes_exist(model):
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    for name, columns in EXPECTED[model].items():
+        assert name in constraints
+        assert constraints[name]["index"]
+        assert constraints[name]["columns"] == columns
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="plan text is SQLite specific")
+@pytest.mark.parametrize("query,index", PLANS, ids=[p[1].split()[-1] for p in PLANS])
+def test_hot_queries_use_their_index(query, index):
+    assert f"USING {index}" in query().explain()
+
+@pytest.mark.parametrize("model", list(EXPECTED), ids=lambda m: m.__name__)
+def test_no_index_is_a_prefix_of_a_composite(model):
+    """A leading FK column needs no index of its own – one less write per row."""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    leading = {columns[0] for columns in EXPECTED[model].values()}
+    single = {
+        c["columns"][0] for c in constraints.values()
+        if c["index"] and not c["unique"] and len(c["columns"]) == 1
+    }
+    assert not leading & single
@@ -0,0 +1,112 @@
+import math
+import numpy as np
+import pytest
+from django.urls import reverse
+
+from api.item_analysis import analyse, load_selections
+from api.models import Answer, ExamSubmission, Student
+
+pytestmark = pytest.mark.django_db
+
+def pearson(xs, ys):
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    cov = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    sx = math.sqrt(sum((x - mx) ** 2 for x in xs))
+    sy = math.sqrt(sum((y - my) ** 2 for y in ys))
+    return cov / (sx * sy)
+
+def test_metrics_match_textbook_formulas():
+    rng = np.random.default_rng(0)
+    key = np.array([1, 2, 3, 4, 1, 2], dtype=np.int8)
+    sel = rng.integers(0, 5, size=(40, 6), dtype=np.int8)
+    sel[:20] = np.where(rng.random((20, 6)) < 0.7, key, sel[:20])   # a stronger half
+    result = analyse(sel, key)
+
+    correct = [[int(s == k) for s, k in zip(row, key)] for row in sel.tolist()]
+    totals = [sum(row) for row in correct]
+    k = len(key)
+    p = [sum(row[j] for row in correct) / len(correct) for j in range(k)]
+    mean = sum(totals) / len(totals)
+    var = sum((t - mean) ** 2 for t in totals) / len(totals)
+    assert result["kr20"] == round(k / (k - 1) * (1 - sum(pi * (1 - pi) for pi in p) / var), 4)
+
+    ranked = sorted(range(len(totals)), key=lambda i: totals[i])
+    n = round(len(totals) * 0.27)
+    for j, item in enumerate(result["items"]):
+        column = [row[j] for row in correct]
+        assert item["difficulty"] == round(p[j], 4)
+        assert item["point_biserial"] == pytest.approx(pearson(column, totals), abs=1e-4)
+        rest = [t - c for t, c in zip(totals, column)]
+        assert item["corrected_point_biserial"] == pytest.approx(pearson(column, rest), abs=1e-4)
+        upper = sum(column[i] for i in ranked[-n:]) / n
+        lower = sum(column[i] for i in ranked[:n]) / n
+        assert item["discrimination"] == pytest.approx(upper - lower, abs=1e-4)
+
+        assert sum(o["count"] for o in item["options"]) == 40
+        for o in item["options"]:
+            choosers = [t for t, row in zip(totals, sel.tolist()) if row[j] == o["option"]]
+            if choosers:
+                assert o["mean_total"] == pytest.approx(sum(choosers) / len(choosers), abs=1e-4)
+
+def test_degenerate_inputs_give_nulls():
+    result = analyse(np.zeros((0, 3), dtype=np.int8), np.array([1, 2, 3], dtype=np.int8))
+    assert result["students"] == 0 and result["kr20"] is None
+    everyone_right = analyse(np.full((5, 2), 1, dtype=np.int8), np.array([1, 1], dtype=np.int8))
+    assert everyone_right["items"][0]["difficulty"] == 1.0
+    assert everyone_right["items"][0]["point_biserial"] is None
+
+def test_load_selections_builds_matrix(seeded):
+    data = seeded(teachers=1, students_per_teacher=4, questions_per_exam=3)
+    exam = data["exams"][0]
+    gap = Answer.objects.filter(submission__exam=exam).first()
+    gap.delete()
+
+    question_ids, key, sel = load_selections(exam)
+    assert sel.shape == (4, 3) and sel.dtype == np.int8
+    assert list(question_ids) == list(exam.questions.order_by("id").values_list("id", flat=True))
+    for sub_row, sub in enumerate(ExamSubmission.objects.filter(exam=exam).order_by("id")):
+        picked = dict(sub.answers.values_list("question_id", "selected_option"))
+        assert sel[sub_row].tolist() == [picked.get(q, 0) for q in question_ids]
+
+def test_load_selections_sticks_to_the_given_ids(seeded, django_assert_num_queries):
+    data = seeded(teachers=1, students_per_teacher=4, questions_per_exam=3)
+    exam = data["exams"][0]
+    submissions = ExamSubmission.objects.filter(exam=exam)
+    ids = np.array(sorted(submissions.values_list("id", flat=True))[:3], dtype=np.int64)
+
+    # questions and answers only – the ids are not read again, and the
+    # fourth submission (a late arrival) stays out of the matrix
+    with django_assert_num_queries(2):
+        _, _, sel = load_selections(exam, submissions, submission_ids=ids)
+    assert sel.shape == (3, 3) and sel.all()
+
+def test_item_analysis_endpoint(seeded, auth_client):
+    data = seeded(teachers=2, students_per_teacher=5, questions_per_exam=4)
+    exam = next(e for e in data["exams"] if e.scope == "school")
+
+    resp = auth_client(data["admin"]).get(reverse("exam-item-analysis", args=[exam.id]))
+    assert resp.status_code == 200
+    assert (resp.data["students"], resp.data["questions"]) == (10, 4)
+
+    teacher = data["teachers"][0]
+    resp = auth_client(teacher.user).get(reverse("exam-item-analysis", args=[exam.id]))
+    assert resp.data["students"] == 5
+
+    student = data["students"][0]
+    assert auth_client(student.user).get(
+        reverse("exam-item-analysis", args=[exam.id])
+    ).status_code == 403
+
+def test_teacher_item_analysis_follows_reassignment(seeded, auth_client):
+    data = seeded(teachers=2, students_per_teacher=5, questions_per_exam=4)
+    exam = next(e for e in data["exams"] if e.scope == "school")
+    mine, other = data["teachers"]
+    client = auth_client(mine.user)
+    url = reverse("exam-item-analysis", args=[exam.id])
+    assert client.get(url).data["students"] == 5
+
+    Student.objects.filter(assigned_teacher=other).update(assigned_teacher=mine)
+    assert client.get(url).data["students"] == 10
+
+    Student.objects.filter(assigned_teacher=mine).first().user.delete()
+    assert client.get(url).data["students"] == 9
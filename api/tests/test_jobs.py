@@ -0,0 +1,140 @@
+import json
+from datetime import timedelta
+import pytest
+from django.core.management import call_command
+from django.db.models import F
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from api import jobs
+from api.jobs import recover_stale
+from api.models import Job, Student
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / "media"
+
+def test_async_student_export(admin_user, auth_client, student):
+    client = auth_client(admin_user)
+    resp = client.post(reverse("student-export-csv-async"))
+    assert resp.status_code == status.HTTP_202_ACCEPTED
+    job_id = resp.data["job_id"]
+    assert resp.data["status"] == "queued"
+
+    status_url = reverse("job-detail", args=[job_id])
+    assert client.get(reverse("job-download", args=[job_id])).status_code == 409
+
+    call_command("run_jobs", "--once")
+
+    data = client.get(status_url).data
+    assert data["status"] == "done"
+    assert data["progress"] == 100
+    assert data["result"] == {"rows": 1}
+    assert data["download_url"].endswith(f"/api/jobs/{job_id}/download")
+
+    download = client.get(reverse("job-download", args=[job_id]))
+    assert download.status_code == 200
+    lines = b"".join(download.streaming_content).decode().splitlines()
+    assert lines[0] == "Username,Email,Phone,Assigned Teacher,Status"
+    assert lines[1].startswith("student,student@example.com")
+
+def test_async_student_import(admin_user, auth_client, sample_csv):
+    client = auth_client(admin_user)
+    with sample_csv.open("rb") as fh:
+        resp = client.post(
+            reverse("student-import-csv-async"), {"file": fh}, format="multipart"
+        )
+    assert resp.status_code == status.HTTP_202_ACCEPTED
+    assert not Student.objects.exists()
+
+    call_command("run_jobs", "--once")
+
+    job = Job.objects.get(pk=resp.data["job_id"])
+    assert job.status == "done"
+    assert (job.processed, job.total) == (2, 2)
+    assert job.result == {"created": 2, "errors": 0}
+    assert Student.objects.count() == 2
+
+    download = client.get(reverse("job-download", args=[job.id]))
+    payload = json.loads(b"".join(download.streaming_content))
+    assert [c["roll_number"] for c in payload["created"]] == ["B001", "B002"]
+
+def test_failed_job_records_error(admin_user):
+    job = Job.objects.create(kind="student_import", created_by=admin_user)
+    call_command("run_jobs", "--once")
+    job.refresh_from_db()
+    assert job.status == "failed"
+    assert job.error
+
+def test_jobs_are_private_to_admins(admin_user, teacher_user, auth_client):
+    job = Job.objects.create(kind="teacher_export", created_by=admin_user)
+    client = auth_client(teacher_user)
+    assert client.get(reverse("job-detail", args=[job.id])).status_code == 403
+
+def test_import_input_is_removed_when_the_job_finishes(admin_user, auth_client, sample_csv, settings):
+    with sample_csv.open("rb") as fh:
+        resp = auth_client(admin_user).post(
+            reverse("student-import-csv-async"), {"file": fh}, format="multipart"
+        )
+    assert any((settings.MEDIA_ROOT / "jobs" / "input").iterdir())
+
+    call_command("run_jobs", "--once")
+
+    job = Job.objects.get(pk=resp.data["job_id"])
+    assert job.status == "done" and not job.input_file
+    assert not any((settings.MEDIA_ROOT / "jobs" / "input").iterdir())
+
+def test_stale_running_jobs_are_requeued_then_failed(admin_user, settings):
+    lost = timezone.now() - timedelta(seconds=settings.JOB_LEASE_TIMEOUT + 1)
+    retry = Job.objects.create(kind="teacher_export", created_by=admin_user, status="running",
+                               started_at=lost, heartbeat_at=lost, attempts=1)
+    give_up = Job.objects.create(kind="teacher_export", created_by=admin_user, status="running",
+                                 started_at=lost, heartbeat_at=lost, attempts=settings.JOB_MAX_ATTEMPTS)
+    alive = Job.objects.create(kind="teacher_export", created_by=admin_user, status="running",
+                               started_at=lost, heartbeat_at=timezone.now(), attempts=1)
+
+    assert recover_stale() == (1, 1)
+
+    retry.refresh_from_db()
+    give_up.refresh_from_db()
+    alive.refresh_from_db()
+    assert retry.status == "queued" and retry.started_at is None
+    assert give_up.status == "failed" and give_up.error
+    assert alive.status == "running"
+
+    call_command("run_jobs", "--once")
+    retry.refresh_from_db()
+    assert retry.status == "done" and retry.attempts == 2
+
+def test_a_run_that_lost_its_lease_is_discarded(admin_user, monkeypatch):
+    job = Job.objects.create(kind="teacher_export", created_by=admin_user)
+
+    def slow_export(running):
+        # meanwhile the lease expired: another worker requeued and reclaimed it
+        Job.objects.filter(pk=running.pk).update(status="running", attempts=F("attempts") + 1)
+        running.result = {"rows": 99}
+
+    monkeypatch.setitem(jobs.HANDLERS, "teacher_export", slow_export)
+    claimed = jobs.claim_next()
+    assert jobs.run_job(claimed).status == "running"
+    job.refresh_from_db()
+    assert (job.status, job.result, job.attempts) == ("running", None, 2)
+
+def test_worker_sweeps_for_stale_jobs_while_polling(admin_user, settings, monkeypatch):
+    lost = timezone.now() - timedelta(seconds=settings.JOB_LEASE_TIMEOUT + 1)
+    other = Job.objects.create(kind="teacher_export", created_by=admin_user, status="running",
+                               started_at=timezone.now(), heartbeat_at=timezone.now(), attempts=1)
+    first = Job.objects.create(kind="teacher_export", created_by=admin_user)
+    export = jobs.HANDLERS["teacher_export"]
+
+    def export_while_other_worker_dies(job):
+        if job.pk == first.pk:
+            Job.objects.filter(pk=other.pk).update(heartbeat_at=lost)
+        export(job)
+
+    monkeypatch.setitem(jobs.HANDLERS, "teacher_export", export_while_other_worker_dies)
+    call_command("run_jobs", "--once", "--recover-interval", "0")
+    other.refresh_from_db()
+    assert (other.status, other.attempts) == ("done", 2)
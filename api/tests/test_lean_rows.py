@@ -0,0 +1,45 @@
+import datetime
+from decimal import Decimal
+import pytest
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from api import lean
+from api.lean import FastJSONRenderer, student_rows, submission_rows
+from api.models import ExamSubmission, Student
+from api.serializers import ExamSubmissionSerializer, StudentSerializer
+
+pytestmark = pytest.mark.django_db
+
+def render(data):
+    return JSONRenderer().render(data)
+
+def test_rows_match_serializer_output(student, exam):
+    ExamSubmission.objects.create(student=student, exam=exam, score=4)
+    subs = ExamSubmission.objects.order_by("id")
+    students = Student.objects.order_by("id")
+    assert render(submission_rows(subs)) == render(ExamSubmissionSerializer(subs, many=True).data)
+    assert render(student_rows(students)) == render(StudentSerializer(students, many=True).data)
+
+@pytest.mark.parametrize("data", [
+    [{"id": 1, "name": "Ünïcode ‑ text", "score": None, "ok": True}],
+    {"text": "line\u2028separator\u2029paragraph"},
+    {"when": datetime.datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+     "day": datetime.date(2025, 1, 2), "price": Decimal("1.50"), "label": gettext_lazy("Active")},
+    {1: "int key"},
+])
+def test_fast_renderer_matches_drf_bytes(data):
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+def test_fast_renderer_falls_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(lean, "orjson", None)
+    assert FastJSONRenderer().render({"a": [1]}) == b'{"a":[1]}'
+    assert FastJSONRenderer().render(None) == b""
+
+def test_list_endpoints_render_lean_rows(teacher_user, student_user, auth_client, student, exam):
+    sub = ExamSubmission.objects.create(student=student, exam=exam, score=2)
+    expected = [{"id": sub.id, "exam": exam.id, "score": 2}]
+    assert auth_client(teacher_user).get(reverse("teacher-student-results")).json() == expected
+    assert auth_client(student_user).get(reverse("student-my-marks")).json() == expected
+    page = auth_client(teacher_user).get(reverse("teacher-my-students")).json()
+    assert page["results"] == StudentSerializer([student], many=True).data
@@ -1,5 +1,6 @@
 import pytest
 from django.db import IntegrityError
+from django.utils import timezone
 from api.models import ExamSubmission, Answer, CustomUser, Teacher, Student, Exam, Question
 
 pytestmark = pytest.mark.django_db
@@ -30,3 +31,47 @@ def test_answer_belongs_to_submission(student, exam, questions):
     )
     assert ans.submission == sub
     assert ans.question == questions[0]
+
+def test_student_class_is_split_into_standard_and_section(student):
+    assert (student.standard, student.section) == ("10", "A")
+    student.student_class = "9‑B"
+    student.save(update_fields=["student_class"])
+    student.refresh_from_db()
+    assert (student.standard, student.section) == ("9", "B")
+
+def test_standard_and_section_fit_any_student_class(student):
+    width = Student._meta.get_field("student_class").max_length
+    assert Student._meta.get_field("standard").max_length == width
+    assert Student._meta.get_field("section").max_length == width
+    student.student_class = "Kindergarten-Morning"
+    student.save()
+    student.refresh_from_db()
+    assert (student.standard, student.section) == ("Kindergarten", "Morning")
+
+def test_school_exam_does_not_prefix_match_standard(student, admin_user):
+    standard_one = Exam.objects.create(
+        title="Std 1", created_by=admin_user, scope="school",
+        target_standard="1", start_time=timezone.now(),
+    )
+    standard_ten = Exam.objects.create(
+        title="Std 10", created_by=admin_user, scope="school",
+        target_standard="10", start_time=timezone.now(),
+    )
+    assert student not in standard_one.eligible_students()
+    assert list(standard_ten.eligible_students()) == [student]
+
+def test_eligibility_follows_student_moves(student, exam, another_teacher):
+    assert list(exam.eligible_students()) == [student]
+
+    student.assigned_teacher = another_teacher
+    student.save()
+    assert not exam.eligible_students().exists()
+
+    student.assigned_teacher = exam.assigned_teacher
+    student.save()
+    assert list(exam.eligible_students()) == [student]
+
+def test_eligibility_follows_exam_retargeting(student, exam):
+    exam.target_class = "10-B"
+    exam.save()
+    assert not exam.eligible_students().exists()
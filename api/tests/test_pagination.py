@@ -1,7 +1,9 @@
 import pytest
+from datetime import timedelta
 from rest_framework import status
 from django.urls import reverse
-from api.models import CustomUser, Student
+from django.utils import timezone
+from api.models import CustomUser, Exam, Student
 
 @pytest.mark.django_db
 
@@ -33,3 +35,57 @@ def test_students_list_pagination(admin_user, auth_client, teacher):
     assert response.data["next"] is not None
     assert isinstance(response.data["results"], list)
     assert len(response.data["results"]) <= 5
+
+def make_students(teacher, count):
+    for i in range(count):
+        user = CustomUser.objects.create(username=f"k{i}", role="student")
+        Student.objects.create(
+            user=user, phone="1", roll_number=f"K{i}", student_class="10-A",
+            date_of_birth="2010-01-01", admission_date="2024-06-01",
+            status="active", assigned_teacher=teacher,
+        )
+
+@pytest.mark.django_db
+def test_students_keyset_walk(admin_user, auth_client, teacher):
+    make_students(teacher, 12)
+    client = auth_client(admin_user)
+    url = reverse("student-list") + "?page_size=4"
+    seen = []
+    while url:
+        data = client.get(url).data
+        assert data["count"] == 12
+        seen.extend(s["id"] for s in data["results"])
+        url = data["next"]
+    assert seen == sorted(Student.objects.values_list("id", flat=True))
+    assert "page=" not in (client.get(reverse("student-list")).data["next"] or "")
+
+@pytest.mark.django_db
+def test_page_size_cap_and_skip_count(admin_user, auth_client, teacher):
+    make_students(teacher, 3)
+    client = auth_client(admin_user)
+    data = client.get(reverse("student-list") + "?page_size=1000&count=false").data
+    assert "count" not in data
+    assert len(data["results"]) == 3
+
+@pytest.mark.django_db
+def test_teacher_my_students_uses_cursor(teacher_user, auth_client, teacher):
+    make_students(teacher, 6)
+    client = auth_client(teacher_user)
+    first = client.get(reverse("teacher-my-students") + "?page_size=5").data
+    assert len(first["results"]) == 5
+    second = client.get(first["next"]).data
+    assert len(second["results"]) == 1
+    assert second["previous"]
+
+@pytest.mark.django_db
+def test_exams_are_paged_by_start_time(admin_user, auth_client):
+    now = timezone.now()
+    for offset in (3, 1, 2):
+        Exam.objects.create(
+            title=f"E{offset}", created_by=admin_user, scope="school",
+            target_standard="10", start_time=now + timedelta(days=offset),
+        )
+    client = auth_client(admin_user)
+    data = client.get(reverse("exam-list") + "?page_size=2").data
+    assert [e["title"] for e in data["results"]] == ["E1", "E2"]
+    assert [e["title"] for e in client.get(data["next"]).data["results"]] == ["E3"]
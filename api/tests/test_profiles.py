@@ -0,0 +1,103 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from api.authentication import ClaimsRefreshToken
+from api.models import CustomUser, Exam
+from api.profiles import get_profile
+
+pytestmark = pytest.mark.django_db
+
+def profile_lookups(queries):
+    """Queries that fetch a Teacher / Student row by its user."""
+    found = 0
+    for q in queries:
+        source, _, where = q["sql"].partition(" FROM ")[2].partition(" WHERE ")
+        for table in ("api_teacher", "api_student"):
+            if source.startswith(f'"{table}"') and f'"{table}"."user_id" =' in where:
+                found += 1
+    return found
+
+def client_for(user, mode):
+    client = APIClient()
+    if mode == "claims":
+        token = ClaimsRefreshToken.for_user(user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    else:
+        # a freshly loaded user – nothing cached on it, like a real request
+        client.force_authenticate(CustomUser.objects.get(pk=user.pk))
+    return client
+
+def answers(questions):
+    return [{"question": q.id, "selected_option": 1} for q in questions]
+
+def teacher_calls(exam, questions):
+    return [
+        ("get", reverse("exam-list"), None),
+        ("post", reverse("exam-list"), {"title": "Quiz", "target_class": "10-A",
+                                        "start_time": timezone.now().isoformat(), "duration_minutes": 5}),
+        ("post", reverse("question-list"), {"exam": exam.id, "text": "?", "option1": "a", "option2": "b",
+                                            "option3": "c", "option4": "d", "correct_option": 1}),
+        ("get", reverse("exam-analytics", args=[exam.id]), None),
+        ("get", reverse("exam-item-analysis", args=[exam.id]), None),
+        ("get", reverse("teacher-me"), None),
+        ("get", reverse("teacher-my-students"), None),
+        ("get", reverse("teacher-student-results"), None),
+    ]
+
+def student_calls(exam, questions):
+    return [
+        ("get", reverse("exam-list"), None),
+        ("get", reverse("exam-questions", args=[exam.id]), None),
+        ("post", reverse("submission-list"), {"exam": exam.id, "answers": answers(questions)}),
+        ("get", reverse("student-my-marks"), None),
+        ("get", reverse("student-me"), None),
+        ("get", reverse("student-my-report-card"), None),
+        ("post", reverse("submission-queue"), {"exam": exam.id, "answers": answers(questions)}),
+    ]
+
+@pytest.mark.parametrize("mode", ["claims", "fresh-user"])
+@pytest.mark.parametrize("role", ["teacher", "student"])
+def test_each_request_resolves_the_profile_at_most_once(
+    role, mode, teacher_user, teacher, student_user, student, exam, questions,
+):
+    user = teacher_user if role == "teacher" else student_user
+    calls = (teacher_calls if role == "teacher" else student_calls)(exam, questions)
+    resolved = 0
+    for method, url, payload in calls:
+        client = client_for(user, mode)
+        with CaptureQueriesContext(connection) as ctx:
+            resp = getattr(client, method)(url, payload, format="json")
+        assert resp.status_code < 400, (url, resp.status_code, getattr(resp, "data", None))
+        lookups = profile_lookups(ctx.captured_queries)
+        assert lookups <= 1, url
+        resolved += lookups
+    if mode == "fresh-user":
+        assert resolved      # the profile is looked up – just never twice
+
+def test_resolver_memoises_on_the_request(rf, teacher_user, teacher, django_assert_num_queries):
+    request = rf.get("/")
+    request.user = CustomUser.objects.get(pk=teacher_user.pk)
+    with django_assert_num_queries(1):
+        assert get_profile(request) == teacher
+        assert get_profile(request) is get_profile(request)
+        assert request.user.teacher is get_profile(request)
+        assert request.user.profile_id == teacher.id
+
+def test_admin_has_no_profile(rf, admin_user, django_assert_num_queries):
+    request = rf.get("/")
+    request.user = admin_user
+    with django_assert_num_queries(0):
+        assert get_profile(request) is None
+
+def test_teacher_without_profile_owns_no_exam(teacher_user, admin_user, auth_client):
+    school_exam = Exam.objects.create(title="Finals", created_by=admin_user, scope="school",
+                                      target_standard="10", start_time=timezone.now())
+    resp = auth_client(teacher_user).post(reverse("question-list"), {
+        "exam": school_exam.id, "text": "?", "option1": "a", "option2": "b",
+        "option3": "c", "option4": "d", "correct_option": 1,
+    }, format="json")
+    assert resp.status_code == 403
+    assert not school_exam.questions.exists()
@@ -0,0 +1,66 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import serializers
+
+from api import profiling
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def profiled(settings):
+    profiling.RECENT.clear()
+    settings.PROFILING = {"ENABLED": True, "SAMPLE_RATE": 1.0, "SLOW_QUERIES": 2}
+    yield
+    profiling.RECENT.clear()
+    profiling.uninstall_serializer_timer()
+
+def timings(resp):
+    return {
+        part.split(";")[0].strip(): part
+        for part in resp["Server-Timing"].split(",")
+    }
+
+def test_disabled_by_default(auth_client, teacher, settings):
+    profiling.uninstall_serializer_timer()     # other tests may have profiled a request
+    settings.PROFILING = {"ENABLED": False}
+    resp = auth_client(teacher.user).get(reverse("teacher-me"))
+    assert resp.status_code == 200
+    assert "Server-Timing" not in resp
+    assert serializers.BaseSerializer.data is profiling._original_data
+
+def test_sampled_out_requests_are_not_profiled(profiled, auth_client, teacher, settings):
+    settings.PROFILING = {"ENABLED": True, "SAMPLE_RATE": 0.0}
+    resp = auth_client(teacher.user).get(reverse("teacher-me"))
+    assert "Server-Timing" not in resp
+    assert profiling.recent_profiles() == []
+
+def test_profiled_request_reports_breakdown(profiled, auth_client, admin_user, student):
+    client = auth_client(admin_user)
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.get(reverse("student-list"))
+    assert resp.status_code == 200
+
+    parts = timings(resp)
+    assert set(parts) == {"total", "db", "view", "serialize", "render"}
+    assert f'desc="{len(ctx.captured_queries)} queries"' in parts["db"]
+
+    [summary] = profiling.recent_profiles()
+    assert summary["path"] == reverse("student-list")
+    assert summary["status"] == 200
+    assert summary["db_queries"] == len(ctx.captured_queries)
+    assert len(summary["slow_queries"]) == 2
+    assert summary["slow_queries"][0]["ms"] >= summary["slow_queries"][1]["ms"]
+    assert summary["serializer_ms"] > 0
+    assert summary["total_ms"] >= summary["view_ms"] >= summary["serializer_ms"]
+    assert serializers.BaseSerializer.data is not profiling._original_data
+
+def test_profiling_endpoint_is_admin_only(profiled, auth_client, admin_user, teacher):
+    auth_client(teacher.user).get(reverse("teacher-me"))
+    assert auth_client(teacher.user).get(reverse("profiling")).status_code == 403
+
+    resp = auth_client(admin_user).get(reverse("profiling"), {"path": "/api/teachers"})
+    assert resp.status_code == 200
+    assert resp.data["enabled"] is True
+    assert [p["path"] for p in resp.data["results"]] == ["/api/teachers/me"]
@@ -0,0 +1,97 @@
+"""
+Query‑count budgets per endpoint.  Every check runs against a small and a
+larger seeded school: the count must stay within budget *and* must not
+grow with the data – an N+1 in a view or serializer fails here.
+"""
+import csv
+import io
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+pytestmark = pytest.mark.django_db
+
+SMALL = dict(teachers=2, students_per_teacher=3, questions_per_exam=3)
+LARGE = dict(teachers=4, students_per_teacher=12, questions_per_exam=20)
+
+def count_queries(user, method, url, **kwargs):
+    client = APIClient()
+    client.force_authenticate(user)
+    with CaptureQueriesContext(connection) as ctx:
+        resp = getattr(client, method)(url, **kwargs)
+        if getattr(resp, "streaming", False):
+            b"".join(resp.streaming_content)
+    assert resp.status_code < 400, getattr(resp, "data", resp)
+    return len(ctx.captured_queries)
+
+def budget(seeded, measure, limit):
+    small = measure(seeded(prefix="small", **SMALL))
+    large = measure(seeded(prefix="large", **LARGE))
+    assert large == small, f"query count grew with data: {small} -> {large}"
+    assert large <= limit, f"{large} queries, budget is {limit}"
+
+def test_students_list_budget(seeded):
+    budget(seeded, lambda d: count_queries(
+        d["admin"], "get", reverse("student-list") + "?page_size=100"), 2)
+
+def test_my_students_budget(seeded):
+    budget(seeded, lambda d: count_queries(
+        d["teachers"][-1].user, "get", reverse("teacher-my-students") + "?page_size=100"), 3)
+
+def test_my_marks_budget(seeded):
+    budget(seeded, lambda d: count_queries(
+        d["students"][-1].user, "get", reverse("student-my-marks")), 2)
+
+def test_student_results_budget(seeded):
+    budget(seeded, lambda d: count_queries(
+        d["teachers"][-1].user, "get", reverse("teacher-student-results")), 2)
+
+def test_exam_questions_budget(seeded):
+    def measure(d):
+        student = d["students"][-1]
+        exam = next(e for e in d["exams"] if e.is_eligible(student))
+        return count_queries(student.user, "get", reverse("exam-questions", args=[exam.id]))
+    budget(seeded, measure, 3)
+
+def test_submission_create_budget(seeded):
+    def measure(d):
+        student = d["students"][-1]
+        exam = next(e for e in d["exams"] if e.is_eligible(student))
+        exam.examsubmission_set.filter(student=student).delete()
+        answers = [
+            {"question": q.id, "selected_option": 1}
+            for q in d["questions"] if q.exam_id == exam.id
+        ]
+        return count_queries(
+            student.user, "post", reverse("submission-list"),
+            data={"exam": exam.id, "answers": answers}, format="json",
+        )
+    budget(seeded, measure, 12)   # includes the savepoint and ExamStats/QuestionStats INSERT-if-missing + UPDATE
+
+def test_csv_export_budget(seeded):
+    budget(seeded, lambda d: count_queries(d["admin"], "get", reverse("student-export-csv")), 1)
+
+def test_csv_import_budget(seeded):
+    def measure(d):
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow([
+            "username", "email", "first_name", "last_name", "password", "phone",
+            "roll_number", "student_class", "date_of_birth", "admission_date",
+            "status", "assigned_teacher_id",
+        ])
+        for i, student in enumerate(d["students"]):
+            writer.writerow([
+                f"{student.roll_number}-new", "", "N", "S", "pw", "1",
+                f"{student.roll_number}-new", student.student_class,
+                "2010-01-01", "2024-06-01", "active", student.assigned_teacher_id,
+            ])
+        upload = io.BytesIO(out.getvalue().encode())
+        upload.name = "students.csv"
+        return count_queries(
+            d["admin"], "post", reverse("student-import-csv"),
+            data={"file": upload}, format="multipart",
+        )
+    budget(seeded, measure, 11)   # + one UPDATE bumping Teacher.classes_version
@@ -0,0 +1,56 @@
+import pytest
+from django.urls import reverse
+from api.models import Question
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(params=["locmem", "file"])
+def cache_backend(request, settings, tmp_path):
+    if request.param == "file":
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": str(tmp_path / "cache"),
+            }
+        }
+    return request.param
+
+def test_question_paper_is_served_from_cache(
+    cache_backend, student_user, auth_client, student, exam, questions,
+    django_assert_num_queries,
+):
+    client = auth_client(student_user)
+    url = reverse("exam-questions", args=[exam.id])
+    first = client.get(url)
+    assert first.status_code == 200
+    assert [q["id"] for q in first.json()] == [q.id for q in questions]
+    assert "correct_option" not in first.json()[0]
+
+    # exam lookup only – no question query, no serialization
+    with django_assert_num_queries(1):
+        second = client.get(url)
+    assert second.content == first.content
+
+def test_question_changes_invalidate_paper(
+    cache_backend, admin_user, teacher_user, student_user, auth_client,
+    student, exam, questions,
+):
+    url = reverse("exam-questions", args=[exam.id])
+    student_client = auth_client(student_user)
+    assert len(student_client.get(url).json()) == 5
+
+    teacher_client = auth_client(teacher_user)
+    detail = reverse("question-detail", args=[questions[0].id])
+    assert teacher_client.patch(detail, {"text": "Changed?"}, format="json").status_code == 200
+    assert teacher_client.delete(reverse("question-detail", args=[questions[1].id])).status_code == 204
+    resp = teacher_client.post(reverse("question-list"), {
+        "exam": exam.id, "text": "New?", "option1": "a", "option2": "b",
+        "option3": "c", "option4": "d", "correct_option": 1,
+    }, format="json")
+    assert resp.status_code == 201
+
+    paper = auth_client(student_user).get(url).json()
+    assert [q["text"] for q in paper][0] == "Changed?"
+    assert questions[1].id not in [q["id"] for q in paper]
+    assert paper[-1]["text"] == "New?"
+    assert len(paper) == Question.objects.filter(exam=exam).count()
@@ -0,0 +1,74 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from api.models import ExamSubmission
+
+pytestmark = pytest.mark.django_db
+
+def test_student_report_card(seeded, auth_client):
+    data = seeded(teachers=2, students_per_teacher=4, questions_per_exam=3, seed=2)
+    student = data["students"][0]
+    resp = auth_client(student.user).get(reverse("student-my-report-card"))
+    assert resp.status_code == 200
+    assert resp.data["roll_number"] == student.roll_number
+
+    subs = {s.exam_id: s for s in ExamSubmission.objects.filter(student=student)}
+    assert {e["exam"] for e in resp.data["exams"]} == set(subs)
+    for row in resp.data["exams"]:
+        mine = subs[row["exam"]]
+        classmates = ExamSubmission.objects.filter(
+            exam_id=row["exam"], student__student_class=student.student_class
+        )
+        assert row["score"] == mine.score
+        assert row["max_score"] == 3
+        assert row["class_submissions"] == classmates.count()
+        assert row["class_rank"] == classmates.filter(score__gt=mine.score).count() + 1
+        assert [a["question"] for a in row["answers"]] == sorted(
+            mine.answers.values_list("question_id", flat=True)
+        )
+        assert sum(a["is_correct"] for a in row["answers"]) == mine.score
+
+def test_unattempted_exam_has_no_score(seeded, auth_client):
+    data = seeded(teachers=1, students_per_teacher=2, submission_rate=0.0)
+    resp = auth_client(data["students"][0].user).get(reverse("student-my-report-card"))
+    assert resp.data["exams"]
+    assert all(e["score"] is None and e["class_rank"] is None and e["answers"] == []
+               for e in resp.data["exams"])
+
+def test_class_change_keeps_taken_exams(student_user, auth_client, student, exam):
+    ExamSubmission.objects.create(student=student, exam=exam, score=4)
+    student.student_class = "9-A"
+    student.save()
+
+    assert not exam.is_eligible(student)
+    rows = auth_client(student_user).get(reverse("student-my-report-card")).data["exams"]
+    assert [(r["exam"], r["score"]) for r in rows] == [(exam.id, 4)]
+
+def test_teacher_sees_only_own_students(seeded, auth_client):
+    data = seeded(teachers=2, students_per_teacher=2)
+    teacher = data["teachers"][0]
+    own = next(s for s in data["students"] if s.assigned_teacher_id == teacher.id)
+    other = next(s for s in data["students"] if s.assigned_teacher_id != teacher.id)
+    client = auth_client(teacher.user)
+    assert client.get(reverse("student-report-card", args=[own.id])).status_code == 200
+    assert client.get(reverse("student-report-card", args=[other.id])).status_code == 404
+    assert auth_client(data["admin"]).get(
+        reverse("student-report-card", args=[other.id])
+    ).status_code == 200
+
+def test_report_card_query_count_is_constant(seeded, auth_client):
+    def measure(**sizes):
+        data = seeded(**sizes)
+        client = auth_client(data["students"][0].user)
+        with CaptureQueriesContext(connection) as ctx:
+            assert client.get(reverse("student-my-report-card")).status_code == 200
+        return len(ctx.captured_queries)
+
+    small = measure(prefix="s", teachers=1, students_per_teacher=2,
+                    class_exams_per_teacher=1, questions_per_exam=2)
+    large = measure(prefix="l", teachers=1, students_per_teacher=8,
+                    class_exams_per_teacher=6, school_exams=3, questions_per_exam=15)
+    # the student profile comes with the authenticated user (api/profiles.py)
+    assert small == large == 3
@@ -0,0 +1,72 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from api.ingestion import flush_pending
+from api.models import Answer, ExamSubmission, PendingSubmission
+
+pytestmark = pytest.mark.django_db
+
+def payload(exam, questions, option=4):
+    return {
+        "exam": exam.id,
+        "answers": [{"question": q.id, "selected_option": option} for q in questions],
+    }
+
+def test_queued_submission_is_scored_by_flusher(
+    student_user, auth_client, student, exam, questions
+):
+    client = auth_client(student_user)
+    resp = client.post(reverse("submission-queue"), payload(exam, questions), format="json")
+    assert resp.status_code == status.HTTP_202_ACCEPTED
+    receipt = resp.data["receipt"]
+    assert resp.data["status"] == "queued"
+    assert not ExamSubmission.objects.exists()
+
+    receipt_url = reverse("submission-receipt", kwargs={"receipt": receipt})
+    assert client.get(receipt_url).data["score"] is None
+
+    call_command("flush_submissions", "--once")
+
+    data = client.get(receipt_url).data
+    assert data["status"] == "accepted"
+    assert data["score"] == 5
+    sub = ExamSubmission.objects.get(exam=exam, student=student)
+    assert sub.submitted_at == PendingSubmission.objects.get().received_at
+    assert Answer.objects.filter(submission=sub).count() == 5
+
+def test_duplicate_queue_is_rejected_up_front(student_user, auth_client, student, exam, questions):
+    client = auth_client(student_user)
+    url = reverse("submission-queue")
+    assert client.post(url, payload(exam, questions), format="json").status_code == 202
+    assert client.post(url, payload(exam, questions), format="json").status_code == 400
+
+def test_flusher_keeps_one_submission_per_exam(
+    student_user, auth_client, student, exam, questions
+):
+    client = auth_client(student_user)
+    assert client.post(reverse("submission-list"), payload(exam, questions), format="json").status_code == 201
+    resp = client.post(reverse("submission-queue"), payload(exam, questions, option=1), format="json")
+    assert resp.status_code == 202
+
+    assert flush_pending() == 1
+    pending = PendingSubmission.objects.get(receipt=resp.data["receipt"])
+    assert pending.status == "rejected"
+    assert "already submitted" in pending.error
+    assert ExamSubmission.objects.get().score == 5
+
+def test_flusher_rejects_foreign_questions(student_user, auth_client, student, exam, questions):
+    client = auth_client(student_user)
+    bad = {"exam": exam.id, "answers": [{"question": 999999, "selected_option": 1}]}
+    resp = client.post(reverse("submission-queue"), bad, format="json")
+    flush_pending()
+    data = client.get(reverse("submission-receipt", kwargs={"receipt": resp.data["receipt"]})).data
+    assert data["status"] == "rejected"
+    assert "does not belong" in data["error"]
+
+def test_receipts_are_private(student_user, auth_client, student, exam, questions, user_factory):
+    client = auth_client(student_user)
+    receipt = client.post(reverse("submission-queue"), payload(exam, questions), format="json").data["receipt"]
+    client.force_authenticate(user_factory("other", role="student"))
+    url = reverse("submission-receipt", kwargs={"receipt": receipt})
+    assert client.get(url).status_code == 404
@@ -0,0 +1,100 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from api.importers import StudentImporter
+from api.models import CustomUser, Exam, Student, Teacher
+
+pytestmark = pytest.mark.django_db
+
+def fresh(teacher):
+    return Teacher.objects.get(pk=teacher.pk)
+
+def as_user(auth_client, user):
+    # a real request loads the user (and teacher) afresh each time
+    return lambda: auth_client(CustomUser.objects.get(pk=user.pk))
+
+def test_classes_taught_is_cached(teacher, student, django_assert_num_queries):
+    assert teacher.classes_taught() == {"classes": ["10-A"], "standards": ["10"]}
+    with django_assert_num_queries(0):
+        teacher.classes_taught()
+
+def test_moving_a_student_invalidates_both_teachers(teacher, another_teacher, student):
+    fresh(teacher).classes_taught()
+    fresh(another_teacher).classes_taught()
+
+    student.assigned_teacher = another_teacher
+    student.student_class = "9-B"
+    student.save()
+
+    assert fresh(teacher).classes_taught()["classes"] == []
+    assert fresh(another_teacher).classes_taught() == {"classes": ["9-B"], "standards": ["9"]}
+
+    student.delete()
+    assert fresh(another_teacher).classes_taught()["classes"] == []
+
+def test_queryset_update_invalidates_and_refreshes_eligibility(teacher, another_teacher, student, exam):
+    fresh(teacher).classes_taught()
+    fresh(another_teacher).classes_taught()
+
+    Student.objects.filter(pk=student.pk).update(assigned_teacher=another_teacher, student_class="9-B")
+
+    moved = Student.objects.get(pk=student.pk)
+    assert (moved.standard, moved.section) == ("9", "B")
+    assert not exam.eligibility.filter(student=student).exists()
+    assert fresh(teacher).classes_taught()["classes"] == []
+    assert fresh(another_teacher).classes_taught()["classes"] == ["9-B"]
+
+def test_cascade_delete_invalidates(teacher, student):
+    fresh(teacher).classes_taught()
+    student.user.delete()       # removes the student without Student.delete
+    assert fresh(teacher).classes_taught()["classes"] == []
+
+def test_classes_version_is_not_exposed(auth_client, teacher_user, teacher):
+    assert "classes_version" not in auth_client(teacher_user).get(reverse("teacher-me")).data
+
+def test_bulk_import_invalidates(teacher, student):
+    fresh(teacher).classes_taught()
+    row = {
+        "username": "imp", "email": "imp@x.com", "first_name": "I", "last_name": "P",
+        "password": "pass", "phone": "1", "roll_number": "IMP1", "student_class": "11-C",
+        "date_of_birth": "2010-01-01", "admission_date": "2024-06-01",
+        "assigned_teacher_id": str(teacher.id),
+    }
+    created, errors = StudentImporter().run([row])
+    assert errors == []
+    assert fresh(teacher).classes_taught()["classes"] == ["10-A", "11-C"]
+
+def test_teacher_exam_list_uses_cached_standards(teacher_user, auth_client, teacher, student, admin_user):
+    Exam.objects.create(title="Std 10", created_by=admin_user, scope="school",
+                        target_standard="10", start_time=timezone.now())
+    Exam.objects.create(title="Std 11", created_by=admin_user, scope="school",
+                        target_standard="11", start_time=timezone.now())
+    client = as_user(auth_client, teacher_user)
+    url = reverse("exam-list") + "?count=false"
+
+    def titles():
+        with CaptureQueriesContext(connection) as ctx:
+            resp = client().get(url)
+        assert all("api_student" not in q["sql"] for q in ctx.captured_queries)
+        return sorted(e["title"] for e in resp.data["results"])
+
+    client().get(url)           # warm the classes cache
+    assert titles() == ["Std 10"]
+
+    student.student_class = "11-A"
+    student.save()
+    client().get(url)
+    assert titles() == ["Std 11"]
+
+def test_teacher_exam_create_checks_cached_classes(teacher_user, auth_client, teacher, student):
+    client = as_user(auth_client, teacher_user)
+    payload = {"title": "Quiz", "start_time": timezone.now().isoformat(), "duration_minutes": 10}
+    resp = client().post(reverse("exam-list"), {**payload, "target_class": "9-Z"}, format="json")
+    assert resp.status_code == 400
+
+    student.student_class = "9-Z"
+    student.save()
+    resp = client().post(reverse("exam-list"), {**payload, "target_class": "9-Z"}, format="json")
+    assert resp.status_code == 201, resp.data
@@ -57,3 +57,14 @@ def test_admin_can_crud_exam_and_questions(admin_user, auth_client, teacher):
 
     assert client.delete(detail_url).status_code == 204
 
+
+def test_student_sees_only_eligible_exams(student_user, auth_client, student, exam, admin_user):
+    other = Exam.objects.create(
+        title="Std 1 paper", created_by=admin_user, scope="school",
+        target_standard="1", start_time=exam.start_time,
+    )
+    client = auth_client(student_user)
+    resp = client.get(reverse("exam-list"))
+    ids = [e["id"] for e in resp.data["results"]]
+    assert ids == [exam.id]
+    assert client.get(reverse("exam-questions", args=[other.id])).status_code == 404
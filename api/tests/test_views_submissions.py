@@ -2,7 +2,10 @@ import pytest
 from datetime import timedelta
 from django.urls import reverse
 from django.utils import timezone
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
+from api.models import Exam, ExamSubmission, Question
 
 pytestmark = pytest.mark.django_db
 
@@ -30,3 +33,73 @@ def test_late_submission_block(student_user, auth_client, student, exam, questio
     resp = client.post(url, {"exam": exam.id, "answers": answers}, format="json")
 
     assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_submission_is_scored_from_answer_key(student_user, auth_client, student, exam, questions):
+    client = auth_client(student_user)
+    answers = [
+        {"question": q.id, "selected_option": 4 if i < 3 else 1}
+        for i, q in enumerate(questions)
+    ]
+    resp = client.post(reverse("submission-list"), {"exam": exam.id, "answers": answers}, format="json")
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert resp.data["score"] == 3
+    sub = ExamSubmission.objects.get(pk=resp.data["id"])
+    assert sub.score == 3
+    assert sub.answers.count() == 5
+
+def test_submissions_cannot_be_edited(student_user, auth_client, student, exam, questions):
+    client = auth_client(student_user)
+    sub = ExamSubmission.objects.create(student=student, exam=exam, score=2)
+    url = reverse("submission-detail", args=[sub.id])
+    assert client.patch(url, {}, format="json").status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+    assert client.put(url, {"exam": exam.id, "answers": []}, format="json").status_code == 405
+    assert client.get(url).data["score"] == 2
+
+def test_submission_rejects_foreign_and_duplicate_questions(
+    student_user, auth_client, student, exam, questions, admin_user
+):
+    other = Exam.objects.create(
+        title="Other", created_by=admin_user, scope="school",
+        target_standard="10", start_time=timezone.now(),
+    )
+    foreign = Question.objects.create(
+        exam=other, text="?", option1="a", option2="b", option3="c",
+        option4="d", correct_option=1,
+    )
+    client = auth_client(student_user)
+    answers = [
+        {"question": foreign.id, "selected_option": 1},
+        {"question": questions[0].id, "selected_option": 4},
+        {"question": questions[0].id, "selected_option": 4},
+    ]
+    resp = client.post(reverse("submission-list"), {"exam": exam.id, "answers": answers}, format="json")
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert len(resp.data["answers"]) == 2
+    assert not ExamSubmission.objects.exists()
+
+def test_submission_query_count_independent_of_paper_size(
+    student_user, auth_client, student, exam, questions
+):
+    client = auth_client(student_user)
+
+    def submit():
+        answers = [{"question": q.id, "selected_option": 4} for q in exam.questions.all()]
+        with CaptureQueriesContext(connection) as ctx:
+            resp = client.post(
+                reverse("submission-list"), {"exam": exam.id, "answers": answers}, format="json"
+            )
+        assert resp.status_code == status.HTTP_201_CREATED
+        ExamSubmission.objects.all().delete()
+        return len(ctx.captured_queries)
+
+    submit()                # first submission creates the stats rows
+    small = submit()
+    Question.objects.bulk_create(
+        Question(exam=exam, text=f"extra {i}", option1="a", option2="b",
+                 option3="c", option4="d", correct_option=2)
+        for i in range(95)
+    )
+    exam.content_version += 1
+    exam.save(update_fields=["content_version"])
+    submit()
+    assert submit() == small
@@ -1,6 +1,7 @@
 from rest_framework.routers import DefaultRouter
-from .views import TeacherViewSet, StudentViewSet, ExamViewSet, QuestionViewSet, ExamSubmissionViewSet, PasswordResetRequestView, PasswordResetConfirmView
+from .views import TeacherViewSet, StudentViewSet, ExamViewSet, QuestionViewSet, ExamSubmissionViewSet, JobViewSet, ProfilingView, PasswordResetRequestView, PasswordResetConfirmView
 from django.urls import path, include
+from . import async_views
 
 router = DefaultRouter(trailing_slash=False)
 router.register(r'teachers', TeacherViewSet, basename='teacher')
@@ -8,6 +9,7 @@ router.register(r'students', StudentViewSet, basename='student')
 router.register(r'exams', ExamViewSet, basename='exam')
 router.register(r'questions', QuestionViewSet, basename='question')
 router.register(r'submissions', ExamSubmissionViewSet, basename='submission')
+router.register(r'jobs', JobViewSet, basename='job')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -15,4 +17,16 @@ urlpatterns = [
          name='password-reset'),
     path('password-reset/confirm',   PasswordResetConfirmView.as_view(),
          name='password-reset-confirm'),
+    path('profiling',                ProfilingView.as_view(),
+         name='profiling'),
+
+    # async (ASGI) read path – see api/async_views.py
+    path('async/exams',                   async_views.exam_list,
+         name='async-exam-list'),
+    path('async/exams/<int:pk>/questions', async_views.exam_questions,
+         name='async-exam-questions'),
+    path('async/students/my_marks',       async_views.my_marks,
+         name='async-my-marks'),
+    path('async/teachers/student-results', async_views.student_results,
+         name='async-student-results'),
 ]
@@ -4,8 +4,9 @@ from datetime import timedelta
 from django.conf import settings
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.core.mail import send_mail
+from django.db import IntegrityError, transaction
 from django.db.models import Q
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse
 from django.utils import timezone
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
@@ -15,9 +16,39 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework.generics import GenericAPIView
 from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from api.permissions import IsAdmin, IsStudent, IsTeacher
-from .models import CustomUser, Teacher, Student, Exam, ExamSubmission, Question
+from .analytics import exam_analytics
+from .caching import cached, question_paper_key
+from .conditional import conditional, fingerprint, queryset_validators
+from .item_analysis import exam_item_analysis
+from .exporters import (
+    STUDENT_HEADER,
+    TEACHER_HEADER,
+    student_rows,
+    streaming_csv_response,
+    teacher_rows,
+)
+from .importers import StudentImporter, TeacherImporter, flatten_nested
+from .jobs import enqueue
+from .lean import LEAN_RENDERERS, nest_student, student_values, submission_rows
+from .models import (
+    CustomUser,
+    Teacher,
+    Student,
+    Exam,
+    ExamSubmission,
+    ExamStats,
+    Question,
+    QuestionStats,
+    Job,
+    PendingSubmission,
+)
+from .pagination import ExamKeysetPagination, KeysetPagination
+from .profiles import get_profile, get_profile_id
+from .profiling import profiling_settings, recent_profiles
+from .reports import report_card_exams
 from .serializers import (
     ExamMetaSerializer,
     PasswordResetConfirmSerializer,
@@ -29,15 +60,41 @@ from .serializers import (
     QuestionCreateSerializer,
     QuestionPublicSerializer,
     ExamSubmissionSerializer,
+    ReportCardSerializer,
+    JobSerializer,
+    QueuedSubmissionSerializer,
 )
 
 
+def job_accepted(job, request):
+    data = JobSerializer(job, context={"request": request}).data
+    return Response(
+        {"job_id": job.id, **data},
+        status=status.HTTP_202_ACCEPTED,
+        headers={"Location": f"/api/jobs/{job.id}"},
+    )
+
+
+def bulk_create_response(request, importer, fk_fields=()):
+    """
+    POST a JSON list of nested serializer payloads; users are provisioned in
+    one batch instead of one serializer save per item.
+    """
+    items = request.data
+    if not isinstance(items, list) or not all(isinstance(i, dict) for i in items):
+        return Response({"detail": "Expected a list of objects."}, status=400)
+    created, errors = importer.run(flatten_nested(item, fk_fields) for item in items)
+    status_code = status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST
+    return Response({"created": created, "errors": errors}, status=status_code)
+
+
 # -----------------------------------------------------------------------------------
 #  TEACHERS
 # -----------------------------------------------------------------------------------
 class TeacherViewSet(viewsets.ModelViewSet):
     queryset = Teacher.objects.all()
     serializer_class = TeacherSerializer
+    pagination_class = KeysetPagination
 
     # --------------------------------------------------
     # Permissions
@@ -55,10 +112,11 @@ class TeacherViewSet(viewsets.ModelViewSet):
     # --------------------------------------------------
     def get_queryset(self):
         user = self.request.user
+        qs = Teacher.objects.select_related("user")
         if getattr(user, "role", None) == "admin":
-            return Teacher.objects.all()
+            return qs
         if getattr(user, "role", None) == "teacher":
-            return Teacher.objects.filter(user=user)
+            return qs.filter(user=user)
         return Teacher.objects.none()
 
     # --------------------------------------------------
@@ -66,7 +124,7 @@ class TeacherViewSet(viewsets.ModelViewSet):
     # --------------------------------------------------
     @action(detail=False, methods=["get"], url_path="me", permission_classes=[IsTeacher])
     def me(self, request):
-        teacher = Teacher.objects.filter(user=request.user).first()
+        teacher = get_profile(request)
         if not teacher:
             return Response({"detail": "Teacher profile not found."}, status=404)
         return Response(self.get_serializer(teacher).data)
@@ -76,57 +134,53 @@ class TeacherViewSet(viewsets.ModelViewSet):
         methods=["get"],
         url_path="me/students",
         permission_classes=[IsTeacher],
+        renderer_classes=LEAN_RENDERERS,
     )
     def my_students(self, request):
-        teacher = Teacher.objects.filter(user=request.user).first()
-        if not teacher:
+        teacher_id = get_profile_id(request)
+        if not teacher_id:
             return Response({"detail": "Teacher profile not found."}, status=404)
 
-        students = Student.objects.filter(assigned_teacher=teacher).order_by("id")
+        students = student_values(Student.objects.filter(assigned_teacher_id=teacher_id).order_by("id"))
         page = self.paginate_queryset(students)
         if page is not None:
-            return self.get_paginated_response(StudentSerializer(page, many=True).data)
-        return Response(StudentSerializer(students, many=True).data)
+            return self.get_paginated_response([nest_student(row) for row in page])
+        return Response([nest_student(row) for row in students])
 
     @action(
         detail=False,
         methods=["get"],
         url_path="student-results",
         permission_classes=[IsTeacher],
+        renderer_classes=LEAN_RENDERERS,
     )
     def student_results(self, request):
         """
         Results for **students taught by this teacher** –
         includes school‑level and class‑level exams.
         """
-        teacher = Teacher.objects.get(user=request.user)
+        teacher_id = get_profile_id(request)
+        if not teacher_id:
+            return Response({"detail": "Teacher profile not found."}, status=404)
         subs = (
-            ExamSubmission.objects.filter(student__assigned_teacher=teacher)
-            .select_related("exam", "student")
+            ExamSubmission.objects.filter(student__assigned_teacher_id=teacher_id)
             .order_by("exam_id", "student_id")
         )
-        return Response(ExamSubmissionSerializer(subs, many=True).data)
+        return Response(submission_rows(subs))
 
     @action(detail=False, methods=["get"], url_path="export", permission_classes=[IsAdmin])
     def export_csv(self, request):
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = 'attachment; filename="teachers.csv"'
-        writer = csv.writer(response)
-        writer.writerow(
-            ["Username", "Email", "Phone", "Subject", "Employee ID", "Status"]
+        return streaming_csv_response(
+            "teachers.csv", TEACHER_HEADER, teacher_rows(self.get_queryset())
         )
-        for t in self.get_queryset():
-            writer.writerow(
-                [
-                    t.user.username,
-                    t.user.email,
-                    t.phone,
-                    t.subject_specialization,
-                    t.employee_id,
-                    t.status,
-                ]
-            )
-        return response
+
+    @action(detail=False, methods=["post"], url_path="export-async", permission_classes=[IsAdmin])
+    def export_csv_async(self, request):
+        return job_accepted(enqueue("teacher_export", request.user), request)
+
+    @action(detail=False, methods=["post"], url_path="bulk", permission_classes=[IsAdmin])
+    def bulk(self, request):
+        return bulk_create_response(request, TeacherImporter())
 
 
 # -----------------------------------------------------------------------------------
@@ -135,6 +189,7 @@ class TeacherViewSet(viewsets.ModelViewSet):
 class StudentViewSet(viewsets.ModelViewSet):
     queryset = Student.objects.all()
     serializer_class = StudentSerializer
+    pagination_class = KeysetPagination
 
     # --------------------------------------------------
     # Permissions
@@ -143,9 +198,9 @@ class StudentViewSet(viewsets.ModelViewSet):
         role = getattr(self.request.user, "role", None)
         if role == "admin":
             return [permissions.IsAuthenticated(), IsAdmin()]
-        if role == "teacher" and self.action in ["list", "retrieve"]:
+        if role == "teacher" and self.action in ["list", "retrieve", "report_card"]:
             return [permissions.IsAuthenticated(), IsTeacher()]
-        if role == "student" and self.action in ["me", "my_marks"]:
+        if role == "student" and self.action in ["me", "my_marks", "my_report_card"]:
             return [permissions.IsAuthenticated(), IsStudent()]
         raise PermissionDenied("Not allowed.")
 
@@ -155,12 +210,13 @@ class StudentViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         user = self.request.user
         role = getattr(user, "role", None)
+        qs = Student.objects.select_related("user")
         if role == "admin":
-            return Student.objects.all()
+            return qs
         if role == "teacher":
-            return Student.objects.filter(assigned_teacher__user=user)
+            return qs.filter(assigned_teacher__user=user)
         if role == "student":
-            return Student.objects.filter(user=user)
+            return qs.filter(user=user)
         return Student.objects.none()
 
     # --------------------------------------------------
@@ -168,38 +224,52 @@ class StudentViewSet(viewsets.ModelViewSet):
     # --------------------------------------------------
     @action(detail=False, methods=["get"], url_path="me", permission_classes=[IsStudent])
     def me(self, request):
-        student = Student.objects.filter(user=request.user).first()
+        student = get_profile(request)
         if not student:
             return Response({"detail": "Student profile not found."}, status=404)
         return Response(self.get_serializer(student).data)
 
-    @action(detail=False, methods=["get"], permission_classes=[IsStudent])
+    @action(detail=False, methods=["get"], permission_classes=[IsStudent],
+            renderer_classes=LEAN_RENDERERS)
     def my_marks(self, request):
-        student = Student.objects.get(user=request.user)
-        subs = (
-            ExamSubmission.objects.filter(student=student)
-            .select_related("exam")
-            .order_by("exam_id")
+        subs = ExamSubmission.objects.filter(student_id=get_profile_id(request))
+        etag, last_modified = queryset_validators(subs, request)
+        return conditional(
+            request, etag, last_modified,
+            lambda: Response(submission_rows(subs.order_by("exam_id"))),
         )
-        return Response(ExamSubmissionSerializer(subs, many=True).data)
+
+    def _report_card(self, student):
+        context = {"exams": report_card_exams(student)}
+        return Response(ReportCardSerializer(student, context=context).data)
+
+    @action(detail=True, methods=["get"], url_path="report-card")
+    def report_card(self, request, pk=None):
+        """Report card of one student – admins, or the student's own teacher."""
+        return self._report_card(self.get_object())
+
+    @action(detail=False, methods=["get"], url_path="me/report-card", permission_classes=[IsStudent])
+    def my_report_card(self, request):
+        student = get_profile(request)
+        if not student:
+            return Response({"detail": "Student profile not found."}, status=404)
+        return self._report_card(student)
 
     @action(detail=False, methods=["get"], url_path="export", permission_classes=[IsAdmin])
     def export_csv(self, request):
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = 'attachment; filename="students.csv"'
-        writer = csv.writer(response)
-        writer.writerow(["Username", "Email", "Phone", "Assigned Teacher", "Status"])
-        for s in self.get_queryset():
-            writer.writerow(
-                [
-                    s.user.username,
-                    s.user.email,
-                    s.phone,
-                    s.assigned_teacher.user.username if s.assigned_teacher else "",
-                    s.status,
-                ]
-            )
-        return response
+        return streaming_csv_response(
+            "students.csv", STUDENT_HEADER, student_rows(self.get_queryset())
+        )
+
+    @action(detail=False, methods=["post"], url_path="export-async", permission_classes=[IsAdmin])
+    def export_csv_async(self, request):
+        return job_accepted(enqueue("student_export", request.user), request)
+
+    @action(detail=False, methods=["post"], url_path="bulk", permission_classes=[IsAdmin])
+    def bulk(self, request):
+        return bulk_create_response(
+            request, StudentImporter(), fk_fields=("assigned_teacher",)
+        )
 
     # --------------------------------------------------
     # CSV import (admin only)
@@ -220,47 +290,33 @@ class StudentViewSet(viewsets.ModelViewSet):
             return Response({"detail": "CSV file is required."}, status=400)
 
         decoded = TextIOWrapper(file, encoding="utf-8")
-        reader = csv.DictReader(decoded)
-
-        created, errors = [], []
-
-        for row_no, row in enumerate(reader, start=1):
-            try:
-                user_data = {
-                    "username": row["username"],
-                    "email": row["email"],
-                    "first_name": row["first_name"],
-                    "last_name": row["last_name"],
-                    "password": row["password"],
-                }
-                teacher_id = row.get("assigned_teacher_id")
-                teacher = (
-                    Teacher.objects.get(id=int(teacher_id)) if teacher_id else None
-                )
-                student_data = {
-                    "user": user_data,
-                    "phone": row["phone"],
-                    "roll_number": row["roll_number"],
-                    "student_class": row["student_class"],
-                    "date_of_birth": row["date_of_birth"],
-                    "admission_date": row["admission_date"],
-                    "status": row.get("status", "active"),
-                    "assigned_teacher": teacher.id if teacher else None,
-                }
-                ser = StudentSerializer(data=student_data)
-                ser.is_valid(raise_exception=True)
-                ser.save()
-                created.append(ser.data)
-            except Exception as exc:  
-                errors.append(f"Row {row_no}: {exc}")
+        created, errors = StudentImporter().run(csv.DictReader(decoded))
 
         status_code = status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST
         return Response({"created": created, "errors": errors}, status=status_code)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import-async",
+        parser_classes=[MultiPartParser],
+        permission_classes=[IsAdmin],
+    )
+    def import_csv_async(self, request):
+        """
+        Same payload as ``import``; returns a job id immediately and the
+        rows are processed by ``manage.py run_jobs``.
+        """
+        file = request.FILES.get("file")
+        if not file:
+            return Response({"detail": "CSV file is required."}, status=400)
+        return job_accepted(enqueue("student_import", request.user, file), request)
+
 class ExamViewSet(viewsets.ModelViewSet):
 
     queryset = Exam.objects.select_related("assigned_teacher")
     permission_classes = [IsAuthenticated]
+    pagination_class = ExamKeysetPagination
 
     def get_serializer_class(self):
         if self.action in ("create", "update", "partial_update"):
@@ -290,34 +346,35 @@ class ExamViewSet(viewsets.ModelViewSet):
             return qs
 
         if user.role == "teacher":
-            my_classes = Student.objects.filter(
-                assigned_teacher=user.teacher
-            ).values_list("student_class", flat=True)
-            my_standards = {c.split("-")[0] for c in my_classes}
-
+            teacher = get_profile(self.request)
+            if teacher is None:
+                return Exam.objects.none()
+            my_standards = teacher.classes_taught()["standards"]
             return qs.filter(
-                Q(scope="class", assigned_teacher=user.teacher)
+                Q(scope="class", assigned_teacher_id=teacher.pk)
                 | Q(scope="school", target_standard__in=my_standards)
             )
 
         if user.role == "student":
-            stu = user.student
-            std = stu.student_class.split("-")[0]
-            cls = stu.student_class
-            return qs.filter(
-                Q(scope="school", target_standard=std)
-                | Q(scope="class", target_class=cls, assigned_teacher=stu.assigned_teacher)
-            )
+            return qs.filter(eligibility__student__user=user)
 
         return Exam.objects.none()
     
+    def list(self, request, *args, **kwargs):
+        """Conditional – a matching ``If-None-Match`` costs one aggregate query."""
+        etag, last_modified = queryset_validators(self.filter_queryset(self.get_queryset()), request)
+        return conditional(
+            request, etag, last_modified, lambda: super(ExamViewSet, self).list(request, *args, **kwargs)
+        )
+
     def _owns_exam(self, exam):
   
         u = self.request.user
         if u.role == "admin":
             return exam.scope == "school" and exam.created_by_id == u.id
         if u.role == "teacher":
-            return exam.scope == "class" and exam.assigned_teacher_id == getattr(u, "teacher", None).id
+            teacher_id = get_profile_id(self.request)
+            return teacher_id is not None and exam.scope == "class" and exam.assigned_teacher_id == teacher_id
         return False
 
     def perform_create(self, serializer):
@@ -336,42 +393,170 @@ class ExamViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"], url_path="questions")
     def questions(self, request, pk=None):
         exam = self.get_object() 
-        if (
-            request.user.role == "student"
-            and request.user.student not in exam.eligible_students()
-        ):
-            raise PermissionDenied("You are not allowed to view these questions.")
+        if request.user.role == "student":
+            student = get_profile(request)
+            if student is None or not exam.is_eligible(student):
+                raise PermissionDenied("You are not allowed to view these questions.")
+
+        def render_paper():
+            qs = exam.questions.all().order_by("id")
+            return JSONRenderer().render(QuestionPublicSerializer(qs, many=True).data)
+
+        def respond():
+            payload = cached(
+                question_paper_key(exam),
+                render_paper,
+                timeout=settings.QUESTION_PAPER_CACHE_TIMEOUT,
+            )
+            return HttpResponse(payload, content_type="application/json")
+
+        # the paper only changes with content_version, which exam already carries
+        etag = fingerprint("paper", exam.pk, exam.content_version)
+        return conditional(request, etag, exam.updated_at, respond)
 
-        qs = exam.questions.all().order_by("id")
-        return Response(QuestionPublicSerializer(qs, many=True).data)
+    @action(detail=True, methods=["get"], url_path="analytics")
+    def analytics(self, request, pk=None):
+        """
+        GET /api/exams/{id}/analytics?class=10-A&top=5&pass_mark=8
+        Score distribution, per‑class means, question difficulty and
+        top / bottom performers.  Teachers only see their own students.
+        """
+        exam = self.get_object()
+        subs = ExamSubmission.objects.filter(exam=exam)
+        if request.user.role == "teacher":
+            teacher_id = get_profile_id(request)
+            if not teacher_id:
+                return Response({"detail": "Teacher profile not found."}, status=404)
+            subs = subs.filter(student__assigned_teacher_id=teacher_id)
+        student_class = request.query_params.get("class")
+        if student_class:
+            subs = subs.filter(student__student_class=student_class)
+
+        try:
+            top = min(max(int(request.query_params.get("top", 5)), 0), 50)
+            pass_mark = request.query_params.get("pass_mark")
+            pass_mark = int(pass_mark) if pass_mark not in (None, "") else None
+        except ValueError:
+            raise serializers.ValidationError("top and pass_mark must be integers.")
+
+        return Response(exam_analytics(exam, subs, top=top, pass_mark=pass_mark))
+
+    @action(detail=True, methods=["get"], url_path="item-analysis")
+    def item_analysis(self, request, pk=None):
+        """
+        GET /api/exams/{id}/item-analysis
+        Difficulty, discrimination, point‑biserial and distractor analysis
+        per question plus KR‑20 reliability.  Teachers only see their own
+        students.
+        """
+        exam = self.get_object()
+        if request.user.role == "teacher":
+            teacher_id = get_profile_id(request)
+            if not teacher_id:
+                return Response({"detail": "Teacher profile not found."}, status=404)
+            subs = ExamSubmission.objects.filter(exam=exam, student__assigned_teacher_id=teacher_id)
+            return Response(exam_item_analysis(exam, subs, scope=f"teacher{teacher_id}"))
+        return Response(exam_item_analysis(exam))
+
+    @action(detail=True, methods=["get"], url_path="stats")
+    def stats(self, request, pk=None):
+        """
+        GET /api/exams/{id}/stats
+        Exam‑wide running totals read from ExamStats / QuestionStats – two
+        small queries regardless of how many submissions there are.
+        """
+        exam = self.get_object()
+        totals = ExamStats.objects.filter(exam=exam).first() or ExamStats(exam=exam)
+        questions = []
+        for question in exam.questions.select_related("stats").order_by("id"):
+            try:
+                counts = question.stats
+            except QuestionStats.DoesNotExist:
+                counts = QuestionStats(question=question)
+            correct = counts.correct_count(question.correct_option)
+            questions.append({
+                "question": question.id,
+                "text": question.text,
+                "attempts": counts.attempts,
+                "correct": correct,
+                "fraction_correct": round(correct / counts.attempts, 4) if counts.attempts else None,
+                "options": {n: getattr(counts, f) for n, f in enumerate(QuestionStats.OPTION_FIELDS, 1)},
+            })
+
+        mean, stddev = totals.mean, totals.stddev
+        return Response({
+            "exam": exam.id,
+            "submissions": totals.submissions,
+            "mean": round(mean, 2) if mean is not None else None,
+            "stddev": round(stddev, 2) if stddev is not None else None,
+            "updated_at": totals.updated_at,
+            "questions": questions,
+        })
 
 
 class ExamSubmissionViewSet(viewsets.ModelViewSet):
     serializer_class = ExamSubmissionSerializer
     permission_classes = [IsAuthenticated,IsStudent]
+    # A submission is scored once, on create – there is no update route.
+    http_method_names = ["get", "post", "delete", "head", "options"]
 
     def get_queryset(self):
-        return ExamSubmission.objects.filter(student__user=self.request.user)
+        return ExamSubmission.objects.filter(student_id=get_profile_id(self.request))
 
-    def perform_create(self, serializer):
-        try:
-            student = Student.objects.get(user=self.request.user)
-        except Student.DoesNotExist:
+    def _check_can_submit(self, student, exam):
+        if not exam.is_eligible(student):
+            raise PermissionDenied("You are not allowed to take this exam.")
+
+        if timezone.now() > exam.start_time + timedelta(minutes=exam.duration_minutes):
+            raise serializers.ValidationError("Exam time is over.")
+
+    def _student(self):
+        student = get_profile(self.request)
+        if student is None:
             raise PermissionDenied("Only students can submit exams")
+        return student
+
+    def perform_create(self, serializer):
+        student = self._student()
         exam = serializer.validated_data["exam"]
-        now = timezone.now()
 
         if ExamSubmission.objects.filter(exam=exam, student=student).exists():
             raise serializers.ValidationError("You have already submitted this exam.")
 
-        if student not in exam.eligible_students():
-            raise PermissionDenied("You are not allowed to take this exam.")
-
-        if now > exam.start_time + timedelta(minutes=exam.duration_minutes):
-            raise serializers.ValidationError("Exam time is over.")
-
+        self._check_can_submit(student, exam)
         serializer.save(student=student)
 
+    # --------------------------------------------------
+    # Write‑behind ingestion for the exam‑close rush
+    # --------------------------------------------------
+    @action(detail=False, methods=["post"], url_path="queue")
+    def queue(self, request):
+        """
+        Accept a submission with one INSERT and hand back a receipt; it is
+        scored by ``manage.py flush_submissions``.
+        """
+        ser = QueuedSubmissionSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        student = self._student()
+        self._check_can_submit(student, ser.validated_data["exam"])
+        try:
+            with transaction.atomic():
+                pending = ser.save(student=student)
+        except IntegrityError:
+            raise serializers.ValidationError("You have already submitted this exam.")
+        return Response(QueuedSubmissionSerializer(pending).data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=False, methods=["get"], url_path=r"receipts/(?P<receipt>[0-9a-f-]+)")
+    def receipt(self, request, receipt=None):
+        pending = (
+            PendingSubmission.objects.select_related("submission")
+            .filter(receipt=receipt, student__user=request.user)
+            .first()
+        )
+        if not pending:
+            return Response({"detail": "Receipt not found."}, status=404)
+        return Response(QueuedSubmissionSerializer(pending).data)
+
 class QuestionViewSet(viewsets.ModelViewSet):
     queryset = Question.objects.select_related("exam__created_by", "exam__assigned_teacher")
     permission_classes = [IsAuthenticated]
@@ -399,7 +584,8 @@ class QuestionViewSet(viewsets.ModelViewSet):
         if user.role == "admin":
             return exam.created_by_id == user.id
         if user.role == "teacher":
-            return exam.assigned_teacher_id == getattr(user, "teacher", None).id
+            teacher_id = get_profile_id(self.request)
+            return teacher_id is not None and exam.scope == "class" and exam.assigned_teacher_id == teacher_id
         return False
 
     # -------- CRUD guards
@@ -425,19 +611,59 @@ class QuestionViewSet(viewsets.ModelViewSet):
         if user.role == "teacher":
             return qs.filter(exam__assigned_teacher__user=user)
         if user.role == "student":
-            stu = user.student
-            std = stu.student_class.split("-")[0]
-            return qs.filter(
-                Q(exam__scope="school", exam__target_standard=std)
-                | Q(
-                    exam__scope="class",
-                    exam__target_class=stu.student_class,
-                    exam__assigned_teacher=stu.assigned_teacher,
-                )
-            )
+            return qs.filter(exam__eligibility__student__user=user)
         return qs
 
 
+# -----------------------------------------------------------------------------------
+#  BACKGROUND JOBS
+# -----------------------------------------------------------------------------------
+class JobViewSet(viewsets.ReadOnlyModelViewSet):
+    serializer_class = JobSerializer
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get_queryset(self):
+        return Job.objects.filter(created_by=self.request.user)
+
+    @action(detail=True, methods=["get"])
+    def download(self, request, pk=None):
+        job = self.get_object()
+        if job.status != "done" or not job.result_file:
+            return Response({"detail": "Result not available yet."}, status=409)
+        return FileResponse(
+            job.result_file.open("rb"),
+            as_attachment=True,
+            filename=job.result_file.name.rsplit("/", 1)[-1],
+        )
+
+
+# -----------------------------------------------------------------------------------
+#  PROFILING
+# -----------------------------------------------------------------------------------
+class ProfilingView(GenericAPIView):
+    """
+    GET /api/profiling?limit=50&path=/api/exams
+    Recent request profiles recorded by this worker process, newest first.
+    """
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get(self, request):
+        profiles = recent_profiles()
+        prefix = request.query_params.get("path")
+        if prefix:
+            profiles = [p for p in profiles if p["path"].startswith(prefix)]
+        try:
+            limit = int(request.query_params.get("limit", 50))
+        except ValueError:
+            limit = 50
+        options = profiling_settings()
+        return Response({
+            "enabled": options["ENABLED"],
+            "sample_rate": options["SAMPLE_RATE"],
+            "results": profiles[:max(limit, 0)],
+        })
+
+
 # -----------------------------------------------------------------------------------
 #  PASSWORD RESET
 # -----------------------------------------------------------------------------------
@@ -0,0 +1,67 @@
+"""
+DATABASES['default'] built from the environment.
+
+SQLite (``db.sqlite3``) stays the default for development.  Production
+sets ``DB_ENGINE=postgresql`` plus:
+
+    DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT   connection
+    DB_CONN_MAX_AGE      seconds a connection is kept between requests (60)
+    DB_HEALTH_CHECKS     ping a reused connection before handing it out (1)
+    DB_POOL              1 = psycopg connection pool instead of CONN_MAX_AGE
+    DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE / DB_POOL_TIMEOUT
+    DB_SSLMODE           passed through to libpq (e.g. ``require``)
+
+The pool needs ``psycopg[pool]``; Django refuses to combine it with
+persistent connections, so ``CONN_MAX_AGE`` is forced to 0 when it is on.
+"""
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+ENGINES = {
+    "sqlite": "django.db.backends.sqlite3",
+    "postgresql": "django.db.backends.postgresql",
+}
+
+
+def _flag(env, name, default):
+    return env.get(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+def database_settings(base_dir, env=None):
+    env = os.environ if env is None else env
+    engine = env.get("DB_ENGINE", "sqlite").strip().lower()
+    if engine in ("postgres", "psql"):
+        engine = "postgresql"
+    if engine not in ENGINES:
+        raise ImproperlyConfigured(
+            f"DB_ENGINE must be one of {', '.join(ENGINES)}, not {engine!r}."
+        )
+
+    if engine == "sqlite":
+        return {
+            "ENGINE": ENGINES["sqlite"],
+            "NAME": env.get("DB_NAME") or base_dir / "db.sqlite3",
+        }
+
+    config = {
+        "ENGINE": ENGINES["postgresql"],
+        "NAME": env.get("DB_NAME", "school"),
+        "USER": env.get("DB_USER", "school"),
+        "PASSWORD": env.get("DB_PASSWORD", ""),
+        "HOST": env.get("DB_HOST", "localhost"),
+        "PORT": env.get("DB_PORT", "5432"),
+        "CONN_MAX_AGE": int(env.get("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": _flag(env, "DB_HEALTH_CHECKS", "1"),
+        "OPTIONS": {},
+    }
+    if env.get("DB_SSLMODE"):
+        config["OPTIONS"]["sslmode"] = env["DB_SSLMODE"]
+    if _flag(env, "DB_POOL", "0"):
+        config["CONN_MAX_AGE"] = 0
+        config["OPTIONS"]["pool"] = {
+            "min_size": int(env.get("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(env.get("DB_POOL_MAX_SIZE", "10")),
+            "timeout": float(env.get("DB_POOL_TIMEOUT", "10")),
+        }
+    return config
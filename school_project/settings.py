@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from .db import database_settings
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -42,13 +45,23 @@ INSTALLED_APPS = [
 ]
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.ClaimsJWTAuthentication',
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 5
 }
 
+# Access tokens carry role / profile id / token version – see api/authentication.py
+SIMPLE_JWT = {
+    'TOKEN_OBTAIN_SERIALIZER': 'api.authentication.ClaimsTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'api.authentication.ClaimsTokenRefreshSerializer',
+}
+# How long a process may trust its cached token version; with a per-process
+# cache this is the longest a revoked token keeps working on other workers.
+TOKEN_VERSION_CACHE_TIMEOUT = 60
+
 MIDDLEWARE = [
+    'api.profiling.ProfilingMiddleware',          # first, so "total" covers the whole stack
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -68,6 +81,22 @@ EMAIL_HOST_USER = "muhammadshamnads92@gmail.com"
 EMAIL_HOST_PASSWORD = "zvsn iylg hrvg yyaj"      # ← app‑specific pwd / env var
 EMAIL_USE_TLS   = True
 
+# ── CSV import / export ──────────────────────────────────────────
+CSV_EXPORT_CHUNK_SIZE = 2000      # rows fetched per DB round trip while streaming
+CSV_IMPORT_BATCH_SIZE = 1000      # rows validated + bulk‑inserted per transaction
+PASSWORD_HASH_WORKERS = None      # processes used for bulk password hashing (None → all cores)
+
+# ── Exam submissions ─────────────────────────────────────────────
+SUBMISSION_FLUSH_BATCH_SIZE = 500 # queued submissions scored per transaction
+
+# ── Request profiling (Server-Timing header + GET /api/profiling) ──
+PROFILING = {
+    'ENABLED': os.environ.get('PROFILING_ENABLED', '') == '1',
+    'SAMPLE_RATE': float(os.environ.get('PROFILING_SAMPLE_RATE', '0.01')),
+    'SLOW_QUERIES': 5,            # slowest SQL statements kept per request
+    'LOG_SIZE': 200,              # recent profiles kept per process
+}
+
 DEFAULT_FROM_EMAIL = "School App <no‑reply@schoolapp.com>"
 FRONTEND_RESET_URL = "http://localhost:3000/reset-password"  # React route
 
@@ -92,13 +121,31 @@ WSGI_APPLICATION = 'school_project.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# SQLite unless DB_ENGINE=postgresql – see school_project/db.py for the
+# connection, persistent-connection and pool variables.
 
 DATABASES = {
+    'default': database_settings(BASE_DIR),
+}
+
+
+# Cache
+# Defaults to per‑process memory; point CACHE_BACKEND / CACHE_LOCATION at
+# django.core.cache.backends.redis.RedisCache (or FileBasedCache) to share
+# cached question papers between workers.
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'school-app'),
     }
 }
+QUESTION_PAPER_CACHE_TIMEOUT = 60 * 60
+
+# Background jobs (manage.py run_jobs): a running job whose worker has not
+# reported for JOB_LEASE_TIMEOUT seconds is requeued, up to JOB_MAX_ATTEMPTS.
+JOB_LEASE_TIMEOUT = 10 * 60
+JOB_MAX_ATTEMPTS = 3
 
 
 # Password validation
@@ -137,6 +184,10 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded CSVs and generated job artifacts
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 